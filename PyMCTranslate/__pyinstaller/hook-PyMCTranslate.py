@@ -3,5 +3,12 @@ from PyInstaller.utils.hooks import collect_submodules, collect_data_files
 
 hiddenimports = collect_submodules("PyMCTranslate")
 datas = collect_data_files(
-    "PyMCTranslate", includes=["build_number.json", "min_json/**/*.json.gz"]
+    "PyMCTranslate",
+    includes=[
+        "build_number.json",
+        "code_functions_manifest.json",
+        "min_json/**/*.json.gz",
+        "min_json/atlas.bin",
+        "translation_tables/*.json.gz",
+    ],
 )
@@ -1,3 +1,9 @@
+# the result only depends on the inputs
+pure = True
+# the parts of the nbt that main reads
+nbt_paths = (("Patterns",),)
+
+
 def main(nbt):
     if (
         nbt[0] == "compound"
@@ -1,6 +1,12 @@
 from PyMCTranslate.py3.util.raw_text import raw_text_to_section_string
 
 
+# the result only depends on the inputs
+pure = True
+# the parts of the nbt that main reads
+nbt_paths = (("utags", "CustomName"),)
+
+
 def main(nbt):
     text = ""
 
@@ -1,6 +1,12 @@
 from PyMCTranslate.py3.util.raw_text import section_string_to_raw_text_list
 
 
+# the result only depends on the inputs
+pure = True
+# the parts of the nbt that main reads
+nbt_paths = (("FrontText", "Text"), ("BackText", "Text"))
+
+
 def main(nbt):
     out = []
 
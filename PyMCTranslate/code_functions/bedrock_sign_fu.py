@@ -13,6 +13,12 @@ def pack_text(messages):
     return raw_text_list_to_section_string(lines)
 
 
+# the result only depends on the inputs
+pure = True
+# the parts of the nbt that main reads
+nbt_paths = (("utags", "front_text", "messages"),)
+
+
 def main(nbt):
     front_text = ""
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import operator
+
 try:
     from amulet.api.block import Block, PropertyValueType, PropertyType
     from amulet.api.block_entity import BlockEntity
@@ -18,6 +20,14 @@ except ModuleNotFoundError:
         ChunkLoadError,
     )
 
+# BlockPool works with any hashable Block class
+from PyMCTranslate.py3.api.amulet_objects.block import BlockPool
+
+# Read the block properties without copying them. Older versions of amulet-core's Block do not have properties_view.
+get_properties_view = operator.attrgetter(
+    "properties_view" if hasattr(Block, "properties_view") else "properties"
+)
+
 from .translation_manager import TranslationManager
 from .version import (
     Version,
@@ -1,4 +1,4 @@
-from .block import Block, PropertyValueType, PropertyType
+from .block import Block, PropertyValueType, PropertyType, BlockPool
 from .block_entity import BlockEntity
 from .entity import Entity
 from .item import Item, BlockItem
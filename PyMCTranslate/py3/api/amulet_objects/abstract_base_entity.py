@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
+import copy
 from typing import Union, Optional, Tuple
 from amulet_nbt import NamedTag, CompoundTag
 
@@ -44,6 +45,13 @@ class AbstractBaseEntity(ABC):
         else:
             raise Exception(f"nbt must be an NamedTag. Got {nbt}")
 
+    def copy(self):
+        """
+        Create a deep copy of this object.
+        Use this to get a modifiable copy of a shared translation output.
+        """
+        return copy.deepcopy(self)
+
     def _gen_namespaced_name(self):
         self._namespaced_name = f'{self.namespace or ""}:{self.base_name}'
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from sys import getsizeof
+from sys import getsizeof, intern
 import re
-from typing import Dict, Iterable, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, Iterable, Tuple, Union, Mapping, Optional
 from amulet_nbt import ByteTag, ShortTag, IntTag, LongTag, StringTag, from_snbt
 
 from .errors import BlockException
@@ -74,10 +75,12 @@ class Block:
         "_namespace",
         "_base_name",
         "_properties",
+        "_properties_view",
         "_extra_blocks",
         "_blockstate",
         "_snbt_blockstate",
         "_full_blockstate",
+        "_hash",
     )  # Reduces memory footprint
 
     snbt_blockstate_regex = re.compile(
@@ -126,11 +129,13 @@ class Block:
         ), f"namespace and base_name must be strings {namespace} {base_name}"
         self._namespace = namespace
         self._base_name = base_name
-        self._namespaced_name = f"{namespace}:{base_name}"
+        # interned so that equal names compare by identity
+        self._namespaced_name = intern(f"{namespace}:{base_name}")
 
         self._blockstate = None
         self._snbt_blockstate = None
         self._full_blockstate = None
+        self._hash = None
 
         if properties is None:
             properties = {}
@@ -139,6 +144,7 @@ class Block:
         ), properties
 
         self._properties = properties
+        self._properties_view = MappingProxyType(properties)
         self._extra_blocks = ()
         if extra_blocks:
             eb = []
@@ -154,7 +160,7 @@ class Block:
             self._extra_blocks = tuple(eb)
 
     @classmethod
-    def from_string_blockstate(cls, blockstate: str):
+    def from_string_blockstate(cls, blockstate: str, pool: Optional[BlockPool] = None):
         """
         Parse a Java format blockstate where values are all strings and populate a :class:`Block` class with the data.
 
@@ -162,20 +168,48 @@ class Block:
         >>> water = Block.from_string_blockstate("minecraft:water[level=0]")
 
         :param blockstate: The Java blockstate string to parse.
+        :param pool: An optional :class:`BlockPool` to get the canonical instance from.
         :return: A Block instance containing the state.
         """
         namespace, block_name, properties = cls.parse_blockstate_string(blockstate)
-        return cls(namespace, block_name, properties)
+        block = cls(namespace, block_name, properties)
+        if pool is not None:
+            block = pool.intern(block)
+        return block
 
     @classmethod
-    def from_snbt_blockstate(cls, blockstate: str):
+    def from_snbt_blockstate(cls, blockstate: str, pool: Optional[BlockPool] = None):
         """
         Parse a blockstate where values are SNBT of any type and populate a :class:`Block` class with the data.
+
+        :param blockstate: The SNBT blockstate string to parse.
+        :param pool: An optional :class:`BlockPool` to get the canonical instance from.
+        :return: A Block instance containing the state.
         """
         namespace, block_name, properties = cls.parse_blockstate_string(
             blockstate, True
         )
-        return cls(namespace, block_name, properties)
+        block = cls(namespace, block_name, properties)
+        if pool is not None:
+            block = pool.intern(block)
+        return block
+
+    def intern(self, pool: BlockPool) -> Block:
+        """
+        Get the canonical instance of this block state.
+
+        Equal blocks interned in the same pool are the same instance so they can share memory and compare by identity.
+        The pool keeps the blocks alive so the caller decides how long it lives.
+
+        >>> pool = BlockPool()
+        >>> stone = Block("minecraft", "stone").intern(pool)
+        >>> stone is Block("minecraft", "stone").intern(pool)
+        True
+
+        :param pool: The :class:`BlockPool` to use.
+        :return: The canonical Block instance. This may be this instance.
+        """
+        return pool.intern(self)
 
     @property
     def namespaced_name(self) -> str:
@@ -229,6 +263,21 @@ class Block:
         """
         return dict(self._properties)
 
+    @property
+    def properties_view(self) -> Mapping[str, PropertyValueType]:
+        """
+        A read only view of the properties of the blockstate.
+
+        Unlike :attr:`properties` this does not copy the properties so it is faster when they only need to be read.
+
+        >>> water = Block.from_string_blockstate("minecraft:water[level=0]")
+        >>> water.properties_view["level"]
+        StringTag("0")
+
+        :return: A read only mapping of the properties of the blockstate
+        """
+        return self._properties_view
+
     @property
     def blockstate(self) -> str:
         """
@@ -474,13 +523,17 @@ class Block:
         :param other: The Block object to check against
         :return: True if the Blocks objects are equal, False otherwise
         """
+        if self is other:
+            return True
         if not isinstance(other, Block):
             return NotImplemented
+        if hash(self) != hash(other):
+            return False
 
         return (
-            self.namespaced_name == other.namespaced_name
-            and self.properties == other.properties
-            and self.extra_blocks == other.extra_blocks
+            self._namespaced_name == other._namespaced_name
+            and self._properties == other._properties
+            and self._extra_blocks == other._extra_blocks
         )
 
     def __gt__(self, other: Block) -> bool:
@@ -495,9 +548,19 @@ class Block:
         """
         Hashes the Block object
 
+        The hash is computed from the name, properties and extra blocks the first time it is requested.
+
         :return: A hash of the Block object
         """
-        return hash(self.full_blockstate)
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self._namespaced_name,
+                    frozenset(self._properties.items()),
+                    self._extra_blocks,
+                )
+            )
+        return self._hash
 
     def __add__(self, other: Block) -> Block:
         """
@@ -588,6 +651,13 @@ class Block:
                 ],
             )
 
+    def __getstate__(self):
+        # The properties view cannot be pickled and the cached hash is only valid in this process.
+        return self._namespace, self._base_name, self._properties, self._extra_blocks
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
     def __sizeof__(self):
         size = (
             getsizeof(self._namespace)
@@ -608,3 +678,35 @@ class Block:
 UniversalAirBlock = Block("universal_minecraft", "air")
 # do not rely on this staying the same.
 UniversalAirLikeBlocks = (UniversalAirBlock, Block("universal_minecraft", "cave_air"))
+
+
+class BlockPool:
+    """
+    A pool of canonical :class:`Block` instances.
+
+    Interning equal blocks in a pool returns the same instance so that duplicate blocks can be garbage collected.
+    The pool keeps every block added to it alive until :meth:`clear` is called.
+    """
+
+    def __init__(self):
+        self._blocks: Dict[Block, Block] = {}
+
+    def intern(self, block: Block) -> Block:
+        """
+        Get the canonical instance of a block.
+        If an equal block is not in the pool the given block is added and returned.
+
+        :param block: The block to find.
+        :return: The canonical Block instance.
+        """
+        return self._blocks.setdefault(block, block)
+
+    def __contains__(self, block: Block) -> bool:
+        return block in self._blocks
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def clear(self):
+        """Remove all blocks from the pool."""
+        self._blocks.clear()
@@ -5,7 +5,7 @@ import numpy
 
 from amulet_nbt import TAG_String
 
-from PyMCTranslate.py3.api import Block, PropertyValueType
+from PyMCTranslate.py3.api import Block, PropertyValueType, get_properties_view
 
 # This is the dictionary stored under the properties key in the specification files
 from PyMCTranslate.py3.api.version.translators.block import BlockSpecification
@@ -54,7 +54,7 @@ class BaseAxisStateShape(BaseBlockShape):
     ):
         if not mode:
             return block
-        old_properties = block.properties
+        old_properties = get_properties_view(block)
         properties = block.properties
         properties.update(dict.fromkeys(self.Vectors.keys(), self.Values[0]))
 
@@ -68,8 +68,9 @@ class BaseAxisStateShape(BaseBlockShape):
 
     def _block_to_vector(self, block: Block) -> Optional[Tuple[float, float, float]]:
         """Convert the block state to a vector representing the rotation"""
+        properties = get_properties_view(block)
         vector = self.Vectors.get(
-            tuple(block.properties.get(prop, None) for prop in self.Properties), None
+            tuple(properties.get(prop, None) for prop in self.Properties), None
         )
         if isinstance(vector, list):
             return vector[0]
@@ -5,7 +5,7 @@ from enum import IntEnum
 import numpy
 
 from PyMCTranslate.py3.api.version import Version
-from PyMCTranslate.py3.api import Block, PropertyValueType
+from PyMCTranslate.py3.api import Block, PropertyValueType, get_properties_view
 
 
 # This is the dictionary stored under the properties key in the specification files
@@ -116,8 +116,9 @@ class BaseVectorBlockShape(BaseBlockShape):
 
     def _block_to_vector(self, block: Block) -> Optional[Tuple[float, float, float]]:
         """Convert the block state to a vector representing the rotation"""
+        properties = get_properties_view(block)
         vector = self.Vectors.get(
-            tuple(block.properties.get(prop, None) for prop in self.Properties), None
+            tuple(properties.get(prop, None) for prop in self.Properties), None
         )
         if isinstance(vector, list):
             return vector[0]
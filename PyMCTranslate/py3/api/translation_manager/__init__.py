@@ -1 +1,3 @@
 from .translation_manager import TranslationManager
+from .converter import VersionConverter, ChunkTranslation
+from .engine import TranslationEngine
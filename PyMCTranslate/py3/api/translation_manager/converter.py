@@ -0,0 +1,508 @@
+from typing import (
+    Tuple,
+    Optional,
+    Callable,
+    Union,
+    Sequence,
+    List,
+    Dict,
+    Iterable,
+    NamedTuple,
+    TYPE_CHECKING,
+)
+import copy
+
+import numpy
+
+from PyMCTranslate.py3.api import Block, BlockEntity, Entity
+from PyMCTranslate.py3.api.version.translators import BlockTranslator
+from PyMCTranslate.py3.api.version.translators.cache import TranslationCache
+from PyMCTranslate.py3.api.version.translators.block import TranslatedBlock
+from PyMCTranslate.py3.api.version.translators.neighbourhood import BlockNeighbourhood
+
+if TYPE_CHECKING:
+    from PyMCTranslate.py3.api.version import Version
+    from .translation_manager import TranslationManager
+
+BlockCoordinates = Tuple[int, int, int]
+# biome ids at or above this are not stored in the biome id table so that sparse ids do not create a huge table
+_biome_id_table_size = 1 << 16
+GetBlockCallback = Callable[[BlockCoordinates], Tuple[Block, Optional[BlockEntity]]]
+
+
+class ChunkTranslation(NamedTuple):
+    # an array of indexes into palette with the same shape as the input array
+    array: numpy.ndarray
+    # the blocks in the destination version
+    palette: List[Block]
+    # the block entities in the destination version keyed by their location in the world
+    block_entities: Dict[BlockCoordinates, BlockEntity]
+    # the entities that blocks were translated to. The block at their location is set to air.
+    entities: List[Entity]
+
+
+class VersionConverter:
+    """
+    Translate data directly from one version to another.
+
+    The translation still goes through the universal format but the combined result for each block is cached.
+    Translating a block that has already been seen only needs a single lookup.
+
+    .. important::
+           This class should not be directly initiated. Use ``TranslationManager.get_converter`` to get an instance.
+    """
+
+    def __init__(
+        self,
+        translation_manager: "TranslationManager",
+        source: "Version",
+        destination: "Version",
+        source_force_blockstate: bool = False,
+        destination_force_blockstate: bool = False,
+    ):
+        self._translation_manager = translation_manager
+        self._source = source
+        self._destination = destination
+        self._source_force_blockstate = source_force_blockstate
+        self._destination_force_blockstate = destination_force_blockstate
+        # the combined translation of source blocks that do not depend on block entity data or the surrounding blocks
+        self._block_cache = TranslationCache(translation_manager.cache_size)
+        # the combined translation of biome names and ids. The ids are cleared when the biome registry changes.
+        self._biome_cache = TranslationCache(translation_manager.cache_size)
+        self._biome_id_cache = TranslationCache(translation_manager.cache_size)
+        self._biome_registry_revision = translation_manager.biome_registry.revision
+        # source numerical biome id to destination numerical biome id. Cleared when the biome registry changes.
+        self._biome_id_table: Optional[numpy.ndarray] = None
+        # source state id to destination state id. Created when first requested.
+        self._state_id_table: Optional[numpy.ndarray] = None
+        # the destination version's air block. Created when first requested.
+        self._air: Optional[Block] = None
+
+    def __repr__(self):
+        return f"PyMCTranslate.VersionConverter({self._source}, {self._destination})"
+
+    @property
+    def source(self) -> "Version":
+        """The version that data is translated from."""
+        return self._source
+
+    @property
+    def destination(self) -> "Version":
+        """The version that data is translated to."""
+        return self._destination
+
+    @property
+    def block_cache(self) -> TranslationCache:
+        """The cache of combined block translations."""
+        return self._block_cache
+
+    def set_cache_size(self, max_size: Optional[int]):
+        """
+        Set the maximum number of entries in each of the caches.
+
+        :param max_size: The maximum number of entries. None for unlimited.
+        """
+        for cache in (self._block_cache, self._biome_cache, self._biome_id_cache):
+            cache.max_size = max_size
+
+    def clear_cache(self):
+        """Remove all the cached translations."""
+        for cache in (self._block_cache, self._biome_cache, self._biome_id_cache):
+            cache.clear()
+        self._biome_id_table = None
+
+    def convert_block(
+        self,
+        block: "Block",
+        block_entity: "BlockEntity" = None,
+        block_location: BlockCoordinates = (0, 0, 0),
+        get_block_callback: GetBlockCallback = None,
+        shared: bool = False,
+    ) -> TranslatedBlock:
+        """
+        Translate a Block and optional BlockEntity from the source version to the destination version.
+
+        :param block: The block to translate
+        :param block_entity: An optional block entity related to the block input
+        :param block_location: The location of the block in the world
+        :param get_block_callback: A callable with relative coordinates that returns a Block and optional BlockEntity from the source version
+        :param shared: If True a cached BlockEntity or Entity output is returned without being copied. See :meth:`BlockTranslator.from_universal`
+        :return: There are two formats that can be returned. The first is a Block, optional BlockEntity and a bool. The second is an Entity, None and a bool. The bool specifies if block_location and get_block_callback are required to fully define the output data.
+        """
+        output, extra_output, extra_needed, cacheable = self._convert_block(
+            block, block_entity, block_location, get_block_callback
+        )
+        if cacheable and not shared:
+            # the cached version must not be modified by the caller
+            if isinstance(output, Entity):
+                output = copy.deepcopy(output)
+            extra_output = copy.deepcopy(extra_output)
+        return output, extra_output, extra_needed
+
+    def _convert_block(
+        self,
+        block: "Block",
+        block_entity: Optional["BlockEntity"],
+        block_location: BlockCoordinates,
+        get_block_callback: Optional[GetBlockCallback],
+    ) -> Tuple[Union[Block, Entity], Optional[BlockEntity], bool, bool]:
+        """
+        Translate a block from the source version to the destination version.
+        If the final bool is True the output is shared with the cache and must not be modified.
+
+        :return: The output Block and optional BlockEntity or Entity and None, extra_needed and cacheable.
+        """
+        if block_entity is None:
+            cached = self._block_cache.get(block)
+            if cached is not None:
+                return (*cached, True)
+
+        (
+            universal_block,
+            universal_block_entity,
+            source_extra_needed,
+            source_cacheable,
+        ) = self._source.block._to_universal(
+            block,
+            block_entity,
+            self._source_force_blockstate,
+            block_location,
+            get_block_callback,
+        )
+        if not isinstance(universal_block, Block):
+            return (
+                universal_block,
+                universal_block_entity,
+                source_extra_needed,
+                source_cacheable,
+            )
+
+        if get_block_callback is None:
+            universal_callback = None
+        else:
+
+            def universal_callback(
+                location: BlockCoordinates,
+            ) -> Tuple[Block, Optional[BlockEntity]]:
+                return self._source.block.to_universal(
+                    *get_block_callback(location),
+                    self._source_force_blockstate,
+                    block_location=(
+                        block_location[0] + location[0],
+                        block_location[1] + location[1],
+                        block_location[2] + location[2],
+                    ),
+                )[:2]
+
+        (
+            output,
+            extra_output,
+            destination_extra_needed,
+            destination_cacheable,
+        ) = self._destination.block._from_universal(
+            universal_block,
+            universal_block_entity,
+            self._destination_force_blockstate,
+            block_location,
+            universal_callback,
+        )
+        extra_needed = source_extra_needed or destination_extra_needed
+        cacheable = source_cacheable and destination_cacheable
+
+        if cacheable and block_entity is None:
+            self._block_cache[block] = output, extra_output, extra_needed
+
+        return output, extra_output, extra_needed, cacheable
+
+    def convert_block_palette(
+        self,
+        blocks: Sequence["Block"],
+        block_entities: Optional[Sequence[Optional["BlockEntity"]]] = None,
+        shared: bool = False,
+    ) -> Tuple[List[TranslatedBlock], numpy.ndarray]:
+        """
+        Translate a palette of Block objects from the source version to the destination version.
+
+        Each unique block is only translated once.
+        Blocks with a block entity are translated individually.
+
+        :param blocks: The sequence of blocks to translate
+        :param block_entities: An optional sequence of the same length as blocks containing a BlockEntity or None for each block
+        :param shared: If True cached BlockEntity and Entity outputs are not copied. See :meth:`convert_block`
+        :return: A list of outputs as returned by :meth:`convert_block` and an int32 array mapping each index in blocks to an index in that list.
+        """
+        return BlockTranslator._translate_palette(
+            lambda block, block_entity, _, shared: self.convert_block(
+                block, block_entity, shared=shared
+            ),
+            blocks,
+            block_entities,
+            False,
+            shared,
+        )
+
+    def convert_neighbourhood(
+        self,
+        neighbourhood: BlockNeighbourhood,
+        locations: Optional[Iterable[BlockCoordinates]] = None,
+        shared: bool = False,
+    ) -> Dict[BlockCoordinates, TranslatedBlock]:
+        """
+        Translate blocks in a region from the source version to the destination version.
+        The surrounding blocks and block entities are found in the neighbourhood so get_block_callback is not needed.
+
+        :param neighbourhood: The source blocks and block entities in the region.
+        :param locations: The locations in the world to translate. Defaults to every location not in the padding.
+        :param shared: If True cached BlockEntity and Entity outputs are not copied. See :meth:`convert_block`
+        :return: A dictionary mapping each location to the output of :meth:`convert_block`
+        """
+        return BlockTranslator._translate_neighbourhood(
+            lambda block, block_entity, _, location, callback, shared: self.convert_block(
+                block, block_entity, location, callback, shared
+            ),
+            neighbourhood,
+            locations,
+            False,
+            shared,
+        )
+
+    def translate_chunk(
+        self,
+        block_array: numpy.ndarray,
+        palette: Sequence[Block],
+        block_entities: Optional[Dict[BlockCoordinates, BlockEntity]] = None,
+        origin: BlockCoordinates = (0, 0, 0),
+        neighbours: Optional[BlockNeighbourhood] = None,
+    ) -> ChunkTranslation:
+        """
+        Translate a chunk or sub-chunk from the source version to the destination version.
+
+        Each block in the palette is first translated on its own and the results are applied to the whole array at once.
+        Only the locations with a block entity or where the result needed more data are then translated again with their neighbours.
+
+        >>> translation = converter.translate_chunk(array, palette, block_entities, origin=(cx * 16, 0, cz * 16))
+
+        :param block_array: A 3D integer array of indexes into palette in x, y, z order.
+        :param palette: The blocks in the source version.
+        :param block_entities: The block entities in the source version keyed by their location in the world.
+        :param origin: The location in the world of block_array[0, 0, 0].
+        :param neighbours: The region used to find the surrounding blocks. Defaults to the chunk itself in which case blocks outside the chunk are not found.
+        :return: A ChunkTranslation containing the new array, palette, block entities and entities.
+        """
+        block_array = numpy.asarray(block_array)
+        block_entities = block_entities or {}
+        if neighbours is None:
+            neighbours = BlockNeighbourhood(
+                palette, block_array, block_entities, origin
+            )
+
+        output_palette: List[Block] = []
+        output_lut: Dict[Block, int] = {}
+
+        def get_index(block: Block) -> int:
+            index = output_lut.get(block)
+            if index is None:
+                index = output_lut[block] = len(output_palette)
+                output_palette.append(block)
+            return index
+
+        # translate each block in the palette on its own
+        remap = numpy.zeros(len(palette), dtype=numpy.uint32)
+        needs_location = numpy.zeros(len(palette), dtype=bool)
+        for palette_index, block in enumerate(palette):
+            output, extra_output, extra_needed, _ = self._convert_block(
+                block, None, (0, 0, 0), None
+            )
+            if isinstance(output, Block) and extra_output is None and not extra_needed:
+                remap[palette_index] = get_index(output)
+            else:
+                needs_location[palette_index] = True
+        output_array = remap[block_array]
+
+        # translate the blocks that need more than the block state at their location
+        ox, oy, oz = origin
+        flagged = needs_location[block_array]
+        for x, y, z in block_entities:
+            index = (x - ox, y - oy, z - oz)
+            if all(0 <= i < size for i, size in zip(index, block_array.shape)):
+                flagged[index] = True
+
+        output_block_entities: Dict[BlockCoordinates, BlockEntity] = {}
+        entities: List[Entity] = []
+        for index in zip(*numpy.nonzero(flagged)):
+            x, y, z = location = (
+                ox + int(index[0]),
+                oy + int(index[1]),
+                oz + int(index[2]),
+            )
+            output, extra_output, _ = self.convert_block(
+                palette[int(block_array[index])],
+                block_entities.get(location),
+                location,
+                neighbours.get_block_callback(location),
+                shared=True,
+            )
+            if isinstance(output, Entity):
+                entity = copy.deepcopy(output)
+                entity.location = (float(x), float(y), float(z))
+                entities.append(entity)
+                output_array[index] = get_index(self._get_air())
+            else:
+                output_array[index] = get_index(output)
+                if extra_output is not None:
+                    output_block_entities[location] = extra_output.new_at_location(
+                        x, y, z
+                    )
+
+        return ChunkTranslation(
+            output_array, output_palette, output_block_entities, entities
+        )
+
+    def _get_air(self) -> Block:
+        """Get the air block in the destination version."""
+        if self._air is None:
+            self._air = self._destination.block.from_universal(
+                Block("universal_minecraft", "air"),
+                force_blockstate=self._destination_force_blockstate,
+            )[0]
+        return self._air
+
+    def state_id_table(self) -> numpy.ndarray:
+        """
+        Get an array mapping every block state id in the source version to a block state id in the destination version.
+        See :meth:`BlockTranslator.block_to_state_id`
+
+        Blocks that translate to a block entity or entity or depend on anything other than the block state map to -1.
+        These must be translated with :meth:`convert_block`.
+
+        >>> table = converter.state_id_table()
+        >>> destination_ids = table[source_ids]
+
+        :return: An int32 array. The table is computed the first time it is requested and shared so it must not be modified.
+        """
+        if self._state_id_table is None:
+            source_ids = self._source.block.state_ids(self._source_force_blockstate)
+            destination_ids = self._destination.block.state_ids(
+                self._destination_force_blockstate
+            )
+            table = numpy.full(len(source_ids), -1, dtype=numpy.int32)
+            for source_id in range(len(source_ids)):
+                output, extra_output, extra_needed, cacheable = self._convert_block(
+                    source_ids.state_id_to_block(source_id), None, (0, 0, 0), None
+                )
+                if (
+                    cacheable
+                    and not extra_needed
+                    and extra_output is None
+                    and isinstance(output, Block)
+                ):
+                    destination_id = destination_ids.block_to_state_id(output)
+                    if destination_id is not None:
+                        table[source_id] = destination_id
+            table.flags.writeable = False
+            self._state_id_table = table
+        return self._state_id_table
+
+    def convert_entity(
+        self, entity: "Entity"
+    ) -> Union[Tuple[Block, Optional[BlockEntity]], Tuple[Entity, None]]:
+        """
+        Translate an Entity from the source version to the destination version.
+
+        :param entity: The entity to translate
+        :return: There are two formats that can be returned. The first is a Block and an optional BlockEntity. The second is an Entity and None.
+        """
+        universal_entity = self._source.entity.to_universal(
+            entity, self._source_force_blockstate
+        )
+        if not isinstance(universal_entity, Entity):
+            return universal_entity, None
+        return self._destination.entity.from_universal(
+            universal_entity, self._destination_force_blockstate
+        )
+
+    def _check_biome_registry(self):
+        revision = self._translation_manager.biome_registry.revision
+        if revision != self._biome_registry_revision:
+            self._biome_id_cache.clear()
+            self._biome_id_table = None
+            self._biome_registry_revision = revision
+
+    def convert_biome(self, biome: str) -> str:
+        """
+        Translate a namespaced biome string from the source version to the destination version.
+
+        :param biome: The biome string in the source version.
+        :return: The biome string in the destination version.
+        """
+        converted = self._biome_cache.get(biome)
+        if converted is None:
+            converted = self._biome_cache[biome] = (
+                self._destination.biome.from_universal(
+                    self._source.biome.to_universal(biome)
+                )
+            )
+        return converted
+
+    def convert_biome_id(self, biome: int) -> int:
+        """
+        Translate a numerical biome id from the source version to the destination version.
+
+        :param biome: The numerical biome id in the source version.
+        :return: The numerical biome id in the destination version.
+        """
+        if isinstance(biome, numpy.integer):
+            biome = int(biome)
+        self._check_biome_registry()
+        converted = self._biome_id_cache.get(biome)
+        if converted is None:
+            converted = self._biome_id_cache[biome] = self._destination.biome.pack(
+                self.convert_biome(self._source.biome.unpack(biome))
+            )
+        return converted
+
+    def biome_id_table(self) -> numpy.ndarray:
+        """
+        Get an array mapping numerical biome ids in the source version to numerical biome ids in the destination version.
+        This includes the vanilla biomes and the biomes registered in the biome registry that are less than 65536.
+        Ids that are not known map to -1. Larger ids are not in the table and must be converted with :meth:`convert_biome_id`.
+
+        >>> destination_biomes = converter.biome_id_table()[source_biomes]
+
+        :return: An int32 array. The table is shared and must not be modified.
+        """
+        self._check_biome_registry()
+        if self._biome_id_table is None:
+            source_biome = self._source.biome
+            biome_ids = set(source_biome._biome_int_to_str)
+            biome_ids.update(dict(self._translation_manager.biome_registry))
+            biome_ids = [
+                biome_id
+                for biome_id in biome_ids
+                if 0 <= biome_id < _biome_id_table_size
+            ]
+            table = numpy.full(max(biome_ids, default=-1) + 1, -1, dtype=numpy.int32)
+            for biome_id in biome_ids:
+                table[biome_id] = self.convert_biome_id(biome_id)
+            table.flags.writeable = False
+            self._biome_id_table = table
+        return self._biome_id_table
+
+    def convert_biome_ids(self, biomes: numpy.ndarray) -> numpy.ndarray:
+        """
+        Translate an array of numerical biome ids from the source version to the destination version.
+        Known ids are converted with :meth:`biome_id_table`. Others fall back to :meth:`convert_biome_id`.
+
+        :param biomes: An integer array of biome ids in the source version.
+        :return: An int32 array of the same shape containing the biome ids in the destination version.
+        """
+        biomes = numpy.asarray(biomes)
+        table = self.biome_id_table()
+        in_range = (biomes >= 0) & (biomes < len(table))
+        converted = numpy.full(biomes.shape, -1, dtype=numpy.int32)
+        converted[in_range] = table[biomes[in_range]]
+        unknown = ~in_range | (converted == -1)
+        if unknown.any():
+            for biome in numpy.unique(biomes[unknown]).tolist():
+                converted[unknown & (biomes == biome)] = self.convert_biome_id(biome)
+        return converted
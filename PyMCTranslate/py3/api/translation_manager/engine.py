@@ -0,0 +1,258 @@
+"""
+Translate block palettes and chunks in a pool of worker processes.
+
+Each worker process has its own TranslationManager which is created once when the worker starts.
+Blocks and block entities are sent between processes as SNBT strings and results are returned as a palette and a numpy array.
+"""
+
+from typing import (
+    Tuple,
+    List,
+    Optional,
+    Sequence,
+    Iterable,
+    Dict,
+    TYPE_CHECKING,
+)
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy
+
+from PyMCTranslate.py3.api import Block, BlockEntity
+from PyMCTranslate.py3.api.version.translators.block import TranslatedBlock
+from PyMCTranslate.py3.api.version.translators.serialise import (
+    pack_block,
+    unpack_block,
+    pack_entity,
+    unpack_block_entity,
+    pack_translation,
+    unpack_translation,
+)
+
+if TYPE_CHECKING:
+    from PyMCTranslate.py3.api.version import Version
+    from .translation_manager import TranslationManager
+
+VersionKey = Tuple[str, Tuple[int, int, int], bool]
+PackedPalette = Tuple[List[list], Optional[List[Optional[list]]]]
+
+# The TranslationManager in the worker process
+_worker_translation_manager: Optional["TranslationManager"] = None
+
+
+def _init_worker(
+    json_path: str,
+    block_registry: Dict[int, str],
+    biome_registry: Dict[int, str],
+    cache_size: Optional[int],
+):
+    global _worker_translation_manager
+    from .translation_manager import TranslationManager
+
+    translation_manager = TranslationManager(json_path)
+    for value, key in block_registry.items():
+        translation_manager.block_registry.register(key, value)
+    for value, key in biome_registry.items():
+        translation_manager.biome_registry.register(key, value)
+    translation_manager.cache_size = cache_size
+    _worker_translation_manager = translation_manager
+
+
+def _convert_palette(
+    source: VersionKey,
+    destination: VersionKey,
+    palette: PackedPalette,
+) -> Tuple[List[list], numpy.ndarray]:
+    translation_manager = _worker_translation_manager
+    converter = translation_manager.get_converter(
+        translation_manager.get_version(*source[:2]),
+        translation_manager.get_version(*destination[:2]),
+        source[2],
+        destination[2],
+    )
+    packed_blocks, packed_block_entities = palette
+    blocks = [unpack_block(block) for block in packed_blocks]
+    if packed_block_entities is None:
+        block_entities = None
+    else:
+        block_entities = [
+            unpack_block_entity(block_entity) for block_entity in packed_block_entities
+        ]
+    output_palette, remap = converter.convert_block_palette(
+        blocks, block_entities, shared=True
+    )
+    return [pack_translation(output) for output in output_palette], remap
+
+
+def _convert_chunk(
+    source: VersionKey,
+    destination: VersionKey,
+    palette: PackedPalette,
+    array: numpy.ndarray,
+) -> Tuple[List[list], numpy.ndarray]:
+    output_palette, remap = _convert_palette(source, destination, palette)
+    return output_palette, remap[array]
+
+
+class TranslationEngine:
+    """
+    Translate block palettes and chunks from one version to another using a pool of processes.
+
+    The block and biome registries of the TranslationManager are copied to the worker processes.
+    If the registries are modified the worker processes are restarted when the next job is submitted.
+
+    >>> with TranslationEngine(translation_manager) as engine:
+    >>>     for palette, array in engine.convert_chunks(source, destination, chunks):
+    >>>         ...
+    """
+
+    def __init__(
+        self,
+        translation_manager: "TranslationManager",
+        processes: Optional[int] = None,
+    ):
+        """
+        :param translation_manager: The TranslationManager to copy the configuration from.
+        :param processes: The number of worker processes. Defaults to the number of CPUs.
+        """
+        self._translation_manager = translation_manager
+        self._processes = processes or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._registry_revisions: Optional[Tuple[int, int]] = None
+
+    def __enter__(self) -> "TranslationEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        translation_manager = self._translation_manager
+        registry_revisions = (
+            translation_manager.block_registry.revision,
+            translation_manager.biome_registry.revision,
+        )
+        if (
+            self._executor is not None
+            and registry_revisions != self._registry_revisions
+        ):
+            # the workers have an old copy of the registries
+            self.close()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self._processes,
+                initializer=_init_worker,
+                initargs=(
+                    translation_manager._json_path,
+                    dict(translation_manager.block_registry),
+                    dict(translation_manager.biome_registry),
+                    translation_manager.cache_size,
+                ),
+            )
+            self._registry_revisions = registry_revisions
+        return self._executor
+
+    @staticmethod
+    def _version_key(version: "Version", force_blockstate: bool) -> VersionKey:
+        return version.platform, version.version_number, force_blockstate
+
+    @staticmethod
+    def _pack_palette(
+        blocks: Sequence[Block],
+        block_entities: Optional[Sequence[Optional[BlockEntity]]],
+    ) -> PackedPalette:
+        return (
+            [pack_block(block) for block in blocks],
+            (
+                None
+                if block_entities is None
+                else [pack_entity(block_entity) for block_entity in block_entities]
+            ),
+        )
+
+    def convert_palettes(
+        self,
+        source: "Version",
+        destination: "Version",
+        palettes: Iterable[Sequence[Block]],
+        block_entities: Optional[Iterable[Sequence[Optional[BlockEntity]]]] = None,
+        source_force_blockstate: bool = False,
+        destination_force_blockstate: bool = False,
+    ) -> Iterable[Tuple[List[TranslatedBlock], numpy.ndarray]]:
+        """
+        Translate a number of block palettes from the source version to the destination version.
+        The palettes are distributed between the worker processes.
+
+        :param source: The Version to translate from.
+        :param destination: The Version to translate to.
+        :param palettes: An iterable of block palettes.
+        :param block_entities: An optional iterable containing a sequence of BlockEntity or None for each palette.
+        :param source_force_blockstate: True to use the blockstate format of the source version.
+        :param destination_force_blockstate: True to use the blockstate format of the destination version.
+        :return: An iterable of the translated palette and the int32 array mapping the input palette indexes to the output palette for each palette. See :meth:`VersionConverter.convert_block_palette`
+        """
+        if block_entities is None:
+            packed = [self._pack_palette(palette, None) for palette in palettes]
+        else:
+            packed = [
+                self._pack_palette(palette, palette_block_entities)
+                for palette, palette_block_entities in zip(palettes, block_entities)
+            ]
+        if not packed:
+            return
+        source_key = self._version_key(source, source_force_blockstate)
+        destination_key = self._version_key(destination, destination_force_blockstate)
+        for output_palette, remap in self._get_executor().map(
+            _convert_palette,
+            [source_key] * len(packed),
+            [destination_key] * len(packed),
+            packed,
+        ):
+            yield [unpack_translation(output) for output in output_palette], remap
+
+    def convert_chunks(
+        self,
+        source: "Version",
+        destination: "Version",
+        chunks: Iterable[Tuple[Sequence[Block], numpy.ndarray]],
+        source_force_blockstate: bool = False,
+        destination_force_blockstate: bool = False,
+    ) -> Iterable[Tuple[List[TranslatedBlock], numpy.ndarray]]:
+        """
+        Translate a number of chunks from the source version to the destination version.
+        The chunks are distributed between the worker processes.
+
+        Each chunk is a palette of blocks and an array of indexes into that palette.
+        Blocks with block entities should be translated separately with :meth:`VersionConverter.convert_block`.
+
+        :param source: The Version to translate from.
+        :param destination: The Version to translate to.
+        :param chunks: An iterable of the block palette and index array for each chunk.
+        :param source_force_blockstate: True to use the blockstate format of the source version.
+        :param destination_force_blockstate: True to use the blockstate format of the destination version.
+        :return: An iterable of the translated palette and an array of indexes into that palette for each chunk.
+        """
+        source_key = self._version_key(source, source_force_blockstate)
+        destination_key = self._version_key(destination, destination_force_blockstate)
+        palettes = []
+        arrays = []
+        for palette, array in chunks:
+            palettes.append(self._pack_palette(palette, None))
+            arrays.append(array)
+        if not palettes:
+            return
+        for output_palette, array in self._get_executor().map(
+            _convert_chunk,
+            [source_key] * len(palettes),
+            [destination_key] * len(palettes),
+            palettes,
+            arrays,
+        ):
+            yield [unpack_translation(output) for output in output_palette], array
@@ -5,6 +5,13 @@ class BaseNumericalRegistry:
     def __init__(self):
         self._to_str: Dict[int, str] = {}
         self._to_int: Dict[str, int] = {}
+        # incremented each time the registry is modified so that cached lookups can be invalidated
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """A number that changes each time the registry is modified."""
+        return self._revision
 
     def register(self, key: str, value: int):
         assert isinstance(key, str) and isinstance(
@@ -12,6 +19,7 @@ class BaseNumericalRegistry:
         ), "key must be a string and value must be an int"
         self._to_str[value] = key
         self._to_int[key] = value
+        self._revision += 1
 
     def __contains__(self, item):
         if isinstance(item, int):
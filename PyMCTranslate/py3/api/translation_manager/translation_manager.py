@@ -1,14 +1,19 @@
 import os
-from typing import Union, Tuple, List, Dict
+from typing import Union, Tuple, List, Dict, Optional
 import logging
 
 import numpy
 
 from .registry import NumericalRegistry
-from PyMCTranslate.py3.meta import minified
-from PyMCTranslate.py3.api import Block
+from .converter import VersionConverter, ChunkTranslation
+from PyMCTranslate.py3.api import Block, BlockEntity, BlockPool
 from PyMCTranslate.py3.api.rotate import RotateMode, RotationManager
 from PyMCTranslate.py3.api.version import Version
+from PyMCTranslate.py3.api.version.version import load_version_index
+from PyMCTranslate.py3.api.version.translators.neighbourhood import BlockNeighbourhood
+from PyMCTranslate.py3.api.version.translators.persistent_cache import (
+    PersistentTranslationCache,
+)
 
 log = logging.getLogger(__name__)
 
@@ -48,6 +53,7 @@ class TranslationManager:
 
         :param json_path: The path to the json directory
         """
+        self._json_path = json_path
         # Storage for each of the Version classes
         self._versions: Dict[str, Dict[Tuple[int, int, int], "Version"]] = {}
         # if a Version class for a specific version number does not exist the neareast will be found and stored here
@@ -55,31 +61,39 @@ class TranslationManager:
             Tuple[str, Union[Tuple[int, ...], int]], Tuple[int, int, int]
         ] = {}
 
+        # the maximum number of entries in each translation cache. None for unlimited.
+        self._cache_size: Optional[int] = None
+        # the VersionConverter for each source, destination and force_blockstate pair
+        self._converters: Dict[
+            Tuple["Version", "Version", bool, bool], VersionConverter
+        ] = {}
+        # an optional pool that translated blocks are interned in
+        self._block_pool: Optional[BlockPool] = None
+        # an optional on disk cache shared between processes
+        self._persistent_cache: Optional[PersistentTranslationCache] = None
+
         self._biome_registry = NumericalRegistry()
         self._block_registry = NumericalRegistry()
         self._universal_format = None
 
-        # Create a class for each of the versions and store them
-        if minified:
-            init_file = "meta.json.gz"
-        else:
-            init_file = "__init__.json"
-
+        # Create a class for each of the versions and store them.
+        # Only the __init__ data is loaded here. The rest is loaded when first needed.
         versions_path = os.path.join(json_path, "versions")
 
-        for version_name in os.listdir(versions_path):
-            if os.path.isfile(os.path.join(versions_path, version_name, init_file)):
-                try:
-                    version = Version(os.path.join(versions_path, version_name), self)
-                except:
-                    log.error(
-                        f"Failed loading translator for version {version_name}. Try deleting your Amulet directory and extrating the files agian.",
-                        exc_info=True,
-                    )
-                else:
-                    self._versions.setdefault(version.platform, {}).setdefault(
-                        version.version_number, version
-                    )
+        for version_name, init_file in load_version_index(versions_path).items():
+            try:
+                version = Version(
+                    os.path.join(versions_path, version_name), self, init_file
+                )
+            except:
+                log.error(
+                    f"Failed loading translator for version {version_name}. Try deleting your Amulet directory and extrating the files agian.",
+                    exc_info=True,
+                )
+            else:
+                self._versions.setdefault(version.platform, {}).setdefault(
+                    version.version_number, version
+                )
 
         for platform, versions in self._versions.items():
             # sort the dictionaries by version number
@@ -102,7 +116,8 @@ class TranslationManager:
             raise Exception(
                 "Universal format was not found. Something has probably not been set up correctly."
             )
-        self._rotation_manger = RotationManager(self.universal_format)
+        # This is created when first needed because it loads the universal block specifications
+        self._rotation_manger: Optional[RotationManager] = None
 
     @property
     def universal_format(self) -> Version:
@@ -113,6 +128,74 @@ class TranslationManager:
         """
         return self._universal_format
 
+    @property
+    def cache_size(self) -> Optional[int]:
+        """
+        The maximum number of entries in each of the translation caches. None for unlimited.
+        When a cache is full the least recently used entry is evicted.
+
+        Setting this applies to the translators that have already been loaded and those loaded in the future.
+        """
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, max_size: Optional[int]):
+        if max_size is not None and (not isinstance(max_size, int) or max_size < 0):
+            raise ValueError("cache_size must be None or a positive int")
+        self._cache_size = max_size
+        for versions in self._versions.values():
+            for version in versions.values():
+                version._set_cache_size(max_size)
+        for converter in self._converters.values():
+            converter.set_cache_size(max_size)
+
+    def clear_cache(self):
+        """Remove all cached translation results from every version."""
+        for versions in self._versions.values():
+            for version in versions.values():
+                version._clear_cache()
+        for converter in self._converters.values():
+            converter.clear_cache()
+
+    @property
+    def block_pool(self) -> Optional[BlockPool]:
+        """
+        An optional :class:`BlockPool` that the translated blocks are interned in.
+
+        If set, equal blocks output by the translators are the same instance.
+        This reduces memory when translating large worlds. The default is None which disables interning.
+        """
+        return self._block_pool
+
+    @block_pool.setter
+    def block_pool(self, block_pool: Optional[BlockPool]):
+        if block_pool is not None and not isinstance(block_pool, BlockPool):
+            raise TypeError("block_pool must be a BlockPool or None")
+        self._block_pool = block_pool
+
+    @property
+    def persistent_cache(self) -> Optional[PersistentTranslationCache]:
+        """The on disk translation cache if enabled otherwise None."""
+        return self._persistent_cache
+
+    def enable_persistent_cache(self, path: str, batch_size: int = 256):
+        """
+        Store block translations that do not depend on block entity data or the surrounding blocks in an on disk cache.
+        Other processes using the same file can then reuse the translations.
+        Entries are keyed by the build number so the cache is invalidated when the mappings change.
+
+        :param path: The path to the sqlite database file. It is created if it does not exist.
+        :param batch_size: The number of new results to collect before writing them to disk.
+        """
+        self.disable_persistent_cache()
+        self._persistent_cache = PersistentTranslationCache(path, batch_size)
+
+    def disable_persistent_cache(self):
+        """Write any pending results and stop using the on disk cache."""
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+            self._persistent_cache = None
+
     def transform_universal_block(
         self,
         block: Block,
@@ -127,6 +210,8 @@ class TranslationManager:
         :param mode: The rotation mode. See :class:`RotateMode` for more information
         :return: The transformed block state
         """
+        if self._rotation_manger is None:
+            self._rotation_manger = RotationManager(self.universal_format)
         return self._rotation_manger.transform(block, transform, mode)
 
     @property
@@ -182,6 +267,64 @@ class TranslationManager:
             version_number = self._get_version_number(platform, version_number)
         return self._versions[platform][version_number]
 
+    def get_converter(
+        self,
+        source: "Version",
+        destination: "Version",
+        source_force_blockstate: bool = False,
+        destination_force_blockstate: bool = False,
+    ) -> VersionConverter:
+        """
+        Get a class to translate blocks, entities and biomes directly from one version to another.
+        The same instance is returned for the same inputs so that its cache is reused.
+
+        :param source: The Version to translate from (use ``TranslationManager.get_version`` to get a Version)
+        :param destination: The Version to translate to.
+        :param source_force_blockstate: True to use the blockstate format of the source version. False to use the native format.
+        :param destination_force_blockstate: True to use the blockstate format of the destination version. False to use the native format.
+        :return: The VersionConverter for the given inputs.
+        """
+        key = (
+            source,
+            destination,
+            source_force_blockstate,
+            destination_force_blockstate,
+        )
+        if key not in self._converters:
+            self._converters[key] = VersionConverter(self, *key)
+        return self._converters[key]
+
+    def translate_chunk(
+        self,
+        source: "Version",
+        destination: "Version",
+        block_array: numpy.ndarray,
+        palette: List[Block],
+        block_entities: Optional[Dict[Tuple[int, int, int], BlockEntity]] = None,
+        origin: Tuple[int, int, int] = (0, 0, 0),
+        neighbours: Optional[BlockNeighbourhood] = None,
+        source_force_blockstate: bool = False,
+        destination_force_blockstate: bool = False,
+    ) -> ChunkTranslation:
+        """
+        Translate a chunk or sub-chunk from one version to another.
+        See :meth:`VersionConverter.translate_chunk`
+
+        :param source: The Version to translate from.
+        :param destination: The Version to translate to.
+        :param block_array: A 3D integer array of indexes into palette in x, y, z order.
+        :param palette: The blocks in the source version.
+        :param block_entities: The block entities in the source version keyed by their location in the world.
+        :param origin: The location in the world of block_array[0, 0, 0].
+        :param neighbours: The region used to find the surrounding blocks. Defaults to the chunk itself.
+        :param source_force_blockstate: True to use the blockstate format of the source version. False to use the native format.
+        :param destination_force_blockstate: True to use the blockstate format of the destination version. False to use the native format.
+        :return: A ChunkTranslation containing the new array, palette, block entities and entities.
+        """
+        return self.get_converter(
+            source, destination, source_force_blockstate, destination_force_blockstate
+        ).translate_chunk(block_array, palette, block_entities, origin, neighbours)
+
     def _get_version_number(
         self, platform: str, version_number: Union[int, Tuple[int, ...]]
     ) -> Tuple[int, int, int]:
@@ -0,0 +1,109 @@
+"""
+Find what a mapping needs beyond the block state without running it.
+
+This lets callers know before translating which blocks need a block entity, the surrounding blocks or the location.
+"""
+
+from typing import NamedTuple, Tuple, List, Set
+
+from PyMCTranslate.py3.api.version import code_functions
+
+BlockCoordinates = Tuple[int, int, int]
+
+
+class MappingCapabilities(NamedTuple):
+    # does the mapping read the block entity nbt
+    needs_nbt: bool
+    # the offsets of the surrounding blocks that the mapping reads, relative to the block being translated
+    needs_neighbours: Tuple[BlockCoordinates, ...]
+    # does the mapping read the location of the block
+    needs_location: bool
+    # the names of the code functions the mapping may run
+    uses_code: Tuple[str, ...]
+
+    @property
+    def pure(self) -> bool:
+        """Does the result only depend on the block state. If True the result can be cached."""
+        return (
+            not self.needs_nbt
+            and not self.needs_neighbours
+            and not self.needs_location
+            and all(code_functions.is_pure(name) for name in self.uses_code)
+        )
+
+
+class _Analysis:
+    __slots__ = ("needs_nbt", "neighbours", "needs_location", "code")
+
+    def __init__(self):
+        self.needs_nbt = False
+        self.neighbours: Set[BlockCoordinates] = set()
+        self.needs_location = False
+        self.code: List[str] = []
+
+
+def analyse_mapping(mappings: List[dict]) -> MappingCapabilities:
+    """
+    Find what the mapping needs beyond the block state.
+
+    This is conservative. Every branch is assumed to run so the result is what the mapping may need.
+
+    :param mappings: The raw mapping list as found in the mapping files.
+    :return: The MappingCapabilities of the mapping.
+    """
+    analysis = _Analysis()
+    _analyse(mappings, analysis, (0, 0, 0))
+    return MappingCapabilities(
+        analysis.needs_nbt,
+        tuple(sorted(analysis.neighbours)),
+        analysis.needs_location,
+        tuple(dict.fromkeys(analysis.code)),
+    )
+
+
+def _analyse(mappings: List[dict], analysis: _Analysis, offset: BlockCoordinates):
+    for translate_function in mappings:
+        function_name = translate_function["function"]
+        options = translate_function.get("options")
+        if function_name == "map_properties":
+            for property_options in options.values():
+                for functions in property_options.values():
+                    _analyse(functions, analysis, offset)
+        elif function_name == "map_block_name":
+            for functions in options.values():
+                _analyse(functions, analysis, offset)
+        elif function_name == "multiblock":
+            if isinstance(options, dict):
+                options = [options]
+            for multiblock in options:
+                dx, dy, dz = multiblock["coords"]
+                nested_offset = (offset[0] + dx, offset[1] + dy, offset[2] + dz)
+                analysis.neighbours.add(nested_offset)
+                _analyse(multiblock["functions"], analysis, nested_offset)
+        elif function_name in ("carry_nbt", "map_nbt", "walk_input_nbt"):
+            if offset == (0, 0, 0):
+                analysis.needs_nbt = True
+            if function_name == "map_nbt":
+                for functions in options.get("cases", {}).values():
+                    _analyse(functions, analysis, offset)
+                _analyse(options.get("default", []), analysis, offset)
+            elif function_name == "walk_input_nbt":
+                _analyse_walk_input_nbt(options, analysis, offset)
+        elif function_name == "code":
+            inputs = options.get("input", [])
+            if "nbt" in inputs and offset == (0, 0, 0):
+                analysis.needs_nbt = True
+            if "location" in inputs:
+                analysis.needs_location = True
+            analysis.code.append(options["function"])
+
+
+def _analyse_walk_input_nbt(
+    options: dict, analysis: _Analysis, offset: BlockCoordinates
+):
+    for key in ("functions", "nested_default", "self_default"):
+        _analyse(options.get(key, []), analysis, offset)
+    for nested in options.get("keys", {}).values():
+        _analyse_walk_input_nbt(nested, analysis, offset)
+    for nested in options.get("index", {}).values():
+        _analyse_walk_input_nbt(nested, analysis, offset)
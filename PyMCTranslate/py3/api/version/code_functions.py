@@ -1,30 +1,79 @@
+"""
+The functions used by the "code" mapping function.
+
+The modules in PyMCTranslate.code_functions are only imported the first time a function in them is run.
+A module can declare that its main function is pure by defining pure = True.
+A pure module that reads the nbt can define nbt_paths as a tuple of the compound key paths it reads
+so that its results can be reused without comparing the whole block entity.
+If the code_functions_manifest.json file written by build_tools/code_functions_manifest.py exists
+it is used to find the module for each function name, otherwise the package is searched.
+"""
+
+from typing import Dict, Optional, Callable, Tuple
 import importlib
 import pkgutil
-import PyMCTranslate
+import json
+import os
+
 import PyMCTranslate.code_functions
+from PyMCTranslate.py3.meta import code_functions_manifest
 
-code_functions = {}
+# the functions that have been loaded
+code_functions: Dict[str, Callable] = {}
+# function name to if the function is pure.
+# A module can define pure = True if the result of main only depends on its inputs and it does not modify them.
+_pure: Dict[str, bool] = {}
+# function name to the compound key paths the function reads from the nbt input or None if it may read anything
+_nbt_paths: Dict[str, Optional[Tuple[Tuple[str, ...], ...]]] = {}
+# function name to module name. Populated when first needed.
+_module_names: Optional[Dict[str, str]] = None
 
 
-def _load_function(module_name: str):
-    code_module = importlib.import_module(module_name)
-    assert hasattr(code_module, "main")
-    code_functions[module_name.split(".")[-1]] = code_module.main
+def _find_modules() -> Dict[str, str]:
+    """Find the module name of every function without importing the modules."""
+    if os.path.isfile(code_functions_manifest):
+        with open(code_functions_manifest) as f:
+            return json.load(f)
 
-
-def _load_functions():
     package = PyMCTranslate.code_functions
     package_prefix = package.__name__ + "."
+    return {
+        name.split(".")[-1]: name
+        for _, name, _ in pkgutil.walk_packages(package.__path__, package_prefix)
+    }
 
-    for _, name, _ in pkgutil.walk_packages(package.__path__, package_prefix):
-        _load_function(name)
 
+def _load_function(function_name: str) -> Callable:
+    global _module_names
+    if _module_names is None:
+        _module_names = _find_modules()
+    assert (
+        function_name in _module_names
+    ), f"Function {function_name} could not be found"
+    code_module = importlib.import_module(_module_names[function_name])
+    assert hasattr(code_module, "main")
+    _pure[function_name] = getattr(code_module, "pure", False)
+    _nbt_paths[function_name] = getattr(code_module, "nbt_paths", None)
+    function = code_functions[function_name] = code_module.main
+    return function
+
+
+def is_pure(function_name) -> bool:
+    """Is the result of the function only dependent on its inputs so that it can be reused."""
+    if function_name not in code_functions:
+        _load_function(function_name)
+    return _pure[function_name]
 
-_load_functions()
+
+def nbt_paths(function_name) -> Optional[Tuple[Tuple[str, ...], ...]]:
+    """The compound key paths the function reads from its nbt input or None if it may read any of it."""
+    if function_name not in code_functions:
+        _load_function(function_name)
+    return _nbt_paths[function_name]
 
 
 def run(function_name, inputs):
-    assert (
-        function_name in code_functions
-    ), f"Function {function_name} could not be found"
-    return code_functions[function_name](*inputs)
+    function = code_functions.get(function_name)
+    if function is None:
+        function = _load_function(function_name)
+    return function(*inputs)
@@ -1,4 +1,5 @@
 from typing import Union, Tuple, List, Dict, Callable, TYPE_CHECKING, Type, Optional
+import copy
 import logging
 
 import amulet_nbt
@@ -19,12 +20,21 @@ from amulet_nbt import (
     TAG_Long_Array,
 )
 
-from PyMCTranslate.py3.api import Block, BlockEntity, Entity, ChunkLoadError
+from PyMCTranslate.py3.api import (
+    Block,
+    BlockEntity,
+    Entity,
+    ChunkLoadError,
+    get_properties_view,
+)
 from PyMCTranslate.py3.api.version import code_functions
+from PyMCTranslate.py3.api.version.translators.cache import TranslationCache
 
 if TYPE_CHECKING:
     from numpy import ndarray
     from PyMCTranslate.py3.api.version import Version
+    from PyMCTranslate.py3.api.version.translators.block import BlockSpecification
+    from PyMCTranslate.py3.api.version.translators.entity import EntitySpecification
 
 log = logging.getLogger(__name__)
 
@@ -173,9 +183,12 @@ def nbt_from_list(
             ],
         ]
     ],
-    default_template: str = None,
+    default_template: Union[str, AbstractBaseTag] = None,
 ) -> NamedTag:
-    if default_template is not None:
+    if isinstance(default_template, AbstractBaseTag):
+        # the template is shared so must be copied
+        nbt_object = copy.deepcopy(default_template)
+    elif default_template is not None:
         nbt_object = amulet_nbt.from_snbt(default_template)
     else:
         nbt_object = datatype_to_nbt(outer_type)()
@@ -268,7 +281,7 @@ def nbt_from_list(
 def translate(
     object_input: Union[Block, Entity],
     input_spec: dict,
-    mappings: List[dict],
+    mappings: Union[List[dict], "CompiledMapping"],
     output_version: "Version",
     force_blockstate: bool,
     get_block_callback: Callable[
@@ -283,7 +296,7 @@ def translate(
 
     :param object_input: the Block or Entity object to be converted
     :param input_spec: the specification for the object_input from the input block_format
-    :param mappings: the mapping file for the input_object
+    :param mappings: the mapping file for the input_object or the compiled version from :func:`compile_mapping`
     :param output_version: A way for the function to look at the specification being converted to. (used to load default properties)
     :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
     :param get_block_callback: A callable with relative coordinates that returns a Block and optional BlockEntity
@@ -347,29 +360,30 @@ def translate(
     else:
         raise Exception
 
+    if isinstance(mappings, list):
+        mappings = compile_mapping(mappings)
+
     # run the conversion
-    output_name, output_type, new_data, extra_needed, cacheable = _translate(
+    state = _translate(
         block_input, nbt_input, mappings, get_block_callback, block_location
     )
+    output_name = state.output_name
+    output_type = state.output_type
+    extra_needed = state.extra_needed
+    cacheable = state.cacheable
 
     # sort out the outputs from the _translate function
     extra_output = None
     if output_type == "block":
         # we should have a block output
-        # create the block object based on output_name and new['properties']
+        # create the block object based on output_name and the new properties
         namespace, base_name = output_name.split(":", 1)
-        spec = output_version.block._get_raw_specification(
+        spec: "BlockSpecification" = output_version.block._get_parsed_specification(
             namespace, base_name, force_blockstate
         )
-        properties = spec.get("defaults", {})
-
-        # cast to NBT
-        properties = {
-            prop: amulet_nbt.from_snbt(val) for prop, val in properties.items()
-        }
-
-        for key, val in new_data["properties"].items():
-            properties[key] = val
+        # the parsed defaults are shared so must be copied
+        properties = dict(spec.default_properties)
+        properties.update(state.properties)
         output = Block(namespace, base_name, properties)
 
         if "snbt" in spec:
@@ -379,30 +393,30 @@ def translate(
                 nbt = nbt_from_list(
                     spec.get("outer_name", ""),
                     spec.get("outer_type", "compound"),
-                    new_data["nbt"],
-                    spec.get("snbt", "{}"),
+                    state.nbt,
+                    spec.default_nbt if spec.default_nbt is not None else "{}",
                 )
 
             else:
                 nbt = nbt_from_list(
                     spec.get("outer_name", ""),
                     spec.get("outer_type", "compound"),
-                    new_data["nbt"],
+                    state.nbt,
                 )
 
             extra_output = BlockEntity(namespace, base_name, 0, 0, 0, nbt)
             # not quite sure how to handle coordinates here.
             # it makes sense to me to have the wrapper program set the coordinates so none are missed.
-        elif new_data["nbt"]:
+        elif state.nbt:
             log.warning(
                 f"New nbt present but no output block entity\nin:{object_input.blockstate}\nout:{output.blockstate}"
             )
 
     elif output_type == "entity":
         # we should have an entity output
-        # create the entity object based on output_name and new['nbt']
+        # create the entity object based on output_name and the new nbt
         namespace, base_name = output_name.split(":", 1)
-        spec = output_version.entity._get_raw_specification(
+        spec: "EntitySpecification" = output_version.entity._get_parsed_specification(
             namespace, base_name, force_blockstate
         )
 
@@ -410,15 +424,15 @@ def translate(
             nbt = nbt_from_list(
                 spec.get("outer_name", ""),
                 spec.get("outer_type", "compound"),
-                new_data["nbt"],
-                spec.get("snbt", "{}"),
+                state.nbt,
+                spec.default_nbt if spec.default_nbt is not None else "{}",
             )
 
         else:
             nbt = nbt_from_list(
                 spec.get("outer_name", ""),
                 spec.get("outer_type", "compound"),
-                new_data["nbt"],
+                state.nbt,
             )
 
         output = Entity(namespace, base_name, 0.0, 0.0, 0.0, nbt)
@@ -428,560 +442,893 @@ def translate(
     return output, extra_output, extra_needed, cacheable
 
 
+NBTPath = Tuple[str, str, List[Tuple[Union[str, int], str]]]
+NBTEntry = Tuple[
+    str, str, List[Tuple[Union[str, int], str]], Union[str, int], AbstractBaseTag
+]
+
+# nbt tags that can be shared between translations without being copied
+_immutable_nbt = (
+    TAG_Byte,
+    TAG_Short,
+    TAG_Int,
+    TAG_Long,
+    TAG_Float,
+    TAG_Double,
+    TAG_String,
+)
+
+# used to mark options that were not defined in the mapping
+_Undefined = object()
+
+
+class _TranslationState:
+    """The output data the compiled mapping functions write into."""
+
+    __slots__ = (
+        "output_name",
+        "output_type",
+        "properties",
+        "nbt",
+        "extra_needed",
+        "cacheable",
+    )
+
+    def __init__(self):
+        self.output_name: Optional[str] = None
+        self.output_type: Optional[str] = None
+        # There could be multiple 'new_block' functions in the mappings so new properties are put in here and merged at the very end
+        self.properties: Dict[str, AbstractBaseTag] = {}
+        self.nbt: List[NBTEntry] = []
+        self.extra_needed = False  # used to determine if extra data is required (and thus to do block by block)
+        self.cacheable = True  # cacheable until proven otherwise
+
+
+class _TranslationInput:
+    """The input data the compiled mapping functions read from."""
+
+    __slots__ = (
+        "block_input",
+        "nbt_input",
+        "get_block_callback",
+        "absolute_location",
+        "relative_location",
+        "nbt_path",
+    )
+
+    def __init__(
+        self,
+        block_input: Optional[Block],
+        nbt_input: Optional[NamedTag],
+        get_block_callback: Optional[Callable],
+        absolute_location: BlockCoordinates,
+        relative_location: BlockCoordinates,
+        nbt_path: Optional[NBTPath],
+    ):
+        self.block_input = block_input
+        self.nbt_input = nbt_input
+        self.get_block_callback = get_block_callback
+        self.absolute_location = absolute_location
+        self.relative_location = relative_location
+        self.nbt_path = nbt_path
+
+    def at_nbt_path(self, nbt_path: NBTPath) -> "_TranslationInput":
+        return _TranslationInput(
+            self.block_input,
+            self.nbt_input,
+            self.get_block_callback,
+            self.absolute_location,
+            self.relative_location,
+            nbt_path,
+        )
+
+
+MappingFunction = Callable[[_TranslationState, _TranslationInput], None]
+CompiledMapping = Tuple[MappingFunction, ...]
+
+
 def _translate(
     block_input: Union[Block, None],
     nbt_input: Union[NamedTag, None],
-    mappings: List[dict],
+    mappings: CompiledMapping,
     get_block_callback: Callable = None,
     absolute_location: BlockCoordinates = (0, 0, 0),
-    relative_location: BlockCoordinates = (0, 0, 0),
-    nbt_path: Tuple[str, str, List[Tuple[Union[str, int], str]]] = None,
-    inherited_data: Tuple[Union[str, None], Union[str, None], dict, bool, bool] = None,
-) -> Tuple[Union[str, None], Union[str, None], dict, bool, bool]:
+) -> _TranslationState:
     """
+    Run the compiled mapping functions on the input data.
 
-    :param block_input:
-    :param nbt_input:
-    :param mappings:
-    :param get_block_callback:
-    :param absolute_location:
-    :param relative_location:
-    :param inherited_data:
-    :return:
-            output_name - string of the object being output
-            output_type - string of the type output name is (should be 'block' or 'entity')
-            new - a dictionary that looks like this {'properties': {}, 'nbt': []}
-            extra_needed - bool. Specifies if more data is needed (ie if the block callback needs to be given to do a full map)
-            cacheable - bool. Specifies if the input object is cachable. Only true for simple Blocks without BlockEntities
+    :param block_input: The input block. None if the input is an entity.
+    :param nbt_input: The input nbt or None if not known.
+    :param mappings: The compiled mapping functions to run. See :func:`compile_mapping`
+    :param get_block_callback: A callable with relative coordinates that returns a Block and optional BlockEntity
+    :param absolute_location: The location of the block in the world.
+    :return: The translation state containing the output name, output type, new properties, new nbt, extra_needed and cacheable
     """
-    output_name: Optional[str]
+    state = _TranslationState()
+    _run(
+        mappings,
+        state,
+        _TranslationInput(
+            block_input,
+            nbt_input,
+            get_block_callback,
+            absolute_location,
+            (0, 0, 0),
+            None,
+        ),
+    )
+    return state
 
-    if inherited_data is not None:
-        output_name, output_type, new_data, extra_needed, cacheable = inherited_data
-    else:
-        output_name = None
-        output_type = None
-        new_data = {
-            "properties": {},
-            "nbt": [],
-        }  # There could be multiple 'new_block' functions in the mappings so new properties are put in here and merged at the very end
-        new_data["nbt"]: List[
-            Tuple[
-                str,
-                str,
-                List[Union[str, int], str],
-                Union[str, int],
-                Union[
-                    TAG_Byte,
-                    TAG_Short,
-                    TAG_Int,
-                    TAG_Long,
-                    TAG_Float,
-                    TAG_Double,
-                    TAG_Byte_Array,
-                    TAG_String,
-                    TAG_List,
-                    TAG_Compound,
-                    TAG_Int_Array,
-                    TAG_Long_Array,
-                ],
-            ]
-        ]
-        """
-		new['nbt'] = [
-			[
-				[
-					[path0, type0],
-					[path1, type1],
-					...
-				],
-				path_n,
-				NBT
-			],
-			...
-		]
-		"""
-        extra_needed = False  # used to determine if extra data is required (and thus to do block by block)
-        cacheable = True  # cacheable until proven otherwise
 
+def _run(
+    mappings: CompiledMapping, state: _TranslationState, inputs: _TranslationInput
+):
     for translate_function in mappings:
-        function_name = translate_function["function"]
-
-        if "new_block" == function_name:
-            # {
-            # 	"function": "new_block",
-            # 	"options": "<namespace>:<base_name>"
-            # }
-            output_name = translate_function["options"]
-            output_type = "block"
-
-        elif "new_entity" == function_name:
-            # {
-            # 	"function": "new_entity",
-            # 	"options": "<namespace>:<base_name>"
-            # }
-            output_name = translate_function["options"]
-            output_type = "entity"
-
-        elif "new_properties" == function_name:
-            # {
-            # 	"function": "new_properties",
-            # 	"options": {
-            # 		"<property_name>": "<SNBT>",  # eg "val", "54b"
-            # 	}
-            # }
-            for key, val in translate_function["options"].items():
-                new_data["properties"][key] = amulet_nbt.from_snbt(val)
-
-        elif "carry_properties" == function_name:
-            # {
-            # 	"function": "carry_properties",
-            # 	"options": {
-            # 		"<property_name>": ["<property_value"],
-            # 		"<nbt_property_name>": ['<SNBT>']
-            # 	}
-            # }
-            assert isinstance(block_input, Block), "The block input is not a block"
-            for key in translate_function["options"]:
-                if key in block_input.properties:
-                    val = block_input.properties[key]
-                    if isinstance(val, AbstractBaseTag):
-                        hash_val = val.to_snbt()
-                    else:
-                        continue
-                    if hash_val in translate_function["options"][key]:
-                        new_data["properties"][key] = val
-
-        elif "map_properties" == function_name:
-            # {
-            # 	"function": "map_properties",
-            # 	"options": {
-            # 		"<property_name>": {
-            # 			"<SNBT>": [
-            # 				<functions>
-            # 			]
-            # 		}
-            # 	}
-            # }
-            assert isinstance(block_input, Block), "The block input is not a block"
-            for key in translate_function["options"]:
-                if key in block_input.properties:
-                    val = block_input.properties[key]
-                    if isinstance(val, AbstractBaseTag):
-                        val = val.to_snbt()
-                    else:
-                        continue
-                    if val in translate_function["options"][key]:
-                        (
-                            output_name,
-                            output_type,
-                            new_data,
-                            extra_needed,
-                            cacheable,
-                        ) = _translate(
-                            block_input,
-                            nbt_input,
-                            translate_function["options"][key][val],
-                            get_block_callback,
-                            absolute_location,
-                            relative_location,
-                            nbt_path,
-                            (
-                                output_name,
-                                output_type,
-                                new_data,
-                                extra_needed,
-                                cacheable,
-                            ),
-                        )
-
-        elif "multiblock" == function_name:
-            # {
-            # 	"function": "multiblock",
-            # 	"options": [
-            # 		{
-            # 			"coords": [dx, dy, dz],
-            # 			"functions": <functions>
-            # 		}
-            # 	]
-            # }
-            cacheable = False
-            if get_block_callback is None:
-                extra_needed = True
+        translate_function(state, inputs)
+
+
+def compile_mapping(mappings: List[dict]) -> CompiledMapping:
+    """
+    Compile a raw mapping list into a tuple of functions that can be run on the input data.
+
+    The raw mapping is only read from so it does not need to be copied first.
+
+    :param mappings: The raw mapping list as found in the mapping files.
+    :return: A tuple of mapping functions.
+    """
+    compiled = []
+    for translate_function in mappings:
+        compiler = _function_compilers.get(translate_function["function"])
+        if compiler is not None:
+            compiled.append(compiler(translate_function))
+    return tuple(compiled)
+
+
+def _compile_new_block(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "new_block",
+    # 	"options": "<namespace>:<base_name>"
+    # }
+    output_name = translate_function["options"]
+
+    def new_block(state: _TranslationState, inputs: _TranslationInput):
+        state.output_name = output_name
+        state.output_type = "block"
+
+    return new_block
+
+
+def _compile_new_entity(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "new_entity",
+    # 	"options": "<namespace>:<base_name>"
+    # }
+    output_name = translate_function["options"]
+
+    def new_entity(state: _TranslationState, inputs: _TranslationInput):
+        state.output_name = output_name
+        state.output_type = "entity"
+
+    return new_entity
+
+
+def _compile_new_properties(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "new_properties",
+    # 	"options": {
+    # 		"<property_name>": "<SNBT>",  # eg "val", "54b"
+    # 	}
+    # }
+    properties = {
+        key: amulet_nbt.from_snbt(val)
+        for key, val in translate_function["options"].items()
+    }
+
+    def new_properties(state: _TranslationState, inputs: _TranslationInput):
+        state.properties.update(properties)
+
+    return new_properties
+
+
+def _compile_carry_properties(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "carry_properties",
+    # 	"options": {
+    # 		"<property_name>": ["<property_value"],
+    # 		"<nbt_property_name>": ['<SNBT>']
+    # 	}
+    # }
+    # the values are parsed here so that the input values can be looked up without serialising them
+    options = tuple(
+        (key, frozenset(amulet_nbt.from_snbt(val) for val in values))
+        for key, values in translate_function["options"].items()
+    )
+
+    def carry_properties(state: _TranslationState, inputs: _TranslationInput):
+        block_input = inputs.block_input
+        assert isinstance(block_input, Block), "The block input is not a block"
+        properties = get_properties_view(block_input)
+        for key, values in options:
+            if key in properties:
+                val = properties[key]
+                if isinstance(val, AbstractBaseTag) and val in values:
+                    state.properties[key] = val
+
+    return carry_properties
+
+
+def _compile_map_properties(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "map_properties",
+    # 	"options": {
+    # 		"<property_name>": {
+    # 			"<SNBT>": [
+    # 				<functions>
+    # 			]
+    # 		}
+    # 	}
+    # }
+    # the values are parsed here so that the input values can be looked up without serialising them
+    options = tuple(
+        (
+            key,
+            {
+                amulet_nbt.from_snbt(val): compile_mapping(functions)
+                for val, functions in property_options.items()
+            },
+        )
+        for key, property_options in translate_function["options"].items()
+    )
+
+    def map_properties(state: _TranslationState, inputs: _TranslationInput):
+        block_input = inputs.block_input
+        assert isinstance(block_input, Block), "The block input is not a block"
+        properties = get_properties_view(block_input)
+        for key, property_options in options:
+            if key in properties:
+                val = properties[key]
+                if isinstance(val, AbstractBaseTag):
+                    functions = property_options.get(val)
+                    if functions is not None:
+                        _run(functions, state, inputs)
+
+    return map_properties
+
+
+def _compile_multiblock(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "multiblock",
+    # 	"options": [
+    # 		{
+    # 			"coords": [dx, dy, dz],
+    # 			"functions": <functions>
+    # 		}
+    # 	]
+    # }
+    multiblocks = translate_function["options"]
+    if isinstance(multiblocks, dict):
+        multiblocks = [multiblocks]
+    multiblocks = tuple(
+        (tuple(multiblock["coords"]), compile_mapping(multiblock["functions"]))
+        for multiblock in multiblocks
+    )
+
+    def multiblock(state: _TranslationState, inputs: _TranslationInput):
+        state.cacheable = False
+        get_block_callback = inputs.get_block_callback
+        if get_block_callback is None:
+            state.extra_needed = True
+            return
+        relative_location = inputs.relative_location
+        absolute_location = inputs.absolute_location
+        for (dx, dy, dz), functions in multiblocks:
+            new_location = (
+                relative_location[0] + dx,
+                relative_location[1] + dy,
+                relative_location[2] + dz,
+            )
+            if absolute_location is None:
+                # the location of the block is not known
+                new_absolute_location = None
             else:
-                multiblocks = translate_function["options"]
-                if isinstance(multiblocks, dict):
-                    multiblocks = [multiblocks]
-                for multiblock in multiblocks:
-                    new_location = (
-                        relative_location[0] + multiblock["coords"][0],
-                        relative_location[1] + multiblock["coords"][1],
-                        relative_location[2] + multiblock["coords"][2],
-                    )
-                    new_absolute_location = (
-                        absolute_location[0] + multiblock["coords"][0],
-                        absolute_location[1] + multiblock["coords"][1],
-                        absolute_location[2] + multiblock["coords"][2],
-                    )
-                    try:
-                        block_input_, nbt_input_ = get_block_callback(new_location)
-                        if nbt_input_ is not None:
-                            nbt_input_ = nbt_input_.nbt
-                        (
-                            output_name,
-                            output_type,
-                            new_data,
-                            extra_needed,
-                            cacheable,
-                        ) = _translate(
-                            block_input_,
-                            nbt_input_,
-                            multiblock["functions"],
-                            get_block_callback,
-                            new_absolute_location,
-                            new_location,
-                            nbt_path,
-                            (
-                                output_name,
-                                output_type,
-                                new_data,
-                                extra_needed,
-                                cacheable,
-                            ),
-                        )
-                    except ChunkLoadError:
-                        continue
-
-        elif "map_block_name" == function_name:
-            # {
-            # 	"function": "map_block_name",
-            # 	"options": {
-            # 		"<namespace>:<base_name>": [
-            # 			<functions>
-            # 		]
-            # 	}
-            # }
-            assert isinstance(
-                block_input, Block
-            ), f"The block input {block_input} is not a block"
-            block_name = f"{block_input.namespace}:{block_input.base_name}"
-            if block_name in translate_function["options"]:
-                (
-                    output_name,
-                    output_type,
-                    new_data,
-                    extra_needed,
-                    cacheable,
-                ) = _translate(
-                    block_input,
-                    nbt_input,
-                    translate_function["options"][block_name],
-                    get_block_callback,
-                    absolute_location,
-                    relative_location,
-                    nbt_path,
-                    (output_name, output_type, new_data, extra_needed, cacheable),
+                new_absolute_location = (
+                    absolute_location[0] + dx,
+                    absolute_location[1] + dy,
+                    absolute_location[2] + dz,
                 )
+            try:
+                block_input_, nbt_input_ = get_block_callback(new_location)
+                if nbt_input_ is not None:
+                    nbt_input_ = nbt_input_.nbt
+                _run(
+                    functions,
+                    state,
+                    _TranslationInput(
+                        block_input_,
+                        nbt_input_,
+                        get_block_callback,
+                        new_absolute_location,
+                        new_location,
+                        inputs.nbt_path,
+                    ),
+                )
+            except ChunkLoadError:
+                continue
+
+    return multiblock
+
+
+def _compile_map_block_name(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "map_block_name",
+    # 	"options": {
+    # 		"<namespace>:<base_name>": [
+    # 			<functions>
+    # 		]
+    # 	}
+    # }
+    options = {
+        block_name: compile_mapping(functions)
+        for block_name, functions in translate_function["options"].items()
+    }
+
+    def map_block_name(state: _TranslationState, inputs: _TranslationInput):
+        block_input = inputs.block_input
+        assert isinstance(
+            block_input, Block
+        ), f"The block input {block_input} is not a block"
+        functions = options.get(block_input.namespaced_name)
+        if functions is not None:
+            _run(functions, state, inputs)
+
+    return map_block_name
+
+
+class _WalkInputNBT:
+    """The compiled form of the options of a walk_input_nbt function."""
+
+    __slots__ = (
+        "nbt_class",
+        "walk",
+        "nested_datatype",
+        "functions",
+        "keys",
+        "index",
+        "nested_default",
+        "log_nested_default",
+        "self_default",
+    )
+
+    def __init__(self, mappings: dict):
+        datatype = mappings["type"]
+        self.nbt_class = datatype_to_nbt(datatype)
+        if datatype == "compound":
+            self.walk = _walk_compound
+        elif datatype == "list":
+            self.walk = _walk_list
+        elif datatype in ("byte_array", "int_array", "long_array"):
+            self.walk = _walk_array
+        else:
+            self.walk = None
+        self.nested_datatype = datatype.replace("_array", "")
 
-        elif "walk_input_nbt" == function_name:
-            # This is a special function unlike the others. See _convert_walk_input_nbt for more information
-            # {
-            # 	"function": "walk_input_nbt",
-            #   "outer_name": "",  # defaults to this if undefined
-            # 	"options": {
-            # 		"type": "<nbt type>",  # check that the nbt is of this type
-            # 		"self_default": [],  # if the type is different run these functions : defaults to [{"function": "carry_nbt"}] which carries everything
-            # 	    "functions": [],  # functions to run if defined
-            #
-            # 		"keys": {  # only for compound type
-            # 	        str: {nested options format}
-            # 		},
-            #       "index": {  # only for list or array types
-            # 	        str(<int>): {nested options format}     (type should not be defined for nested array types)
-            # 	    },
-            # 	    "nested_default": []  # only for compound, list or array types.
-            # 	        If nested key/index is not in respective dictionary run these functions on them.
-            #           If undefined defaults to [{"function": "carry_nbt"}] which carries everything
-            # 	}
-            # }
-            cacheable = False
-            if nbt_input is None:
-                extra_needed = True
+        self.functions = (
+            compile_mapping(mappings["functions"]) if "functions" in mappings else None
+        )
+        self.keys: Dict[str, _WalkInputNBT] = {
+            key: _WalkInputNBT(nested)
+            for key, nested in mappings.get("keys", {}).items()
+        }
+        self.index: Dict[int, _WalkInputNBT] = {
+            int(index): _WalkInputNBT(nested)
+            for index, nested in mappings.get("index", {}).items()
+            if index.isdigit() and str(int(index)) == index
+        }
+        if "nested_default" in mappings:
+            self.nested_default = compile_mapping(mappings["nested_default"])
+            self.log_nested_default = mappings["nested_default"] == [
+                {"function": "carry_nbt"}
+            ]
+        else:
+            self.nested_default = None
+            self.log_nested_default = False
+        self.self_default = (
+            compile_mapping(mappings["self_default"])
+            if "self_default" in mappings
+            else None
+        )
+
+
+def _compile_walk_input_nbt(translate_function: dict) -> MappingFunction:
+    # This is a special function unlike the others. See _walk_input_nbt for more information
+    # {
+    # 	"function": "walk_input_nbt",
+    #   "outer_name": "",  # defaults to this if undefined
+    # 	"options": {
+    # 		"type": "<nbt type>",  # check that the nbt is of this type
+    # 		"self_default": [],  # if the type is different run these functions : defaults to [{"function": "carry_nbt"}] which carries everything
+    # 	    "functions": [],  # functions to run if defined
+    #
+    # 		"keys": {  # only for compound type
+    # 	        str: {nested options format}
+    # 		},
+    #       "index": {  # only for list or array types
+    # 	        str(<int>): {nested options format}     (type should not be defined for nested array types)
+    # 	    },
+    # 	    "nested_default": []  # only for compound, list or array types.
+    # 	        If nested key/index is not in respective dictionary run these functions on them.
+    #           If undefined defaults to [{"function": "carry_nbt"}] which carries everything
+    # 	}
+    # }
+    walk_options = _WalkInputNBT(translate_function["options"])
+    custom_nbt_path = translate_function.get("path", [])
+    if custom_nbt_path:
+        custom_nbt_path = ("", "compound", custom_nbt_path)
+        custom_datatype = custom_nbt_path[2][-1][-1]
+        custom_nbt_class = datatype_to_nbt(custom_datatype)
+
+    def walk_input_nbt(state: _TranslationState, inputs: _TranslationInput):
+        state.cacheable = False
+        if inputs.nbt_input is None:
+            state.extra_needed = True
+        elif custom_nbt_path:
+            nbt_temp = index_nbt(inputs.nbt_input, custom_nbt_path)
+            if nbt_temp is None:
+                log.error(f"Expected nbt data at {custom_nbt_path[2]}")
+            elif not isinstance(nbt_temp, custom_nbt_class):
+                log.error(
+                    f"Expected nbt data at {custom_nbt_path[2]} to be an {custom_datatype} tag but got {nbt_temp.__class__}"
+                )
             else:
-                custom_nbt_path = translate_function.get("path", [])
-                if custom_nbt_path:
-                    nbt_temp = index_nbt(nbt_input, ("", "compound", custom_nbt_path))
-                    if nbt_temp is None:
-                        log.error(f"Expected nbt data at {custom_nbt_path}")
-                    elif not isinstance(
-                        nbt_temp, datatype_to_nbt(custom_nbt_path[-1][-1])
-                    ):
-                        log.error(
-                            f"Expected nbt data at {custom_nbt_path} to be an {custom_nbt_path[-1][-1]} tag but got {nbt_temp.__class__}"
-                        )
-                    else:
-                        (
-                            output_name,
-                            output_type,
-                            new_data,
-                            extra_needed,
-                            cacheable,
-                        ) = _convert_walk_input_nbt(
-                            block_input,
-                            nbt_input,
-                            translate_function["options"],
-                            get_block_callback,
-                            absolute_location,
-                            relative_location,
-                            ("", "compound", custom_nbt_path),
-                            (
-                                output_name,
-                                output_type,
-                                new_data,
-                                extra_needed,
-                                cacheable,
-                            ),
-                        )
-
-                else:
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _convert_walk_input_nbt(
-                        block_input,
-                        nbt_input,
-                        translate_function["options"],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        nbt_path,
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
+                _walk_input_nbt(
+                    walk_options, state, inputs.at_nbt_path(custom_nbt_path)
+                )
+        elif inputs.nbt_path is None:
+            _walk_input_nbt(
+                walk_options, state, inputs.at_nbt_path(("", "compound", []))
+            )
+        else:
+            _walk_input_nbt(walk_options, state, inputs)
 
-        elif "new_nbt" == function_name:
-            # when used outside walk_input_nbt
-            # {
-            # 	"function": "new_nbt",
-            # 	"options": [
-            # 		{
-            #           "outer_name": "",  # defaults to this if undefined
-            #           "outer_type": "compound",  # defaults to this if undefined
-            # 			"path": [ # optional. Defaults to the root
-            # 				[ < path1 >: Union[str, int], < datatype1 >: str]
-            # 			]
-            # 			"key": <key>: str or int,
-            # 			"value": "<SNBT>"
-            # 		}
-            # 	]
-            # }
-
-            # when used inside walk_input_nbt
-            # {
-            # 	"function": "new_nbt",
-            # 	"options": [
-            # 		{
-            #           "outer_name": "",  # defaults to this if undefined
-            #           "outer_type": "compound",  # defaults to this if undefined
-            # 			"path": [ # optional. [] to be the root, undefined to be the input path
-            # 				[ < path1 >: Union[str, int], < datatype1 >: str]
-            # 			]
-            # 			"key": <key>: Union[str, int],
-            # 			"value": "<SNBT>"
-            # 		}
-            # 	]
-            # }
-
-            new_nbts = translate_function["options"]
-            if isinstance(new_nbts, dict):
-                new_nbts = [new_nbts]
-
-            for new_nbt in new_nbts:
-                if "path" in new_nbt:
-                    path = new_nbt["path"]
-                elif nbt_path is None:
-                    path = []
-                else:
-                    path = nbt_path[2]
-
-                outer_name = new_nbt.get("outer_name", "")
-                outer_type = new_nbt.get("outer_type", "compound")
-
-                new_data["nbt"].append(
+    return walk_input_nbt
+
+
+def _walk_input_nbt(
+    mappings: _WalkInputNBT, state: _TranslationState, inputs: _TranslationInput
+):
+    # nbt_path should always exist in nbt_input because the calling code should check that
+    nbt = index_nbt(inputs.nbt_input, inputs.nbt_path)
+
+    if mappings.functions is not None:
+        # run functions if present
+        _run(mappings.functions, state, inputs)
+
+    if isinstance(nbt, mappings.nbt_class):
+        # datatypes match
+        if mappings.walk is not None:
+            mappings.walk(mappings, nbt, state, inputs)
+
+    elif mappings.self_default is not None:
+        # datatypes do not match. Run self_default
+        _run(mappings.self_default, state, inputs)
+
+
+def _walk_compound(
+    mappings: _WalkInputNBT,
+    nbt: TAG_Compound,
+    state: _TranslationState,
+    inputs: _TranslationInput,
+):
+    outer_name, outer_type, path = inputs.nbt_path
+    for key in nbt:
+        if key in mappings.keys:
+            _walk_input_nbt(
+                mappings.keys[key],
+                state,
+                inputs.at_nbt_path(
+                    (outer_name, outer_type, path + [(key, nbt_to_datatype(nbt[key]))])
+                ),
+            )
+        elif mappings.nested_default is not None:
+            nbt_path = (
+                outer_name,
+                outer_type,
+                path + [(key, nbt_to_datatype(nbt[key]))],
+            )
+            if mappings.log_nested_default:
+                log.info(f"Unnaccounted data at {nbt_path}")
+            _run(mappings.nested_default, state, inputs.at_nbt_path(nbt_path))
+
+
+def _walk_list(
+    mappings: _WalkInputNBT,
+    nbt: TAG_List,
+    state: _TranslationState,
+    inputs: _TranslationInput,
+):
+    outer_name, outer_type, path = inputs.nbt_path
+    for index in range(len(nbt)):
+        if index in mappings.index:
+            _walk_input_nbt(
+                mappings.index[index],
+                state,
+                inputs.at_nbt_path(
                     (
                         outer_name,
                         outer_type,
-                        path,
-                        new_nbt["key"],
-                        amulet_nbt.from_snbt(new_nbt["value"]),
+                        path + [(index, nbt_to_datatype(nbt[index]))],
                     )
-                )
+                ),
+            )
+        elif mappings.nested_default is not None:
+            nbt_path = (
+                outer_name,
+                outer_type,
+                path + [(index, nbt_to_datatype(nbt[index]))],
+            )
+            if mappings.log_nested_default:
+                log.info(f"Unnaccounted data at {nbt_path}")
+            _run(mappings.nested_default, state, inputs.at_nbt_path(nbt_path))
 
-        elif "carry_nbt" == function_name:
-            # only works within walk_input_nbt
-            # {
-            # 	"function": "carry_nbt",
-            # 	"options": {
-            # 		"outer_name": "",  # defaults to this if undefined
-            # 		"outer_type": "compound",  # defaults to this if undefined
-            # 		"path": [  # [] to be the root, undefined to be the input path
-            # 			[ <path1>: Union[str, int], <datatype1>: str],
-            # 			...
-            # 		],
-            # 		"key": <key>: Union[str, int]  # undefined to remain under the same key/index
-            # 		"type": <type>: str  # undefined to remain as the input type
-            # 	}
-            # }
-            cacheable = False
-            if nbt_input is None:
-                extra_needed = True
-            elif nbt_path is not None:
-                nbt = index_nbt(nbt_input, nbt_path)
-                if nbt is None:
-                    raise Exception(
-                        "This code should not be run because it should be caught by other code before it gets here."
-                    )
-                val = nbt.py_data
-
-                options = translate_function.get("options", {})
-                outer_name = options.get("outer_name", "")
-                outer_type = options.get("outer_type", "compound")
-                path = options.get("path", nbt_path[2][:-1])
-                key = options.get("key", nbt_path[2][-1][0])
-                nbt_type = options.get("type", nbt_path[2][-1][1])
-
-                # TODO: some kind of check to make sure that the input data type nbt_path[-1][1] can be cast to nbt_type
-                #  perhaps this should be done in the compiler rather than at runtime
-                new_data["nbt"].append(
-                    (outer_name, outer_type, path, key, datatype_to_nbt(nbt_type)(val))
+
+def _walk_array(
+    mappings: _WalkInputNBT,
+    nbt: Union[TAG_Byte_Array, TAG_Int_Array, TAG_Long_Array],
+    state: _TranslationState,
+    inputs: _TranslationInput,
+):
+    outer_name, outer_type, path = inputs.nbt_path
+    nested_datatype = mappings.nested_datatype
+    for index in range(len(nbt)):
+        if index in mappings.index:
+            _walk_input_nbt(
+                mappings.index[index],
+                state,
+                inputs.at_nbt_path(
+                    (outer_name, outer_type, path + [(index, nested_datatype)])
+                ),
+            )
+        elif mappings.nested_default is not None:
+            _run(
+                mappings.nested_default,
+                state,
+                inputs.at_nbt_path(
+                    (outer_name, outer_type, path + [(index, nested_datatype)])
+                ),
+            )
+
+
+def _compile_new_nbt(translate_function: dict) -> MappingFunction:
+    # when used outside walk_input_nbt
+    # {
+    # 	"function": "new_nbt",
+    # 	"options": [
+    # 		{
+    #           "outer_name": "",  # defaults to this if undefined
+    #           "outer_type": "compound",  # defaults to this if undefined
+    # 			"path": [ # optional. Defaults to the root
+    # 				[ < path1 >: Union[str, int], < datatype1 >: str]
+    # 			]
+    # 			"key": <key>: str or int,
+    # 			"value": "<SNBT>"
+    # 		}
+    # 	]
+    # }
+
+    # when used inside walk_input_nbt
+    # {
+    # 	"function": "new_nbt",
+    # 	"options": [
+    # 		{
+    #           "outer_name": "",  # defaults to this if undefined
+    #           "outer_type": "compound",  # defaults to this if undefined
+    # 			"path": [ # optional. [] to be the root, undefined to be the input path
+    # 				[ < path1 >: Union[str, int], < datatype1 >: str]
+    # 			]
+    # 			"key": <key>: Union[str, int],
+    # 			"value": "<SNBT>"
+    # 		}
+    # 	]
+    # }
+    new_nbts = translate_function["options"]
+    if isinstance(new_nbts, dict):
+        new_nbts = [new_nbts]
+    new_nbts = tuple(
+        (
+            new_nbt.get("outer_name", ""),
+            new_nbt.get("outer_type", "compound"),
+            new_nbt.get("path", _Undefined),
+            new_nbt["key"],
+            amulet_nbt.from_snbt(new_nbt["value"]),
+        )
+        for new_nbt in new_nbts
+    )
+
+    def new_nbt(state: _TranslationState, inputs: _TranslationInput):
+        for outer_name, outer_type, path, key, value in new_nbts:
+            if path is _Undefined:
+                path = [] if inputs.nbt_path is None else inputs.nbt_path[2]
+            if not isinstance(value, _immutable_nbt):
+                value = copy.deepcopy(value)
+            state.nbt.append((outer_name, outer_type, path, key, value))
+
+    return new_nbt
+
+
+def _compile_carry_nbt(translate_function: dict) -> MappingFunction:
+    # only works within walk_input_nbt
+    # {
+    # 	"function": "carry_nbt",
+    # 	"options": {
+    # 		"outer_name": "",  # defaults to this if undefined
+    # 		"outer_type": "compound",  # defaults to this if undefined
+    # 		"path": [  # [] to be the root, undefined to be the input path
+    # 			[ <path1>: Union[str, int], <datatype1>: str],
+    # 			...
+    # 		],
+    # 		"key": <key>: Union[str, int]  # undefined to remain under the same key/index
+    # 		"type": <type>: str  # undefined to remain as the input type
+    # 	}
+    # }
+    options = translate_function.get("options", {})
+    outer_name = options.get("outer_name", "")
+    outer_type = options.get("outer_type", "compound")
+    new_path = options.get("path", _Undefined)
+    new_key = options.get("key", _Undefined)
+    new_type = options.get("type", _Undefined)
+    new_class = _Undefined if new_type is _Undefined else datatype_to_nbt(new_type)
+
+    def carry_nbt(state: _TranslationState, inputs: _TranslationInput):
+        state.cacheable = False
+        nbt_path = inputs.nbt_path
+        if inputs.nbt_input is None:
+            state.extra_needed = True
+        elif nbt_path is not None:
+            nbt = index_nbt(inputs.nbt_input, nbt_path)
+            if nbt is None:
+                raise Exception(
+                    "This code should not be run because it should be caught by other code before it gets here."
                 )
+            path = nbt_path[2][:-1] if new_path is _Undefined else new_path
+            key = nbt_path[2][-1][0] if new_key is _Undefined else new_key
+            nbt_class = (
+                datatype_to_nbt(nbt_path[2][-1][1])
+                if new_class is _Undefined
+                else new_class
+            )
 
-        elif "map_nbt" == function_name:
-            # {
-            # 	"function": "map_nbt",
-            # 	"options": {  # based on the input nbt value at path (should only be used with end stringable datatypes)
-            # 		"cases": {},  # if the data is in here then do the nested functions
-            # 		"default": []  # if the data is not in cases or cases is not defined then do these functions
-            # 	}
-            # }
-
-            cacheable = False
-            if nbt_input is None:
-                extra_needed = True
-            elif nbt_path is not None:
-                run_default = True
-                if "cases" in translate_function["options"]:
-                    nbt = index_nbt(nbt_input, nbt_path)
-                    nbt_hash = nbt.to_snbt()
-                    if nbt_hash in translate_function["options"]["cases"]:
-                        (
-                            output_name,
-                            output_type,
-                            new_data,
-                            extra_needed,
-                            cacheable,
-                        ) = _translate(
-                            block_input,
-                            nbt_input,
-                            translate_function["options"]["cases"][nbt_hash],
-                            get_block_callback,
-                            absolute_location,
-                            relative_location,
-                            nbt_path,
-                            (
-                                output_name,
-                                output_type,
-                                new_data,
-                                extra_needed,
-                                cacheable,
-                            ),
-                        )
-                        run_default = False
-
-                if run_default and "default" in translate_function["options"]:
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _translate(
-                        block_input,
-                        nbt_input,
-                        translate_function["options"]["default"],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        nbt_path,
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
+            # TODO: some kind of check to make sure that the input data type nbt_path[-1][1] can be cast to nbt_type
+            #  perhaps this should be done in the compiler rather than at runtime
+            state.nbt.append(
+                (outer_name, outer_type, path, key, nbt_class(nbt.py_data))
+            )
+
+    return carry_nbt
+
+
+def _compile_map_nbt(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "map_nbt",
+    # 	"options": {  # based on the input nbt value at path (should only be used with end stringable datatypes)
+    # 		"cases": {},  # if the data is in here then do the nested functions
+    # 		"default": []  # if the data is not in cases or cases is not defined then do these functions
+    # 	}
+    # }
+    options = translate_function["options"]
+    cases = (
+        {
+            nbt_hash: compile_mapping(functions)
+            for nbt_hash, functions in options["cases"].items()
+        }
+        if "cases" in options
+        else None
+    )
+    default = compile_mapping(options["default"]) if "default" in options else None
+
+    def map_nbt(state: _TranslationState, inputs: _TranslationInput):
+        state.cacheable = False
+        if inputs.nbt_input is None:
+            state.extra_needed = True
+        elif inputs.nbt_path is not None:
+            if cases is not None:
+                nbt = index_nbt(inputs.nbt_input, inputs.nbt_path)
+                functions = cases.get(nbt.to_snbt())
+                if functions is not None:
+                    _run(functions, state, inputs)
+                    return
+
+            if default is not None:
+                _run(default, state, inputs)
+
+    return map_nbt
+
+
+def _code_input_namespace(state: _TranslationState, inputs: _TranslationInput):
+    return inputs.block_input.namespace
+
+
+def _code_input_base_name(state: _TranslationState, inputs: _TranslationInput):
+    return inputs.block_input.base_name
+
+
+def _code_input_properties(state: _TranslationState, inputs: _TranslationInput):
+    return inputs.block_input.properties
+
+
+def _code_input_nbt(state: _TranslationState, inputs: _TranslationInput):
+    if inputs.nbt_input is None:
+        state.extra_needed = True
+        return ["compound", {}]
+    else:
+        return objectify_nbt(inputs.nbt_input)
+
+
+def _code_input_location(state: _TranslationState, inputs: _TranslationInput):
+    return inputs.absolute_location
+
+
+_code_inputs = {
+    "namespace": _code_input_namespace,
+    "namspace": _code_input_namespace,  # the original misspelt name
+    "base_name": _code_input_base_name,
+    "properties": _code_input_properties,
+    "nbt": _code_input_nbt,
+    "location": _code_input_location,
+}
+
+
+def _code_key_namespace(inputs: _TranslationInput, function_name: str):
+    return inputs.block_input.namespace
+
+
+def _code_key_base_name(inputs: _TranslationInput, function_name: str):
+    return inputs.block_input.base_name
+
+
+def _code_key_properties(inputs: _TranslationInput, function_name: str):
+    return frozenset(get_properties_view(inputs.block_input).items())
+
+
+def _code_key_nbt(inputs: _TranslationInput, function_name: str):
+    if inputs.nbt_input is None:
+        return None
+    tag = inputs.nbt_input.tag
+    paths = code_functions.nbt_paths(function_name)
+    if paths is None:
+        # the function may read any of the nbt
+        return tag.to_snbt()
+    return tuple(_code_key_nbt_path(tag, path) for path in paths)
+
+
+def _code_key_nbt_path(tag, path: Tuple[str, ...]) -> Optional[str]:
+    # only the tags the function reads are serialised
+    for key in path:
+        if isinstance(tag, TAG_Compound) and key in tag:
+            tag = tag[key]
+        else:
+            return None
+    return tag.to_snbt()
+
+
+# hashable versions of the code inputs used to reuse the results of pure functions
+_code_input_keys = {
+    "namespace": _code_key_namespace,
+    "namspace": _code_key_namespace,
+    "base_name": _code_key_base_name,
+    "properties": _code_key_properties,
+    "nbt": _code_key_nbt,
+}
+
+# the maximum number of results stored for each code mapping function
+_code_memo_size = 1024
+# used to find results that are not in the memo because None is a valid result
+_NotMemoised = object()
+
+
+def _code_output_output_name(state: _TranslationState, out):
+    assert isinstance(out, str)
+    state.output_name = out
+
+
+def _code_output_output_type(state: _TranslationState, out):
+    assert isinstance(out, str)
+    state.output_type = out
+
+
+def _code_output_new_properties(state: _TranslationState, out):
+    assert isinstance(out, dict)
+    for key, val in out.items():
+        state.properties[key] = amulet_nbt.from_snbt(val)
+
+
+def _code_output_new_nbt(state: _TranslationState, out):
+    assert isinstance(out, list)
+    for val in out:
+        assert len(val) == 5
+        state.nbt.append(tuple(val[:4]) + (unobjectify_nbt(val[4]),))
+
+
+_code_outputs = {
+    "output_name": _code_output_output_name,
+    "output_type": _code_output_output_type,
+    "new_properties": _code_output_new_properties,
+    "new_nbt": _code_output_new_nbt,
+}
 
-        elif "code" == function_name:
-            # {
-            # 	"function": "code",  # when all the other functions fail you this should do what you need. Use as sparingly as possible
-            # 	"options": {
-            # 		"input": ["namespace", "base_name", "properties", "nbt"],  # all of these inputs and output are optional. Change these lists to modify
-            # 		"output": ["output_name", "output_type", "new_properties", "new_nbt"],
-            # 		"function": "function_name"  # this links to a lua funciton in the lua directory with the file name function_name.lua
-            # 	}
-            # }
-
-            # this function was originally designed to be lua code but I have now switched it to python because lua is hard :(
-            # Might swap back one day
-            # this would be in function_name.py
-            # def main(namespace, base_name, properties, nbt)
-            #   return "minecraft:air", "block", {"property_name": "property_name"}, []
-
-            # usage examples:
-            #   splitting and merging strings in signs
-
-            cacheable = False
-
-            options = translate_function["options"]
-
-            function_inputs = []
-            for inp in options.get("input", []):
-                if inp == "namspace":
-                    function_inputs.append(block_input.namespace)
-                elif inp == "base_name":
-                    function_inputs.append(block_input.base_name)
-                elif inp == "properties":
-                    function_inputs.append(block_input.properties)
-                elif inp == "nbt":
-                    if nbt_input is None:
-                        extra_needed = True
-                        function_inputs.append(["compound", {}])
-                    else:
-                        function_inputs.append(objectify_nbt(nbt_input))
-                elif inp == "location":
-                    function_inputs.append(absolute_location)
-
-            function_output = code_functions.run(options["function"], function_inputs)
-            if not isinstance(function_output, tuple):
-                function_output = (function_output,)
-
-            for out, out_name in zip(function_output, options["output"]):
-                if out_name == "output_name":
-                    assert isinstance(out, str)
-                    output_name = out
-                elif out_name == "output_type":
-                    assert isinstance(out, str)
-                    output_type = out
-                elif out_name == "new_properties":
-                    assert isinstance(out, dict)
-                    for key, val in out.items():
-                        new_data["properties"][key] = amulet_nbt.from_snbt(val)
-                elif out_name == "new_nbt":
-                    assert isinstance(out, list)
-                    for val in out:
-                        assert len(val) == 5
-                        new_data["nbt"].append(
-                            tuple(val[:4]) + (unobjectify_nbt(val[4]),)
-                        )
-
-    return output_name, output_type, new_data, extra_needed, cacheable
+
+def _compile_code(translate_function: dict) -> MappingFunction:
+    # {
+    # 	"function": "code",  # when all the other functions fail you this should do what you need. Use as sparingly as possible
+    # 	"options": {
+    # 		"input": ["namespace", "base_name", "properties", "nbt"],  # all of these inputs and output are optional. Change these lists to modify
+    # 		"output": ["output_name", "output_type", "new_properties", "new_nbt"],
+    # 		"function": "function_name"  # this links to a lua funciton in the lua directory with the file name function_name.lua
+    # 	}
+    # }
+
+    # this function was originally designed to be lua code but I have now switched it to python because lua is hard :(
+    # Might swap back one day
+    # this would be in function_name.py
+    # def main(namespace, base_name, properties, nbt)
+    #   return "minecraft:air", "block", {"property_name": "property_name"}, []
+
+    # usage examples:
+    #   splitting and merging strings in signs
+    options = translate_function["options"]
+    function_name = options["function"]
+    input_names = tuple(inp for inp in options.get("input", []) if inp in _code_inputs)
+    input_getters = tuple(_code_inputs[inp] for inp in input_names)
+    output_setters = tuple(_code_outputs.get(out) for out in options["output"])
+    # results that depend on the location are unlikely to be reused so are not memoised
+    memoise = "location" not in input_names
+    if memoise:
+        key_getters = tuple(_code_input_keys[inp] for inp in input_names)
+        reads_nbt = "nbt" in input_names
+        # the outputs of pure functions. Key is the hashable version of the inputs
+        memo = TranslationCache(_code_memo_size)
+
+    def code(state: _TranslationState, inputs: _TranslationInput):
+        if memoise and code_functions.is_pure(function_name):
+            if reads_nbt:
+                # the result depends on the block entity. Pure functions that only read the block state stay cacheable.
+                state.cacheable = False
+            key = tuple(getter(inputs, function_name) for getter in key_getters)
+            function_output = memo.get(key, _NotMemoised)
+            if function_output is _NotMemoised:
+                function_inputs = [getter(state, inputs) for getter in input_getters]
+                function_output = memo[key] = code_functions.run(
+                    function_name, function_inputs
+                )
+            elif reads_nbt and inputs.nbt_input is None:
+                state.extra_needed = True
+        else:
+            state.cacheable = False
+            function_inputs = [getter(state, inputs) for getter in input_getters]
+            function_output = code_functions.run(function_name, function_inputs)
+        if not isinstance(function_output, tuple):
+            function_output = (function_output,)
+
+        for out, setter in zip(function_output, output_setters):
+            if setter is not None:
+                setter(state, out)
+
+    return code
+
+
+_function_compilers: Dict[str, Callable[[dict], MappingFunction]] = {
+    "new_block": _compile_new_block,
+    "new_entity": _compile_new_entity,
+    "new_properties": _compile_new_properties,
+    "carry_properties": _compile_carry_properties,
+    "map_properties": _compile_map_properties,
+    "multiblock": _compile_multiblock,
+    "map_block_name": _compile_map_block_name,
+    "walk_input_nbt": _compile_walk_input_nbt,
+    "new_nbt": _compile_new_nbt,
+    "carry_nbt": _compile_carry_nbt,
+    "map_nbt": _compile_map_nbt,
+    "code": _compile_code,
+}
 
 
 def objectify_nbt(nbt: NamedTag) -> Tuple[str, dict]:
@@ -1021,247 +1368,3 @@ def unobjectify_nbt(nbt: Tuple[str, Union[dict, list, int, str, "ndarray"]]):
         "long_array",
     ]:
         return nbt_class(nbt)
-
-
-def _convert_walk_input_nbt(
-    block_input: Union[Block, None],
-    nbt_input: Union[NamedTag, None],
-    mappings: dict,
-    get_block_callback: Callable,
-    absolute_location: BlockCoordinates = (0, 0, 0),
-    relative_location: BlockCoordinates = (0, 0, 0),
-    nbt_path: Tuple[str, str, List[Tuple[Union[str, int], str]]] = None,
-    inherited_data: Tuple[Union[str, None], Union[str, None], dict, bool, bool] = None,
-) -> Tuple[Union[str, None], Union[str, None], dict, bool, bool]:
-    if nbt_path is None:
-        nbt_path = ("", "compound", [])
-    if inherited_data is not None:
-        output_name, output_type, new_data, extra_needed, cacheable = inherited_data
-    else:
-        output_name = None
-        output_type = None
-        new_data = {
-            "properties": {},
-            "nbt": [],
-        }  # There could be multiple 'new_block' functions in the mappings so new properties are put in here and merged at the very end
-        new_data["nbt"]: List[
-            List[
-                str,
-                str,
-                List[Union[str, int], str],
-                Union[str, int],
-                Union[
-                    TAG_Byte,
-                    TAG_Short,
-                    TAG_Int,
-                    TAG_Long,
-                    TAG_Float,
-                    TAG_Double,
-                    TAG_Byte_Array,
-                    TAG_String,
-                    TAG_List,
-                    TAG_Compound,
-                    TAG_Int_Array,
-                    TAG_Long_Array,
-                ],
-            ]
-        ]
-        """
-		new['nbt'] = [
-			[
-				[
-					[path0, type0],
-					[path1, type1],
-					...
-				],
-				path_n,
-				NBT
-			],
-			...
-		]
-		"""
-        extra_needed = False  # used to determine if extra data is required (and thus to do block by block)
-        cacheable = True  # cacheable until proven otherwise
-
-    nbt = index_nbt(
-        nbt_input, nbt_path
-    )  # nbt_path should always exist in nbt_input because the calling code should check that
-
-    datatype = mappings["type"]
-
-    if "functions" in mappings:
-        # run functions if present
-        output_name, output_type, new_data, extra_needed, cacheable = _translate(
-            block_input,
-            nbt_input,
-            mappings["functions"],
-            get_block_callback,
-            absolute_location,
-            relative_location,
-            nbt_path,
-            (output_name, output_type, new_data, extra_needed, cacheable),
-        )
-
-    if isinstance(nbt, datatype_to_nbt(datatype)):
-        # datatypes match
-        if datatype == "compound":
-            for key in nbt:
-                if key in mappings.get("keys", {}):
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _convert_walk_input_nbt(
-                        block_input,
-                        nbt_input,
-                        mappings["keys"][key],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        (
-                            nbt_path[0],
-                            nbt_path[1],
-                            nbt_path[2] + [(key, nbt_to_datatype(nbt[key]))],
-                        ),
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
-                elif "nested_default" in mappings:
-                    if mappings["nested_default"] == [{"function": "carry_nbt"}]:
-                        log.info(
-                            f"Unnaccounted data at {(nbt_path[0], nbt_path[1], nbt_path[2] + [(key, nbt_to_datatype(nbt[key]))])}"
-                        )
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _translate(
-                        block_input,
-                        nbt_input,
-                        mappings["nested_default"],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        (
-                            nbt_path[0],
-                            nbt_path[1],
-                            nbt_path[2] + [(key, nbt_to_datatype(nbt[key]))],
-                        ),
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
-
-        elif datatype == "list":
-            for index in range(len(nbt)):
-                if str(index) in mappings.get("index", {}):
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _convert_walk_input_nbt(
-                        block_input,
-                        nbt_input,
-                        mappings["index"][str(index)],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        (
-                            nbt_path[0],
-                            nbt_path[1],
-                            nbt_path[2] + [(index, nbt_to_datatype(nbt[index]))],
-                        ),
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
-                elif "nested_default" in mappings:
-                    if mappings["nested_default"] == [{"function": "carry_nbt"}]:
-                        log.info(
-                            f"Unnaccounted data at {(nbt_path[0], nbt_path[1], nbt_path[2] + [(index, nbt_to_datatype(nbt[index]))])}"
-                        )
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _translate(
-                        block_input,
-                        nbt_input,
-                        mappings["nested_default"],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        (
-                            nbt_path[0],
-                            nbt_path[1],
-                            nbt_path[2] + [(index, nbt_to_datatype(nbt[index]))],
-                        ),
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
-
-        # elif datatype in ('byte', 'short', 'int', 'long', 'float', 'double', 'string'):
-        # 	pass
-
-        elif datatype in ("byte_array", "int_array", "long_array"):
-            nested_datatype = datatype.replace("_array", "")
-            for index in range(len(nbt)):
-                if str(index) in mappings.get("index", {}):
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _convert_walk_input_nbt(
-                        block_input,
-                        nbt_input,
-                        mappings["index"][str(index)],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        (
-                            nbt_path[0],
-                            nbt_path[1],
-                            nbt_path[2] + [(index, nested_datatype)],
-                        ),
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
-                elif "nested_default" in mappings:
-                    (
-                        output_name,
-                        output_type,
-                        new_data,
-                        extra_needed,
-                        cacheable,
-                    ) = _translate(
-                        block_input,
-                        nbt_input,
-                        mappings["nested_default"],
-                        get_block_callback,
-                        absolute_location,
-                        relative_location,
-                        (
-                            nbt_path[0],
-                            nbt_path[1],
-                            nbt_path[2] + [(index, nested_datatype)],
-                        ),
-                        (output_name, output_type, new_data, extra_needed, cacheable),
-                    )
-
-    elif "self_default" in mappings:
-        # datatypes do not match. Run self_default
-        output_name, output_type, new_data, extra_needed, cacheable = _translate(
-            block_input,
-            nbt_input,
-            mappings["self_default"],
-            get_block_callback,
-            absolute_location,
-            relative_location,
-            nbt_path,
-            (output_name, output_type, new_data, extra_needed, cacheable),
-        )
-
-    return output_name, output_type, new_data, extra_needed, cacheable
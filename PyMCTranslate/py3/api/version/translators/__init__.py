@@ -2,3 +2,4 @@ from .block import BlockTranslator
 from .entity import EntityTranslator
 from .item import ItemTranslator
 from .biome import BiomeTranslator
+from .neighbourhood import BlockNeighbourhood
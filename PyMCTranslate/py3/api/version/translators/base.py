@@ -1,10 +1,15 @@
-from typing import List, Tuple, Union, Callable, TYPE_CHECKING
+from typing import List, Tuple, Union, Callable, TYPE_CHECKING, Dict, Optional
 import copy
 import logging
 
 from PyMCTranslate.py3.meta import minified, json_atlas
 from PyMCTranslate.py3.api import Block, BlockEntity, Entity
-from PyMCTranslate.py3.api.version.translate import translate
+from PyMCTranslate.py3.api.version.translate import (
+    translate,
+    compile_mapping,
+    CompiledMapping,
+)
+from .cache import TranslationCache
 
 if TYPE_CHECKING:
     from ..version import Version
@@ -20,6 +25,9 @@ class BaseSpecification(dict):
 
 
 class BaseTranslator:
+    # the class used to wrap the specification data
+    _specification_class = BaseSpecification
+
     def __init__(
         self,
         translation_manager: "TranslationManager",
@@ -34,6 +42,18 @@ class BaseTranslator:
         self._mode = mode
 
         self._error_cache = set()
+        # the compiled mappings. Key is namespace, base_name, direction, format key
+        self._compiled_mappings: Dict[Tuple[str, str, str, str], CompiledMapping] = {}
+        # the specifications with parsed defaults. Key is namespace, base_name, format key
+        self._parsed_specifications: Dict[Tuple[str, str, str], BaseSpecification] = {}
+        # the translation results. Key is direction, force_blockstate
+        self._cache: Dict[Tuple[str, bool], TranslationCache] = {
+            (direction, force_blockstate): TranslationCache(
+                translation_manager.cache_size
+            )
+            for direction in ("to_universal", "from_universal")
+            for force_blockstate in (False, True)
+        }
 
     def _format_key(self, force_blockstate):
         return (
@@ -42,6 +62,46 @@ class BaseTranslator:
             else "blockstate"
         )
 
+    def get_cache(
+        self, direction: str, force_blockstate: bool = False
+    ) -> TranslationCache:
+        """
+        Get the cache of translation results in the given direction.
+        This can be used to inspect the hit, miss and eviction counters.
+
+        :param direction: "to_universal" or "from_universal"
+        :param force_blockstate: True to get the cache for the blockstate format. False to get the cache for the native format.
+        :return: The TranslationCache for the direction.
+        """
+        return self._cache[(direction, force_blockstate)]
+
+    def set_cache_size(self, max_size: Optional[int]):
+        """
+        Set the maximum number of entries in each of the translation caches.
+        The least recently used entries are evicted when a cache is full.
+
+        :param max_size: The maximum number of entries. None for unlimited.
+        """
+        for cache in self._cache.values():
+            cache.max_size = max_size
+
+    def clear_cache(self, direction: Optional[str] = None):
+        """
+        Remove the cached translation results.
+
+        :param direction: "to_universal" or "from_universal" to only clear one direction. None to clear both.
+        """
+        for (direction_, _), cache in self._cache.items():
+            if direction is None or direction == direction_:
+                cache.clear()
+
+    def _intern(self, output: Union[Block, Entity]) -> Union[Block, Entity]:
+        """Get the canonical instance of an output block if the TranslationManager has a block pool."""
+        block_pool = self._translation_manager.block_pool
+        if block_pool is not None and isinstance(output, Block):
+            return block_pool.intern(output)
+        return output
+
     def _error_once(self, unique, msg_fmt, *args):
         if unique not in self._error_cache:
             log.error(msg_fmt.format(*args), exc_info=True)
@@ -56,7 +116,7 @@ class BaseTranslator:
         self,
         object_input: Union[Block, Entity],
         input_spec: dict,
-        mappings: List[dict],
+        mappings: CompiledMapping,
         output_version: "Version",
         force_blockstate: bool,
         translation_direction: str,
@@ -66,6 +126,7 @@ class BaseTranslator:
         extra_input: BlockEntity = None,
         block_location: BlockCoordinates = (0, 0, 0),
         pre_populate_defaults: bool = True,
+        on_error: Callable[[], None] = None,
     ) -> Union[
         Tuple[Block, None, bool, bool],
         Tuple[Block, BlockEntity, bool, bool],
@@ -83,7 +144,7 @@ class BaseTranslator:
                 pre_populate_defaults,
                 block_location,
             )
-            return output, extra_output, extra_needed, cacheable
+            return self._intern(output), extra_output, extra_needed, cacheable
         except Exception as e:
             self._error_once(
                 (object_input, str(e)),
@@ -93,6 +154,8 @@ class BaseTranslator:
                 translation_direction,
                 self._parent_version,
             )
+            if on_error is not None:
+                on_error()
             return object_input, extra_input, True, False
 
     def namespaces(self, force_blockstate: bool = False) -> List[str]:
@@ -124,25 +187,103 @@ class BaseTranslator:
         )
 
     @staticmethod
-    def _get_data(data):
+    def _get_shared_data(data):
+        """Get the data without copying it. The returned data must not be modified."""
         if minified:
-            return copy.deepcopy(json_atlas[data])
+            return json_atlas[data]
         else:
-            return copy.deepcopy(data)
+            return data
 
-    def _get_raw_specification(
+    def _get_shared_specification(
         self, namespace: str, base_name: str, force_blockstate: bool = False
     ) -> dict:
+        """
+        Get the raw specification without copying it.
+        The returned data is shared and must not be modified.
+        """
         try:
             data = self._database.get(self._format_key(force_blockstate), {}).get(
                 "specification", {}
             )[namespace][base_name]
-            return self._get_data(data)
+            return self._get_shared_data(data)
         except KeyError:
             raise KeyError(
                 f"Specification for {self._mode} {self._format_key(force_blockstate)} {namespace}:{base_name} does not exist in {self._parent_version}"
             )
 
+    def _get_parsed_specification(
+        self, namespace: str, base_name: str, force_blockstate: bool = False
+    ) -> BaseSpecification:
+        """
+        Get the specification wrapped in the specification class.
+        The parsed default values are computed the first time they are requested and reused.
+        The returned data is shared and must not be modified.
+        """
+        key = (namespace, base_name, self._format_key(force_blockstate))
+        specification = self._parsed_specifications.get(key)
+        if specification is None:
+            specification = self._parsed_specifications[key] = (
+                self._specification_class(
+                    self._get_shared_specification(
+                        namespace, base_name, force_blockstate
+                    )
+                )
+            )
+        return specification
+
+    def _get_raw_specification(
+        self, namespace: str, base_name: str, force_blockstate: bool = False
+    ) -> dict:
+        return copy.deepcopy(
+            self._get_shared_specification(namespace, base_name, force_blockstate)
+        )
+
+    def _get_shared_mapping(
+        self,
+        direction: str,
+        namespace: str,
+        base_name: str,
+        force_blockstate: bool = False,
+    ) -> List[dict]:
+        """
+        Get the raw mapping in the given direction without copying it.
+        The returned data is shared and must not be modified.
+
+        :param direction: "to_universal" or "from_universal"
+        """
+        try:
+            data = self._database.get(self._format_key(force_blockstate), {}).get(
+                direction, {}
+            )[namespace][base_name]
+            return self._get_shared_data(data)
+        except KeyError:
+            raise KeyError(
+                f"Mapping {direction.replace('_', ' ')} for {self._mode} {self._format_key(force_blockstate)} {namespace}:{base_name} does not exist in {self._parent_version}"
+            )
+
+    def _get_compiled_mapping(
+        self,
+        direction: str,
+        namespace: str,
+        base_name: str,
+        force_blockstate: bool = False,
+    ) -> CompiledMapping:
+        """
+        Get the compiled mapping in the given direction.
+        The mapping is compiled the first time it is requested and cached for subsequent calls.
+
+        :param direction: "to_universal" or "from_universal"
+        """
+        key = (namespace, base_name, direction, self._format_key(force_blockstate))
+        compiled = self._compiled_mappings.get(key)
+        if compiled is None:
+            compiled = self._compiled_mappings[key] = compile_mapping(
+                self._get_shared_mapping(
+                    direction, namespace, base_name, force_blockstate
+                )
+            )
+        return compiled
+
     def get_specification(
         self, namespace: str, base_name: str, force_blockstate: bool = False
     ) -> BaseSpecification:
@@ -167,15 +308,11 @@ class BaseTranslator:
         :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
         :return: A list of mapping functions to apply to the object
         """
-        try:
-            data = self._database.get(self._format_key(force_blockstate), {}).get(
-                "to_universal", {}
-            )[namespace][base_name]
-            return self._get_data(data)
-        except KeyError:
-            raise KeyError(
-                f"Mapping to universal for {self._mode} {self._format_key(force_blockstate)} {namespace}:{base_name} does not exist in {self._parent_version}"
+        return copy.deepcopy(
+            self._get_shared_mapping(
+                "to_universal", namespace, base_name, force_blockstate
             )
+        )
 
     def get_mapping_from_universal(
         self, namespace: str, base_name: str, force_blockstate: bool = False
@@ -188,15 +325,11 @@ class BaseTranslator:
         :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
         :return: A list of mapping functions to apply to the object
         """
-        try:
-            data = self._database.get(self._format_key(force_blockstate), {}).get(
-                "from_universal", {}
-            )[namespace][base_name]
-            return self._get_data(data)
-        except KeyError:
-            raise KeyError(
-                f"Mapping from universal for {self._mode} {self._format_key(force_blockstate)} {namespace}:{base_name} does not exist in {self._parent_version}"
+        return copy.deepcopy(
+            self._get_shared_mapping(
+                "from_universal", namespace, base_name, force_blockstate
             )
+        )
 
     def to_universal(self, *args, **kwargs):
         raise NotImplementedError
@@ -1,7 +1,9 @@
-from typing import Dict, TYPE_CHECKING, List, Optional
+from typing import Dict, TYPE_CHECKING, List, Optional, Iterable
 import numpy
 import logging
 
+from .cache import TranslationCache
+
 if TYPE_CHECKING:
     from PyMCTranslate.py3.api.translation_manager import TranslationManager
 
@@ -34,6 +36,49 @@ class BiomeTranslator:
 
         self._error_biomes = set()
 
+        # the results of unpack and pack. These are cleared when the biome registry is modified.
+        self._cache: Dict[str, TranslationCache] = {
+            "unpack": TranslationCache(translation_manager.cache_size),
+            "pack": TranslationCache(translation_manager.cache_size),
+        }
+        self._registry_revision = translation_manager.biome_registry.revision
+
+    def _check_registry(self):
+        revision = self._translation_manager.biome_registry.revision
+        if revision != self._registry_revision:
+            self.clear_cache()
+            self._registry_revision = revision
+
+    def get_cache(self, direction: str) -> TranslationCache:
+        """
+        Get the cache of results in the given direction.
+        This can be used to inspect the hit, miss and eviction counters.
+
+        :param direction: "unpack" or "pack"
+        :return: The TranslationCache for the direction.
+        """
+        return self._cache[direction]
+
+    def set_cache_size(self, max_size: Optional[int]):
+        """
+        Set the maximum number of entries in each of the caches.
+        The least recently used entries are evicted when a cache is full.
+
+        :param max_size: The maximum number of entries. None for unlimited.
+        """
+        for cache in self._cache.values():
+            cache.max_size = max_size
+
+    def clear_cache(self, direction: Optional[str] = None):
+        """
+        Remove the cached results.
+
+        :param direction: "unpack" or "pack" to only clear one direction. None to clear both.
+        """
+        for direction_, cache in self._cache.items():
+            if direction is None or direction == direction_:
+                cache.clear()
+
     def unpack(self, biome: int) -> str:
         """Unpack the raw numerical biome value into the namespaced string format.
         This will first use any pre-registered mappings bound using TranslationManager.biome_registry.register
@@ -41,6 +86,28 @@ class BiomeTranslator:
         If it still can't be found it will fall back to plains"""
         if isinstance(biome, numpy.integer):
             biome = int(biome)
+        self._check_registry()
+        cache = self._cache["unpack"]
+        biome_str = cache.get(biome)
+        if biome_str is None:
+            biome_str = cache[biome] = self._unpack(biome)
+        return biome_str
+
+    def unpack_array(self, biomes: numpy.ndarray) -> numpy.ndarray:
+        """Unpack an array of raw numerical biome values into namespaced strings.
+        Each unique value is only unpacked once. See :meth:`unpack`
+
+        :param biomes: An integer array of biome values.
+        :return: An object array of the same shape containing the namespaced biome strings.
+        """
+        biomes = numpy.asarray(biomes)
+        unique, inverse = numpy.unique(biomes, return_inverse=True)
+        biome_strs = numpy.array(
+            [self.unpack(biome) for biome in unique.tolist()], dtype=object
+        )
+        return biome_strs[inverse].reshape(biomes.shape)
+
+    def _unpack(self, biome: int) -> str:
         if biome in self._translation_manager.biome_registry:
             biome_str = self._translation_manager.biome_registry.private_to_str(biome)
         elif biome in self._biome_int_to_str:
@@ -59,6 +126,28 @@ class BiomeTranslator:
         This will first use any pre-registered mappings bound using TranslationManager.biome_registry.register
         If it can't be found there it will fall back to the vanilla ones.
         If it still can't be found it will fall back to plains"""
+        self._check_registry()
+        cache = self._cache["pack"]
+        biome_int = cache.get(biome)
+        if biome_int is None:
+            biome_int = cache[biome] = self._pack(biome)
+        return biome_int
+
+    def pack_array(self, biomes: Iterable[str]) -> numpy.ndarray:
+        """Pack an array of namespaced biome strings into the raw numerical format.
+        Each unique value is only packed once. See :meth:`pack`
+
+        :param biomes: An array or iterable of namespaced biome strings.
+        :return: An int32 array of the same shape containing the numerical biome values.
+        """
+        biomes = numpy.asarray(biomes, dtype=object)
+        unique, inverse = numpy.unique(biomes, return_inverse=True)
+        biome_ints = numpy.array(
+            [self.pack(biome) for biome in unique], dtype=numpy.int32
+        )
+        return biome_ints[inverse].reshape(biomes.shape)
+
+    def _pack(self, biome: str) -> int:
         if biome in self._translation_manager.biome_registry:
             return self._translation_manager.biome_registry.private_to_int(biome)
         elif biome in self._biome_str_to_int:
@@ -66,7 +155,7 @@ class BiomeTranslator:
             if biome_int is not None:
                 return biome_int
         log.warning(f"Error processing biome {biome}. Setting to plains.")
-        return self.pack(
+        return self._pack(
             "minecraft:plains"
         )  # TODO: perhaps find a way to assign default dynamically
 
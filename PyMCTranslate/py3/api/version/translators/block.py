@@ -1,11 +1,34 @@
-from typing import Tuple, Union, Callable, TYPE_CHECKING, Optional, Dict, Any
+from typing import (
+    Tuple,
+    Union,
+    Callable,
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    Any,
+    List,
+    Sequence,
+    Iterable,
+)
 import copy
 import logging
+import os
 
+import numpy
 import amulet_nbt
 
-from PyMCTranslate.py3.api import Block, BlockEntity, Entity
+from PyMCTranslate.py3.api import Block, BlockEntity, Entity, get_properties_view
+from PyMCTranslate.py3.meta import translation_tables_dir
+from PyMCTranslate.py3.api.version.capabilities import (
+    MappingCapabilities,
+    analyse_mapping,
+)
 from .base import BaseTranslator, BaseSpecification
+from .cache import TranslationCache
+from .translation_table import load_translation_table
+from .state_id import BlockStateIds
+from .codec import BlockStateCodec
+from .neighbourhood import BlockNeighbourhood
 
 if TYPE_CHECKING:
     from PyMCTranslate.py3.api.version import Version
@@ -14,6 +37,10 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 BlockCoordinates = Tuple[int, int, int]
+TranslatedBlock = Union[
+    Tuple[Block, Optional[BlockEntity], bool],
+    Tuple[Entity, None, bool],
+]
 NotInit = object()
 
 
@@ -62,6 +89,8 @@ class BlockSpecification(BaseSpecification):
 
 
 class BlockTranslator(BaseTranslator):
+    _specification_class = BlockSpecification
+
     def __init__(
         self,
         translation_manager: "TranslationManager",
@@ -74,13 +103,22 @@ class BlockTranslator(BaseTranslator):
         *_,
     ):
         super().__init__(translation_manager, parent_version, database, "block")
-        self._cache = {  # only blocks without a block entity can be cached
-            ("to_universal", False): {},
-            ("to_universal", True): {},
-            ("from_universal", False): {},
-            ("from_universal", True): {},
-        }
         self._block_format = block_format
+        # identifies this version in the persistent cache
+        self._translation_table = NotInit
+        self._persistent_cache_key = f"{parent_version.platform}_{'_'.join(map(str, parent_version.version_number))}"
+        # the state id registry for each format. Created when first requested.
+        self._state_ids: Dict[bool, BlockStateIds] = {}
+        # the passthrough results of blocks that could not be translated. Key is direction, force_blockstate.
+        # The value is the extra_needed flag. These are cleared when the block registry is modified.
+        self._negative_cache: Dict[Tuple[str, bool], TranslationCache] = {
+            key: TranslationCache(translation_manager.cache_size) for key in self._cache
+        }
+        self._block_registry_revision = translation_manager.block_registry.revision
+        # the capabilities of each mapping. Key is namespace, base_name, direction, format key
+        self._capabilities: Dict[Tuple[str, str, str, str], MappingCapabilities] = {}
+        # the state codec for each block. Key is namespace, base_name, format key
+        self._codecs: Dict[Tuple[str, str, str], BlockStateCodec] = {}
 
         if parent_version.has_abstract_format:
             self._numerical_block_map_inverse: Dict[Tuple[str, str], int] = {
@@ -172,6 +210,7 @@ class BlockTranslator(BaseTranslator):
         block_id = None
         block_data = None
         block_tuple = (block.namespace, block.base_name)
+        properties = get_properties_view(block)
         if block.namespaced_name in self._translation_manager.block_registry:
             block_id = self._translation_manager.block_registry.private_to_int(
                 block.namespaced_name
@@ -180,19 +219,165 @@ class BlockTranslator(BaseTranslator):
             block_id = self._numerical_block_map_inverse[block_tuple]
         elif (
             block_tuple == ("minecraft", "numerical")
-            and "block_id" in block.properties
-            and isinstance(block.properties["block_id"], amulet_nbt.TAG_Int)
+            and "block_id" in properties
+            and isinstance(properties["block_id"], amulet_nbt.TAG_Int)
         ):
-            block_id = block.properties["block_id"].py_data
+            block_id = properties["block_id"].py_data
 
-        if "block_data" in block.properties and isinstance(
-            block.properties["block_data"], amulet_nbt.TAG_Int
+        if "block_data" in properties and isinstance(
+            properties["block_data"], amulet_nbt.TAG_Int
         ):
-            block_data = block.properties["block_data"].py_data
+            block_data = properties["block_data"].py_data
 
         if block_id is not None and block_data is not None:
             return block_id, block_data
 
+    def get_capabilities(
+        self,
+        direction: str,
+        namespace: str,
+        base_name: str,
+        force_blockstate: bool = False,
+    ) -> MappingCapabilities:
+        """
+        Find what the translation of a block needs beyond the block state without translating it.
+
+        This can be used to find the blocks that need a block entity, get_block_callback or block_location before translating.
+        The result is conservative so it may list data that is not read for every state of the block.
+
+        :param direction: "to_universal" or "from_universal"
+        :param namespace: The namespace of the input block.
+        :param base_name: The base name of the input block.
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :return: The MappingCapabilities of the mapping.
+        :raises KeyError: If the mapping does not exist.
+        """
+        key = (namespace, base_name, direction, self._format_key(force_blockstate))
+        capabilities = self._capabilities.get(key)
+        if capabilities is None:
+            capabilities = self._capabilities[key] = analyse_mapping(
+                self._get_shared_mapping(
+                    direction, namespace, base_name, force_blockstate
+                )
+            )
+        return capabilities
+
+    def ints_to_palette(
+        self, block_ids: numpy.ndarray, block_data: numpy.ndarray
+    ) -> Tuple[List["Block"], numpy.ndarray]:
+        """
+        Convert arrays of numerical block ids and data values to a palette of Block objects.
+        Each unique id and data pair is only converted once. See :meth:`ints_to_block`
+
+        >>> palette, indexes = version.block.ints_to_palette(block_ids, block_data)
+
+        :param block_ids: An integer array of block ids.
+        :param block_data: An integer array of block data values of the same shape as block_ids.
+        :return: A list of Block objects and an int32 array of indexes into that list with the same shape as the inputs.
+        """
+        block_ids = numpy.asarray(block_ids)
+        block_data = numpy.asarray(block_data)
+        if block_ids.shape != block_data.shape:
+            raise ValueError("block_ids and block_data must be the same shape")
+        keys = (block_ids.astype(numpy.int64) << 32) | (
+            block_data.astype(numpy.int64) & 0xFFFFFFFF
+        )
+        unique, inverse = numpy.unique(keys, return_inverse=True)
+        palette = [
+            self.ints_to_block(
+                key >> 32, numpy.int32(numpy.uint32(key & 0xFFFFFFFF)).item()
+            )
+            for key in unique.tolist()
+        ]
+        return palette, inverse.astype(numpy.int32).reshape(block_ids.shape)
+
+    def palette_to_ints(
+        self, palette: Sequence["Block"]
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Convert a palette of Block objects to numerical block ids and data values. See :meth:`block_to_ints`
+
+        >>> palette_ids, palette_data = version.block.palette_to_ints(palette)
+        >>> block_ids, block_data = palette_ids[indexes], palette_data[indexes]
+
+        :param palette: The sequence of blocks to convert.
+        :return: Two int32 arrays of the block id and data value for each block in the palette. Blocks that could not be converted are -1 in both arrays.
+        """
+        block_ids = numpy.full(len(palette), -1, dtype=numpy.int32)
+        block_data = numpy.full(len(palette), -1, dtype=numpy.int32)
+        lut: Dict[Block, Optional[Tuple[int, int]]] = {}
+        for index, block in enumerate(palette):
+            if block in lut:
+                ints = lut[block]
+            else:
+                ints = lut[block] = self.block_to_ints(block)
+            if ints is not None:
+                block_ids[index], block_data[index] = ints
+        return block_ids, block_data
+
+    def get_codec(
+        self, namespace: str, base_name: str, force_blockstate: bool = False
+    ) -> BlockStateCodec:
+        """
+        Get the codec that packs the properties of a block into an integer.
+
+        :param namespace: A namespace string as found using the ``namespaces`` method
+        :param base_name: A base name string as found using the ``base_name`` method
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :return: The BlockStateCodec for the block.
+        :raises KeyError: If the block is not in the specification.
+        """
+        key = (namespace, base_name, self._format_key(force_blockstate))
+        codec = self._codecs.get(key)
+        if codec is None:
+            codec = self._codecs[key] = BlockStateCodec(
+                namespace,
+                base_name,
+                self._get_shared_specification(namespace, base_name, force_blockstate),
+            )
+        return codec
+
+    def state_ids(self, force_blockstate: bool = False) -> BlockStateIds:
+        """
+        Get the registry of integer ids for every block state in the specification.
+
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :return: The BlockStateIds for the format.
+        """
+        force_blockstate = self._format_key(force_blockstate) == "blockstate"
+        state_ids = self._state_ids.get(force_blockstate)
+        if state_ids is None:
+            state_ids = self._state_ids[force_blockstate] = BlockStateIds(
+                self, force_blockstate
+            )
+        return state_ids
+
+    def block_to_state_id(
+        self, block: "Block", force_blockstate: bool = False
+    ) -> Optional[int]:
+        """
+        Get the dense integer id of a block state in this version.
+        The ids are stable as long as the specification does not change.
+
+        :param block: The block to find the id of.
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :return: The id or None if the block is not a valid state in the specification.
+        """
+        return self.state_ids(force_blockstate).block_to_state_id(block)
+
+    def state_id_to_block(
+        self, state_id: int, force_blockstate: bool = False
+    ) -> "Block":
+        """
+        Get the block state with the given id. This is the inverse of :meth:`block_to_state_id`.
+
+        :param state_id: The id of the block state.
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :return: A new Block instance.
+        :raises IndexError: If the id is out of range.
+        """
+        return self.state_ids(force_blockstate).state_id_to_block(state_id)
+
     def get_specification(
         self, namespace: str, base_name: str, force_blockstate: bool = False
     ) -> BlockSpecification:
@@ -200,6 +385,128 @@ class BlockTranslator(BaseTranslator):
             self._get_raw_specification(namespace, base_name, force_blockstate)
         )
 
+    def get_negative_cache(
+        self, direction: str, force_blockstate: bool = False
+    ) -> TranslationCache:
+        """
+        Get the cache of blocks that could not be translated in the given direction.
+        These are blocks that are not in the specification or that caused an error.
+
+        :param direction: "to_universal" or "from_universal"
+        :param force_blockstate: True to get the cache for the blockstate format. False to get the native format.
+        :return: The TranslationCache for the direction.
+        """
+        return self._negative_cache[(direction, force_blockstate)]
+
+    def set_cache_size(self, max_size: Optional[int]):
+        super().set_cache_size(max_size)
+        for cache in self._negative_cache.values():
+            cache.max_size = max_size
+
+    def clear_cache(self, direction: Optional[str] = None):
+        super().clear_cache(direction)
+        for (direction_, _), cache in self._negative_cache.items():
+            if direction is None or direction == direction_:
+                cache.clear()
+
+    def _get_negative(
+        self, direction: str, force_blockstate: bool, block: "Block"
+    ) -> Optional[bool]:
+        """
+        Check if a block is known to fail to translate.
+
+        :return: The extra_needed flag of the failed result or None if the block is not known to fail.
+        """
+        revision = self._translation_manager.block_registry.revision
+        if revision != self._block_registry_revision:
+            for cache in self._negative_cache.values():
+                cache.clear()
+            self._block_registry_revision = revision
+        return self._negative_cache[(direction, force_blockstate)].get(block)
+
+    def _set_negative(
+        self, direction: str, force_blockstate: bool, block: "Block", extra_needed: bool
+    ):
+        self._negative_cache[(direction, force_blockstate)][block] = extra_needed
+
+    def _get_table_translation(
+        self, direction: str, force_blockstate: bool, block: "Block"
+    ) -> Optional[TranslatedBlock]:
+        """Get the precomputed translation of a block state if the tables have been built."""
+        if self._translation_table is NotInit:
+            self._translation_table = load_translation_table(
+                os.path.join(
+                    translation_tables_dir,
+                    f"{os.path.basename(self._parent_version._version_path)}.json.gz",
+                )
+            )
+        if self._translation_table is None:
+            return None
+        try:
+            if direction == "to_universal":
+                specification = self._get_shared_specification(
+                    block.namespace, block.base_name, force_blockstate
+                )
+            else:
+                specification = self._universal_format.block._get_shared_specification(
+                    block.namespace, block.base_name
+                )
+        except KeyError:
+            return None
+        return self._translation_table.get(
+            direction, self._format_key(force_blockstate), block, specification
+        )
+
+    def _get_cached(
+        self, direction: str, force_blockstate: bool, block: "Block"
+    ) -> Optional[TranslatedBlock]:
+        """Get a cached translation from memory or the persistent cache if enabled."""
+        cache = self._cache[(direction, force_blockstate)]
+        cached = cache.get(block)
+        if cached is None and self._is_pure(direction, force_blockstate, block):
+            cached = self._get_table_translation(direction, force_blockstate, block)
+            if cached is None:
+                persistent_cache = self._translation_manager.persistent_cache
+                if persistent_cache is not None:
+                    cached = persistent_cache.get(
+                        self._persistent_cache_key, direction, force_blockstate, block
+                    )
+            if cached is not None:
+                output, extra_output, extra_needed = cached
+                cached = cache[block] = (
+                    self._intern(output),
+                    extra_output,
+                    extra_needed,
+                )
+        return cached
+
+    def _is_pure(self, direction: str, force_blockstate: bool, block: "Block") -> bool:
+        """
+        Can the translation of the block be stored in the translation tables and persistent cache.
+        Blocks that read the block entity, surrounding blocks or location and blocks without a mapping are never stored so there is no need to look them up.
+        """
+        try:
+            return self.get_capabilities(
+                direction, block.namespace, block.base_name, force_blockstate
+            ).pure
+        except KeyError:
+            return False
+
+    def _set_cached(
+        self,
+        direction: str,
+        force_blockstate: bool,
+        block: "Block",
+        result: TranslatedBlock,
+    ):
+        """Cache a translation in memory and in the persistent cache if enabled."""
+        self._cache[(direction, force_blockstate)][block] = result
+        persistent_cache = self._translation_manager.persistent_cache
+        if persistent_cache is not None:
+            persistent_cache.set(
+                self._persistent_cache_key, direction, force_blockstate, block, result
+            )
+
     def to_universal(
         self,
         block: "Block",
@@ -209,6 +516,7 @@ class BlockTranslator(BaseTranslator):
         get_block_callback: Callable[
             [Tuple[int, int, int]], Tuple[Block, Optional[BlockEntity]]
         ] = None,
+        shared: bool = False,
     ) -> Tuple[Block, Optional[BlockEntity], bool]:
         """
         Translate the given Block object and optional BlockEntity from the parent Version's format to the Universal format.
@@ -218,15 +526,43 @@ class BlockTranslator(BaseTranslator):
         :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
         :param block_location: The location of the block in the world
         :param get_block_callback: A callable with relative coordinates that returns a Block and optional BlockEntity
+        :param shared: If True a cached BlockEntity or Entity output is returned without being copied. It is shared with the cache and other callers so it must not be modified. Call ``.copy()`` on it to get a copy that can be modified.
         :return: A Block, optional BlockEntity and a bool. The bool specifies if block_location and get_block_callback are required to fully define the output data.
         """
+        output, extra_output, extra_needed, cacheable = self._to_universal(
+            block, block_entity, force_blockstate, block_location, get_block_callback
+        )
+        if cacheable and not shared:
+            # the cached version must not be modified by the caller
+            extra_output = copy.deepcopy(extra_output)
+        return output, extra_output, extra_needed
+
+    def _to_universal(
+        self,
+        block: "Block",
+        block_entity: Optional["BlockEntity"],
+        force_blockstate: bool,
+        block_location: BlockCoordinates,
+        get_block_callback: Optional[
+            Callable[[Tuple[int, int, int]], Tuple[Block, Optional[BlockEntity]]]
+        ],
+    ) -> Tuple[Block, Optional[BlockEntity], bool, bool]:
+        """
+        Translate a block to the universal format.
+        If the final bool is True the output is shared with the cache and must not be modified.
+
+        :return: The output Block, optional BlockEntity, extra_needed and cacheable.
+        """
         assert isinstance(block, Block), "block must be a Block instance"
-        cache_key = ("to_universal", force_blockstate)
         if block_entity is None:
-            if block in self._cache[cache_key]:
-                output, extra_output, extra_needed = self._cache[cache_key][block]
-                extra_output = copy.deepcopy(extra_output)
-                return output, extra_output, extra_needed
+            # only blocks without a block entity can be cached
+            # errors may depend on the surrounding blocks so are not reused if a callback is given
+            extra_needed = self._get_negative("to_universal", force_blockstate, block)
+            if extra_needed is False or (extra_needed and get_block_callback is None):
+                return block, None, extra_needed, False
+            cached = self._get_cached("to_universal", force_blockstate, block)
+            if cached is not None:
+                return (*cached, True)
         else:
             assert isinstance(
                 block_entity, BlockEntity
@@ -234,11 +570,11 @@ class BlockTranslator(BaseTranslator):
             block_entity = copy.deepcopy(block_entity)
 
         try:
-            input_spec = self._get_raw_specification(
+            input_spec = self._get_shared_specification(
                 block.namespace, block.base_name, force_blockstate
             )
-            mapping = self.get_mapping_to_universal(
-                block.namespace, block.base_name, force_blockstate
+            mapping = self._get_compiled_mapping(
+                "to_universal", block.namespace, block.base_name, force_blockstate
             )
         except KeyError:
             if self._parent_version.platform != "universal":
@@ -249,7 +585,9 @@ class BlockTranslator(BaseTranslator):
                     block,
                     self._parent_version,
                 )
-            return block, block_entity, False
+            if block_entity is None:
+                self._set_negative("to_universal", force_blockstate, block, False)
+            return block, block_entity, False, False
 
         output, extra_output, extra_needed, cacheable = self._translate(
             block,
@@ -261,12 +599,24 @@ class BlockTranslator(BaseTranslator):
             get_block_callback,
             block_entity,
             block_location,
+            on_error=(
+                None
+                if block_entity is not None or get_block_callback is not None
+                else lambda: self._set_negative(
+                    "to_universal", force_blockstate, block, True
+                )
+            ),
         )
 
         if cacheable:
-            self._cache[cache_key][block] = output, extra_output, extra_needed
+            self._set_cached(
+                "to_universal",
+                force_blockstate,
+                block,
+                (output, extra_output, extra_needed),
+            )
 
-        return output, copy.deepcopy(extra_output), extra_needed
+        return output, extra_output, extra_needed, cacheable
 
     def from_universal(
         self,
@@ -277,6 +627,7 @@ class BlockTranslator(BaseTranslator):
         get_block_callback: Callable[
             [Tuple[int, int, int]], Tuple[Block, Union[None, BlockEntity]]
         ] = None,
+        shared: bool = False,
     ) -> Union[
         Tuple[Block, Optional[BlockEntity], bool],
         Tuple[Entity, None, bool],
@@ -289,17 +640,48 @@ class BlockTranslator(BaseTranslator):
         :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
         :param block_location: The location of the block in the world
         :param get_block_callback: A callable with relative coordinates that returns a Block and optional BlockEntity
+        :param shared: If True a cached BlockEntity or Entity output is returned without being copied. It is shared with the cache and other callers so it must not be modified. Call ``.copy()`` on it to get a copy that can be modified.
         :return: There are two formats that can be returned. The first is a Block, optional BlockEntity and a bool. The second is an Entity, None and a bool. The bool specifies if block_location and get_block_callback are required to fully define the output data.
         """
+        output, extra_output, extra_needed, cacheable = self._from_universal(
+            block, block_entity, force_blockstate, block_location, get_block_callback
+        )
+        if cacheable and not shared:
+            # the cached version must not be modified by the caller
+            if isinstance(output, Entity):
+                output = copy.deepcopy(output)
+            extra_output = copy.deepcopy(extra_output)
+        return output, extra_output, extra_needed
+
+    def _from_universal(
+        self,
+        block: "Block",
+        block_entity: Optional["BlockEntity"],
+        force_blockstate: bool,
+        block_location: BlockCoordinates,
+        get_block_callback: Optional[
+            Callable[[Tuple[int, int, int]], Tuple[Block, Optional[BlockEntity]]]
+        ],
+    ) -> Union[
+        Tuple[Block, Optional[BlockEntity], bool, bool],
+        Tuple[Entity, None, bool, bool],
+    ]:
+        """
+        Translate a block from the universal format.
+        If the final bool is True the output is shared with the cache and must not be modified.
+
+        :return: The output Block and optional BlockEntity or Entity and None, extra_needed and cacheable.
+        """
         assert isinstance(block, Block), "block must be a Block instance"
-        cache_key = ("from_universal", force_blockstate)
         if block_entity is None:
-            if block in self._cache[cache_key]:
-                output, extra_output, extra_needed = self._cache[cache_key][block]
-                if isinstance(output, Entity):
-                    output = copy.deepcopy(output)
-                extra_output = copy.deepcopy(extra_output)
-                return output, extra_output, extra_needed
+            # only blocks without a block entity can be cached
+            # errors may depend on the surrounding blocks so are not reused if a callback is given
+            extra_needed = self._get_negative("from_universal", force_blockstate, block)
+            if extra_needed is False or (extra_needed and get_block_callback is None):
+                return block, None, extra_needed, False
+            cached = self._get_cached("from_universal", force_blockstate, block)
+            if cached is not None:
+                return (*cached, True)
         else:
             assert isinstance(
                 block_entity, BlockEntity
@@ -307,11 +689,11 @@ class BlockTranslator(BaseTranslator):
             block_entity = copy.deepcopy(block_entity)
 
         try:
-            input_spec = self._universal_format.block._get_raw_specification(
+            input_spec = self._universal_format.block._get_shared_specification(
                 block.namespace, block.base_name
             )
-            mapping = self.get_mapping_from_universal(
-                block.namespace, block.base_name, force_blockstate
+            mapping = self._get_compiled_mapping(
+                "from_universal", block.namespace, block.base_name, force_blockstate
             )
         except KeyError:
             if block.namespace == "minecraft" and list(block.properties.keys()) == [
@@ -328,7 +710,9 @@ class BlockTranslator(BaseTranslator):
                     block,
                     self._parent_version,
                 )
-            return block, block_entity, False
+            if block_entity is None:
+                self._set_negative("from_universal", force_blockstate, block, False)
+            return block, block_entity, False, False
 
         output, extra_output, extra_needed, cacheable = self._translate(
             block,
@@ -340,12 +724,177 @@ class BlockTranslator(BaseTranslator):
             get_block_callback,
             block_entity,
             block_location,
+            on_error=(
+                None
+                if block_entity is not None or get_block_callback is not None
+                else lambda: self._set_negative(
+                    "from_universal", force_blockstate, block, True
+                )
+            ),
         )
 
         if cacheable:
-            self._cache[cache_key][block] = output, extra_output, extra_needed
+            self._set_cached(
+                "from_universal",
+                force_blockstate,
+                block,
+                (output, extra_output, extra_needed),
+            )
 
-        if isinstance(output, Entity):
-            output = copy.deepcopy(output)
-        extra_output = copy.deepcopy(extra_output)
-        return output, extra_output, extra_needed
+        return output, extra_output, extra_needed, cacheable
+
+    def to_universal_palette(
+        self,
+        blocks: Sequence["Block"],
+        block_entities: Optional[Sequence[Optional["BlockEntity"]]] = None,
+        force_blockstate: bool = False,
+        shared: bool = False,
+    ) -> Tuple[List[TranslatedBlock], numpy.ndarray]:
+        """
+        Translate a palette of Block objects from the parent Version's format to the Universal format.
+
+        Each unique block is only translated once.
+        Blocks with a block entity are translated individually.
+
+        >>> palette, remap = version.block.to_universal_palette(blocks)
+        >>> chunk_array = numpy.take(remap, chunk_array)
+
+        :param blocks: The sequence of blocks to translate
+        :param block_entities: An optional sequence of the same length as blocks containing a BlockEntity or None for each block
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :param shared: If True cached BlockEntity and Entity outputs are not copied. See :meth:`to_universal`
+        :return: A list of Block, optional BlockEntity and bool as returned by :meth:`to_universal` and an int32 array mapping each index in blocks to an index in that list.
+        """
+        return self._translate_palette(
+            self.to_universal, blocks, block_entities, force_blockstate, shared
+        )
+
+    def from_universal_palette(
+        self,
+        blocks: Sequence["Block"],
+        block_entities: Optional[Sequence[Optional["BlockEntity"]]] = None,
+        force_blockstate: bool = False,
+        shared: bool = False,
+    ) -> Tuple[List[TranslatedBlock], numpy.ndarray]:
+        """
+        Translate a palette of Block objects from the Universal format to the parent Version's format.
+
+        Each unique block is only translated once.
+        Blocks with a block entity are translated individually.
+
+        :param blocks: The sequence of blocks to translate
+        :param block_entities: An optional sequence of the same length as blocks containing a BlockEntity or None for each block
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :param shared: If True cached BlockEntity and Entity outputs are not copied. See :meth:`from_universal`
+        :return: A list of outputs as returned by :meth:`from_universal` and an int32 array mapping each index in blocks to an index in that list.
+        """
+        return self._translate_palette(
+            self.from_universal, blocks, block_entities, force_blockstate, shared
+        )
+
+    def to_universal_neighbourhood(
+        self,
+        neighbourhood: BlockNeighbourhood,
+        locations: Optional[Iterable[BlockCoordinates]] = None,
+        force_blockstate: bool = False,
+        shared: bool = False,
+    ) -> Dict[BlockCoordinates, TranslatedBlock]:
+        """
+        Translate blocks in a region from the parent Version's format to the Universal format.
+        The surrounding blocks and block entities are found in the neighbourhood so get_block_callback is not needed.
+
+        :param neighbourhood: The blocks and block entities in the region.
+        :param locations: The locations in the world to translate. Defaults to every location not in the padding.
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :param shared: If True cached BlockEntity and Entity outputs are not copied. See :meth:`to_universal`
+        :return: A dictionary mapping each location to the output of :meth:`to_universal`
+        """
+        return self._translate_neighbourhood(
+            self.to_universal, neighbourhood, locations, force_blockstate, shared
+        )
+
+    def from_universal_neighbourhood(
+        self,
+        neighbourhood: BlockNeighbourhood,
+        locations: Optional[Iterable[BlockCoordinates]] = None,
+        force_blockstate: bool = False,
+        shared: bool = False,
+    ) -> Dict[BlockCoordinates, TranslatedBlock]:
+        """
+        Translate blocks in a region from the Universal format to the parent Version's format.
+        The surrounding blocks and block entities are found in the neighbourhood so get_block_callback is not needed.
+
+        :param neighbourhood: The universal blocks and block entities in the region.
+        :param locations: The locations in the world to translate. Defaults to every location not in the padding.
+        :param force_blockstate: True to get the blockstate format. False to get the native format (these are sometimes the same)
+        :param shared: If True cached BlockEntity and Entity outputs are not copied. See :meth:`from_universal`
+        :return: A dictionary mapping each location to the output of :meth:`from_universal`
+        """
+        return self._translate_neighbourhood(
+            self.from_universal, neighbourhood, locations, force_blockstate, shared
+        )
+
+    @staticmethod
+    def _translate_neighbourhood(
+        translate: Callable[..., TranslatedBlock],
+        neighbourhood: BlockNeighbourhood,
+        locations: Optional[Iterable[BlockCoordinates]],
+        force_blockstate: bool,
+        shared: bool,
+    ) -> Dict[BlockCoordinates, TranslatedBlock]:
+        if locations is None:
+            locations = neighbourhood.locations()
+        translated = {}
+        for location in locations:
+            location = tuple(location)
+            block, block_entity = neighbourhood.get_block(location)
+            translated[location] = translate(
+                block,
+                block_entity,
+                force_blockstate,
+                location,
+                neighbourhood.get_block_callback(location),
+                shared=shared,
+            )
+        return translated
+
+    @staticmethod
+    def _translate_palette(
+        translate: Callable[..., TranslatedBlock],
+        blocks: Sequence["Block"],
+        block_entities: Optional[Sequence[Optional["BlockEntity"]]],
+        force_blockstate: bool,
+        shared: bool,
+    ) -> Tuple[List[TranslatedBlock], numpy.ndarray]:
+        if block_entities is not None and len(block_entities) != len(blocks):
+            raise ValueError("block_entities must be the same length as blocks")
+        palette: List[TranslatedBlock] = []
+        remap = numpy.empty(len(blocks), dtype=numpy.int32)
+        # input block to palette index
+        input_lut: Dict[Block, int] = {}
+        # output block and extra_needed to palette index. Only used for outputs without a block entity.
+        output_lut: Dict[Tuple[Block, bool], int] = {}
+
+        for index, block in enumerate(blocks):
+            block_entity = None if block_entities is None else block_entities[index]
+            if block_entity is None and block in input_lut:
+                remap[index] = input_lut[block]
+                continue
+
+            translated = translate(block, block_entity, force_blockstate, shared=shared)
+            output, extra_output, extra_needed = translated
+            if extra_output is None and isinstance(output, Block):
+                output_key = (output, extra_needed)
+                if output_key not in output_lut:
+                    output_lut[output_key] = len(palette)
+                    palette.append(translated)
+                palette_index = output_lut[output_key]
+            else:
+                palette_index = len(palette)
+                palette.append(translated)
+
+            if block_entity is None:
+                input_lut[block] = palette_index
+            remap[index] = palette_index
+
+        return palette, remap
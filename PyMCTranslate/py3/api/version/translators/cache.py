@@ -0,0 +1,117 @@
+from typing import Optional, Any, Hashable, NamedTuple
+from collections import OrderedDict
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: Optional[int]
+
+
+class TranslationCache:
+    """
+    A cache of translation results with an optional maximum size.
+
+    If a maximum size is set the least recently used entry is evicted when the cache is full.
+    The number of hits, misses and evictions are counted so that the effectiveness of the cache can be measured.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        :param max_size: The maximum number of entries. None for unlimited.
+        """
+        self._data: OrderedDict = OrderedDict()
+        self._max_size: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """
+        The maximum number of entries in the cache. None for unlimited.
+
+        If this is reduced below the current size the least recently used entries are evicted.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: Optional[int]):
+        if max_size is not None and (not isinstance(max_size, int) or max_size < 0):
+            raise ValueError("max_size must be None or a positive int")
+        self._max_size = max_size
+        self._evict()
+
+    def _evict(self):
+        if self._max_size is not None:
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get the value for the key and record a hit or miss.
+
+        :param key: The key to look up.
+        :param default: The value to return if the key is not in the cache.
+        :return: The cached value or default.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self._misses += 1
+            return default
+        self._hits += 1
+        if self._max_size is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self._data[key] = value
+        if self._max_size is not None:
+            self._data.move_to_end(key)
+            self._evict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        """Remove all entries from the cache. The counters are not reset."""
+        self._data.clear()
+
+    def reset_stats(self):
+        """Reset the hit, miss and eviction counters to zero."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that found a value."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that did not find a value."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """The number of entries removed to keep the cache within its maximum size."""
+        return self._evictions
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the counters and size of the cache."""
+        return CacheStats(
+            self._hits, self._misses, self._evictions, len(self._data), self._max_size
+        )
+
+    def __repr__(self):
+        return f"TranslationCache({self.stats})"
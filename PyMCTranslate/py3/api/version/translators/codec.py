@@ -0,0 +1,172 @@
+from typing import Dict, Tuple, Optional, Iterable, Mapping
+
+import numpy
+import amulet_nbt
+
+from PyMCTranslate.py3.api import Block
+from .translation_table import _state_indexer, _state_index
+
+
+class BlockStateCodec:
+    """
+    Pack the properties of a block into a single integer and back.
+
+    Each property is stored as the index of its value in the specification using mixed radix.
+    The last property changes the fastest which matches the order of :func:`translation_table.blockstates`.
+
+    .. important::
+           This class should not be directly initiated. Use ``BlockTranslator.get_codec`` to get an instance.
+    """
+
+    def __init__(self, namespace: str, base_name: str, specification: dict):
+        """
+        :param namespace: The namespace of the block.
+        :param base_name: The base name of the block.
+        :param specification: The raw specification of the block.
+        """
+        self._namespace = namespace
+        self._base_name = base_name
+        self._indexer = _state_indexer(specification)
+        self._properties: Tuple[Tuple[str, Tuple[amulet_nbt.AnyNBT, ...], int], ...] = (
+            tuple(
+                (key, tuple(amulet_nbt.from_snbt(val) for val in values), stride)
+                for key, values, stride in self._indexer
+            )
+        )
+        if self._indexer:
+            self._state_count = self._indexer[0][2] * len(self._indexer[0][1])
+        else:
+            self._state_count = 1
+
+    def __repr__(self):
+        return f"PyMCTranslate.BlockStateCodec({self._namespace}:{self._base_name})"
+
+    def __len__(self) -> int:
+        """The number of states the block has."""
+        return self._state_count
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    @property
+    def base_name(self) -> str:
+        return self._base_name
+
+    @property
+    def bits(self) -> int:
+        """The number of bits needed to store an encoded state."""
+        return (self._state_count - 1).bit_length()
+
+    @property
+    def property_names(self) -> Tuple[str, ...]:
+        """The names of the properties in the order they are packed."""
+        return tuple(key for key, _, _ in self._properties)
+
+    def encode(self, block: Block) -> Optional[int]:
+        """
+        Pack the properties of a block into an integer.
+
+        :param block: The block to encode. The namespace and base name must match the codec.
+        :return: The packed state or None if the block is not a valid state.
+        """
+        if (
+            block.namespace != self._namespace
+            or block.base_name != self._base_name
+            or block.extra_blocks
+        ):
+            return None
+        return _state_index(self._indexer, block)
+
+    def decode(self, state: int) -> Block:
+        """
+        Unpack an integer created by :meth:`encode` into a Block.
+
+        :param state: The packed state.
+        :return: A new Block instance.
+        :raises IndexError: If the state is out of range.
+        """
+        state = int(state)
+        if not 0 <= state < self._state_count:
+            raise IndexError(f"State {state} is out of range for {self}")
+        return Block(
+            self._namespace,
+            self._base_name,
+            {
+                key: values[state // stride % len(values)]
+                for key, values, stride in self._properties
+            },
+        )
+
+    def encode_array(self, blocks: Iterable[Block]) -> numpy.ndarray:
+        """
+        Encode a number of blocks.
+
+        :param blocks: The blocks to encode.
+        :return: An int32 array of the packed states. Invalid blocks are -1.
+        """
+        states = []
+        lut: Dict[Block, int] = {}
+        for block in blocks:
+            state = lut.get(block)
+            if state is None:
+                state = self.encode(block)
+                if state is None:
+                    state = -1
+                lut[block] = state
+            states.append(state)
+        return numpy.array(states, dtype=numpy.int32)
+
+    def decode_array(self, states: numpy.ndarray) -> numpy.ndarray:
+        """
+        Decode an array of packed states. Each unique state is only decoded once.
+
+        :param states: An integer array of packed states.
+        :return: An object array of the same shape containing Block instances.
+        """
+        states = numpy.asarray(states)
+        unique, inverse = numpy.unique(states, return_inverse=True)
+        blocks = numpy.empty(len(unique), dtype=object)
+        for index, state in enumerate(unique):
+            blocks[index] = self.decode(state)
+        return blocks[inverse].reshape(states.shape)
+
+    def encode_indexes(self, indexes: Mapping[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Pack arrays of property value indexes into an array of states.
+        This is the inverse of :meth:`decode_indexes`.
+
+        :param indexes: A map from every property name to an integer array of the index of the value in the specification.
+        :return: An int32 array of packed states.
+        """
+        states = numpy.zeros(
+            numpy.broadcast(*indexes.values()).shape if indexes else (), numpy.int32
+        )
+        for key, values, stride in self._properties:
+            states += numpy.asarray(indexes[key], dtype=numpy.int32) * stride
+        return states
+
+    def decode_indexes(self, states: numpy.ndarray) -> Dict[str, numpy.ndarray]:
+        """
+        Unpack an array of states into an array of value indexes for each property.
+
+        :param states: An integer array of packed states.
+        :return: A map from property name to an array of the index of the value in the specification.
+        """
+        states = numpy.asarray(states)
+        return {
+            key: states // stride % len(values)
+            for key, values, stride in self._properties
+        }
+
+    def values(self, property_name: str) -> Tuple[amulet_nbt.AnyNBT, ...]:
+        """
+        Get the valid values of a property in index order.
+
+        :param property_name: The name of the property.
+        :return: A tuple of NBT values.
+        """
+        for key, values, _ in self._properties:
+            if key == property_name:
+                return values
+        raise KeyError(property_name)
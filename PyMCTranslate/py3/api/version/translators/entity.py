@@ -43,6 +43,8 @@ class EntitySpecification(BaseSpecification):
 
 
 class EntityTranslator(BaseTranslator):
+    _specification_class = EntitySpecification
+
     def __init__(
         self,
         translation_manager: "TranslationManager",
@@ -66,13 +68,19 @@ class EntityTranslator(BaseTranslator):
         :return: The translated Entity
         """
         assert isinstance(entity, Entity), "entity must be an Entity instance"
+        # If the translation does not depend on the entity nbt the result only depends on the entity name.
+        cache = self._cache[("to_universal", force_blockstate)]
+        cache_key = (entity.namespace, entity.base_name)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
         try:
-            input_spec = self._get_raw_specification(
+            input_spec = self._get_shared_specification(
                 entity.namespace, entity.base_name, force_blockstate
             )
-            mapping = self.get_mapping_to_universal(
-                entity.namespace, entity.base_name, force_blockstate
+            mapping = self._get_compiled_mapping(
+                "to_universal", entity.namespace, entity.base_name, force_blockstate
             )
         except KeyError:
             log.warning(
@@ -80,14 +88,21 @@ class EntityTranslator(BaseTranslator):
             )
             return copy.deepcopy(entity)
 
-        output, _, _, _ = self._translate(
-            copy.deepcopy(entity),
+        output, _, _, cacheable = self._translate(
+            entity,
             input_spec,
             mapping,
             self._universal_format,
             True,
             "to universal",
         )
+        if output is entity:
+            # the input is returned if the translation failed
+            output = copy.deepcopy(entity)
+        elif cacheable:
+            cache[cache_key] = output
+            # the cached version must not be modified by the caller
+            output = copy.deepcopy(output)
 
         return output
 
@@ -102,13 +117,18 @@ class EntityTranslator(BaseTranslator):
         :return: There are two formats that can be returned. The first is a Block and an optional BlockEntity. The second is an Entity and None.
         """
         assert isinstance(entity, Entity), "entity must be an Entity instance"
+        cache = self._cache[("from_universal", force_blockstate)]
+        cache_key = (entity.namespace, entity.base_name)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
         try:
-            input_spec = self._universal_format.entity._get_raw_specification(
+            input_spec = self._universal_format.entity._get_shared_specification(
                 entity.namespace, entity.base_name
             )
-            mapping = self.get_mapping_from_universal(
-                entity.namespace, entity.base_name, force_blockstate
+            mapping = self._get_compiled_mapping(
+                "from_universal", entity.namespace, entity.base_name, force_blockstate
             )
         except KeyError:
             log.warning(
@@ -116,13 +136,20 @@ class EntityTranslator(BaseTranslator):
             )
             return copy.deepcopy(entity), None
 
-        output, extra_output, _, _ = self._translate(
-            copy.deepcopy(entity),
+        output, extra_output, _, cacheable = self._translate(
+            entity,
             input_spec,
             mapping,
             self._parent_version,
             force_blockstate,
             "from_universal",
         )
+        if output is entity:
+            # the input is returned if the translation failed
+            output = copy.deepcopy(entity)
+        elif cacheable:
+            cache[cache_key] = output, extra_output
+            # the cached version must not be modified by the caller
+            output, extra_output = copy.deepcopy((output, extra_output))
 
         return output, extra_output
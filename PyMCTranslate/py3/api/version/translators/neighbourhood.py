@@ -0,0 +1,115 @@
+from typing import Tuple, Optional, Sequence, Dict, Callable, Generator
+
+import numpy
+
+from PyMCTranslate.py3.api import Block, BlockEntity, ChunkLoadError
+
+BlockCoordinates = Tuple[int, int, int]
+GetBlockCallback = Callable[[BlockCoordinates], Tuple[Block, Optional[BlockEntity]]]
+
+
+class BlockNeighbourhood:
+    """
+    A region of blocks stored as a palette and an array of palette indexes.
+
+    This is used to translate blocks that depend on the surrounding blocks.
+    The surrounding blocks are found by indexing the array rather than calling back into the caller's code.
+
+    >>> neighbourhood = BlockNeighbourhood(palette, array, block_entities, origin=(cx * 16 - 1, -65, cz * 16 - 1), padding=1)
+    >>> results = version.block.to_universal_neighbourhood(neighbourhood)
+    """
+
+    def __init__(
+        self,
+        palette: Sequence[Block],
+        array: numpy.ndarray,
+        block_entities: Optional[Dict[BlockCoordinates, BlockEntity]] = None,
+        origin: BlockCoordinates = (0, 0, 0),
+        padding: int = 0,
+    ):
+        """
+        :param palette: The blocks the array indexes into.
+        :param array: A 3D integer array of palette indexes in x, y, z order.
+        :param block_entities: The block entities in the region keyed by their location in the world.
+        :param origin: The location in the world of array[0, 0, 0].
+        :param padding: The number of blocks around the edge of the array that are only used as neighbours.
+        """
+        array = numpy.asarray(array)
+        if array.ndim != 3:
+            raise ValueError("array must be three dimensional")
+        if padding < 0 or any(2 * padding > size for size in array.shape):
+            raise ValueError("padding is larger than the array")
+        self._palette = palette
+        self._array = array
+        self._block_entities = block_entities or {}
+        self._origin = tuple(int(v) for v in origin)
+        self._padding = padding
+
+    @property
+    def palette(self) -> Sequence[Block]:
+        return self._palette
+
+    @property
+    def array(self) -> numpy.ndarray:
+        return self._array
+
+    @property
+    def block_entities(self) -> Dict[BlockCoordinates, BlockEntity]:
+        return self._block_entities
+
+    @property
+    def origin(self) -> BlockCoordinates:
+        """The location in the world of array[0, 0, 0]."""
+        return self._origin
+
+    @property
+    def padding(self) -> int:
+        """The number of blocks around the edge of the array that are only used as neighbours."""
+        return self._padding
+
+    def get_block(
+        self, location: BlockCoordinates
+    ) -> Tuple[Block, Optional[BlockEntity]]:
+        """
+        Get the block and block entity at a location in the world.
+
+        :param location: The location in the world.
+        :return: The Block and optional BlockEntity at the location.
+        :raises ChunkLoadError: If the location is outside the array.
+        """
+        x, y, z = location
+        ox, oy, oz = self._origin
+        index = (x - ox, y - oy, z - oz)
+        if not all(0 <= i < size for i, size in zip(index, self._array.shape)):
+            raise ChunkLoadError(f"{location} is outside the neighbourhood")
+        return (
+            self._palette[int(self._array[index])],
+            self._block_entities.get((x, y, z)),
+        )
+
+    def get_block_callback(self, location: BlockCoordinates) -> GetBlockCallback:
+        """
+        Get a callback for the block at the given location that finds the surrounding blocks in the array.
+
+        :param location: The location in the world of the block being translated.
+        :return: A callable with relative coordinates that returns a Block and optional BlockEntity.
+        """
+        x, y, z = location
+
+        def get_block_callback(
+            relative_location: BlockCoordinates,
+        ) -> Tuple[Block, Optional[BlockEntity]]:
+            dx, dy, dz = relative_location
+            return self.get_block((x + dx, y + dy, z + dz))
+
+        return get_block_callback
+
+    def locations(self) -> Generator[BlockCoordinates, None, None]:
+        """Get the location in the world of every block that is not in the padding."""
+        padding = self._padding
+        ox, oy, oz = self._origin
+        sx, sy, sz = self._array.shape
+        for x in range(padding, sx - padding):
+            for y in range(padding, sy - padding):
+                for z in range(padding, sz - padding):
+                    yield ox + x, oy + y, oz + z
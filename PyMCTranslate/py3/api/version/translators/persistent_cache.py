@@ -0,0 +1,189 @@
+"""
+An on disk cache of block translation results that can be shared between processes.
+
+Only results that do not depend on the block entity or the surrounding blocks are stored.
+The data is stored in an sqlite database so that multiple processes can read and write it at the same time.
+Entries are stored with the build number that created them and only entries from the current build are read.
+Installs of different builds can share a database without removing each other's entries.
+"""
+
+from typing import Optional, List, Tuple
+import json
+import os
+import sqlite3
+import threading
+import atexit
+import logging
+
+from PyMCTranslate.py3.meta import build_number
+from PyMCTranslate.py3.api import Block
+from .block import TranslatedBlock
+from .serialise import pack_translation, unpack_translation
+
+log = logging.getLogger(__name__)
+
+
+class PersistentTranslationCache:
+    """
+    A cache of block translation results stored in an sqlite database.
+
+    Lookups are read from the database when they are not in memory.
+    New results are written in batches to reduce the number of transactions.
+    """
+
+    def __init__(self, path: str, batch_size: int = 256):
+        """
+        :param path: The path to the database file. It is created if it does not exist.
+        :param batch_size: The number of new results to collect before writing them to the database.
+        """
+        self._path = path
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[int, str, str, int, str, str]] = []
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._connect()
+        atexit.register(self.flush)
+
+    @property
+    def path(self) -> str:
+        """The path to the database file."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        # a connection must not be shared with a forked process
+        if self._connection is None or self._pid != os.getpid():
+            if self._pid != os.getpid():
+                self._pending.clear()
+            self._pid = os.getpid()
+            connection = sqlite3.connect(
+                self._path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "build_number INTEGER NOT NULL, "
+                    "version TEXT NOT NULL, "
+                    "direction TEXT NOT NULL, "
+                    "force_blockstate INTEGER NOT NULL, "
+                    "block TEXT NOT NULL, "
+                    "result TEXT NOT NULL, "
+                    "PRIMARY KEY (build_number, version, direction, force_blockstate, block)"
+                    ")"
+                )
+            self._connection = connection
+        return self._connection
+
+    def get(
+        self, version: str, direction: str, force_blockstate: bool, block: Block
+    ) -> Optional[TranslatedBlock]:
+        """
+        Get a stored translation result.
+
+        :param version: A string identifying the version that did the translation.
+        :param direction: "to_universal" or "from_universal"
+        :param force_blockstate: The force_blockstate value used in the translation.
+        :param block: The input block.
+        :return: The stored result or None if it is not stored.
+        """
+        with self._lock:
+            try:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT result FROM translations WHERE build_number = ? AND version = ? AND direction = ? AND force_blockstate = ? AND block = ?",
+                        (
+                            build_number,
+                            version,
+                            direction,
+                            int(force_blockstate),
+                            block.full_blockstate,
+                        ),
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error:
+                log.warning(
+                    f"Could not read from the translation cache {self._path}",
+                    exc_info=True,
+                )
+                return None
+        if row is None:
+            return None
+        try:
+            return unpack_translation(json.loads(row[0]))
+        except Exception:
+            log.warning(f"Could not load the cached translation for {block}")
+            return None
+
+    def set(
+        self,
+        version: str,
+        direction: str,
+        force_blockstate: bool,
+        block: Block,
+        result: TranslatedBlock,
+    ):
+        """
+        Store a translation result.
+        The result is written to the database when the batch is full or :meth:`flush` is called.
+
+        :param version: A string identifying the version that did the translation.
+        :param direction: "to_universal" or "from_universal"
+        :param force_blockstate: The force_blockstate value used in the translation.
+        :param block: The input block.
+        :param result: The output of the translation.
+        """
+        with self._lock:
+            self._pending.append(
+                (
+                    build_number,
+                    version,
+                    direction,
+                    int(force_blockstate),
+                    block.full_blockstate,
+                    json.dumps(pack_translation(result)),
+                )
+            )
+            if len(self._pending) >= self._batch_size:
+                self._flush()
+
+    def _flush(self):
+        if self._pending:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.executemany(
+                        "INSERT OR IGNORE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                        self._pending,
+                    )
+            except sqlite3.Error:
+                log.warning(
+                    f"Could not write to the translation cache {self._path}",
+                    exc_info=True,
+                )
+            self._pending.clear()
+
+    def flush(self):
+        """Write all pending results to the database."""
+        with self._lock:
+            self._flush()
+
+    def clear(self):
+        """Remove all stored results."""
+        with self._lock:
+            self._pending.clear()
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM translations")
+
+    def close(self):
+        """Write all pending results and close the database."""
+        with self._lock:
+            self._flush()
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+        atexit.unregister(self.flush)
@@ -0,0 +1,111 @@
+"""
+Convert blocks, entities and block translation results to and from json compatible data.
+This is used to store translations and send them between processes.
+"""
+
+from typing import TYPE_CHECKING, Optional, Union, List
+
+import amulet_nbt
+from amulet_nbt import NamedTag
+
+from PyMCTranslate.py3.api import Block, BlockEntity, Entity
+
+if TYPE_CHECKING:
+    from .block import TranslatedBlock
+
+
+def pack_entity(entity: Union[BlockEntity, Entity, None]) -> Optional[list]:
+    """
+    Convert a BlockEntity or Entity to a json compatible list. The location is not stored.
+
+    :param entity: The BlockEntity, Entity or None.
+    :return: The json compatible data or None.
+    """
+    if entity is None:
+        return None
+    return [
+        entity.namespace,
+        entity.base_name,
+        entity.nbt.name,
+        entity.nbt.tag.to_snbt(),
+    ]
+
+
+def _unpack_nbt(name: str, snbt: str) -> NamedTag:
+    return NamedTag(amulet_nbt.from_snbt(snbt), name)
+
+
+def unpack_block_entity(data: Optional[list]) -> Optional[BlockEntity]:
+    """
+    Convert the data created by :func:`pack_entity` to a BlockEntity at the origin.
+
+    :param data: The json compatible data or None.
+    :return: The BlockEntity or None.
+    """
+    if data is None:
+        return None
+    namespace, base_name, name, snbt = data
+    return BlockEntity(namespace, base_name, 0, 0, 0, _unpack_nbt(name, snbt))
+
+
+def unpack_entity(data: list) -> Entity:
+    """
+    Convert the data created by :func:`pack_entity` to an Entity at the origin.
+
+    :param data: The json compatible data.
+    :return: The Entity.
+    """
+    namespace, base_name, name, snbt = data
+    return Entity(namespace, base_name, 0.0, 0.0, 0.0, _unpack_nbt(name, snbt))
+
+
+def pack_block(block: Block) -> List[str]:
+    """
+    Convert a Block to a json compatible list.
+
+    :param block: The block to convert. Extra blocks are included.
+    :return: The SNBT blockstate of each layer in the block.
+    """
+    return [layer.snbt_blockstate for layer in block.block_tuple]
+
+
+def unpack_block(data: List[str]) -> Block:
+    """
+    Convert the data created by :func:`pack_block` back to a Block.
+
+    :param data: The json compatible data.
+    :return: The Block.
+    """
+    block = Block.from_snbt_blockstate(data[0])
+    for layer in data[1:]:
+        block += Block.from_snbt_blockstate(layer)
+    return block
+
+
+def pack_translation(result: "TranslatedBlock") -> list:
+    """
+    Convert the output of BlockTranslator.to_universal or from_universal to a json compatible list.
+
+    :param result: The Block, optional BlockEntity and extra_needed or the Entity, None and extra_needed.
+    :return: The json compatible data.
+    """
+    output, extra_output, extra_needed = result
+    if isinstance(output, Entity):
+        return ["entity", pack_entity(output), extra_needed]
+    return ["block", output.snbt_blockstate, pack_entity(extra_output), extra_needed]
+
+
+def unpack_translation(data: list) -> "TranslatedBlock":
+    """
+    Convert the data created by :func:`pack_translation` back to the translation result.
+
+    :param data: The json compatible data.
+    :return: The Block, optional BlockEntity and extra_needed or the Entity, None and extra_needed.
+    """
+    if data[0] == "entity":
+        return unpack_entity(data[1]), None, data[2]
+    return (
+        Block.from_snbt_blockstate(data[1]),
+        unpack_block_entity(data[2]),
+        data[3],
+    )
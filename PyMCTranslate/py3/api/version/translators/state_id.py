@@ -0,0 +1,76 @@
+"""
+Dense integer ids for every block state in a version's specification.
+
+The blocks are sorted by namespace and then base name.
+The states of each block are numbered by its :class:`BlockStateCodec`
+starting from the number of states in all the blocks before it.
+The ids are stable as long as the specification does not change.
+"""
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Optional
+import bisect
+
+from PyMCTranslate.py3.api import Block
+from .codec import BlockStateCodec
+
+if TYPE_CHECKING:
+    from .block import BlockTranslator
+
+
+class BlockStateIds:
+    """
+    Map between the block states in the specification of a version and integer ids.
+
+    .. important::
+           This class should not be directly initiated. Use ``BlockTranslator.state_ids`` to get an instance.
+    """
+
+    def __init__(self, translator: "BlockTranslator", force_blockstate: bool = False):
+        # (namespace, base_name) to the first id and the codec
+        self._blocks: Dict[Tuple[str, str], Tuple[int, BlockStateCodec]] = {}
+        # the first id of each block in id order and the matching codec
+        self._offsets: List[int] = []
+        self._codecs: List[BlockStateCodec] = []
+        offset = 0
+        for namespace in sorted(translator.namespaces(force_blockstate)):
+            for base_name in sorted(translator.base_names(namespace, force_blockstate)):
+                codec = translator.get_codec(namespace, base_name, force_blockstate)
+                self._blocks[(namespace, base_name)] = (offset, codec)
+                self._offsets.append(offset)
+                self._codecs.append(codec)
+                offset += len(codec)
+        self._count = offset
+
+    def __len__(self) -> int:
+        """The number of block states."""
+        return self._count
+
+    def block_to_state_id(self, block: "Block") -> Optional[int]:
+        """
+        Get the id of a block state.
+
+        :param block: The block to find the id of.
+        :return: The id or None if the block is not in the specification.
+        """
+        entry = self._blocks.get((block.namespace, block.base_name))
+        if entry is None:
+            return None
+        offset, codec = entry
+        state = codec.encode(block)
+        if state is None:
+            return None
+        return offset + state
+
+    def state_id_to_block(self, state_id: int) -> "Block":
+        """
+        Get the block state with the given id.
+
+        :param state_id: The id of the block state.
+        :return: A new Block instance.
+        :raises IndexError: If the id is out of range.
+        """
+        state_id = int(state_id)
+        if not 0 <= state_id < self._count:
+            raise IndexError(f"Block state id {state_id} is out of range")
+        block_index = bisect.bisect_right(self._offsets, state_id) - 1
+        return self._codecs[block_index].decode(state_id - self._offsets[block_index])
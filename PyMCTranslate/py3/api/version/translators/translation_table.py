@@ -0,0 +1,154 @@
+"""
+Precomputed block translations for every state in the specifications.
+
+The tables are written by build_tools/translation_tables.py
+
+Format (one json.gz file per version)
+    {
+        "palette": [<translation packed by serialise.pack_translation>, ...],
+        "to_universal" | "from_universal": {
+            "numerical" | "blockstate": {
+                namespace: {
+                    base_name: [<palette index or -1 if the state could not be cached>, ...]
+                }
+            }
+        }
+    }
+
+The states of each block are stored in the order given by :func:`blockstates`.
+"""
+
+from typing import TYPE_CHECKING, Dict, Tuple, Optional, Generator
+import itertools
+import os
+
+import amulet_nbt
+
+from PyMCTranslate.py3.api import Block, get_properties_view
+from PyMCTranslate.py3.util.json_gz import load_json_gz
+from .serialise import unpack_translation
+
+if TYPE_CHECKING:
+    from .block import TranslatedBlock
+
+# property name, snbt value to index, stride
+StateIndexer = Tuple[Tuple[str, Dict[str, int], int], ...]
+
+
+def blockstates(
+    specification: dict, namespace: str, base_name: str
+) -> Generator[Block, None, None]:
+    """
+    Get every block state defined in the specification.
+    The last property changes the fastest.
+
+    :param specification: The raw specification of the block.
+    :param namespace: The namespace of the block.
+    :param base_name: The base name of the block.
+    :return: A generator of Block objects.
+    """
+    properties = specification.get("properties", {})
+    keys = tuple(properties.keys())
+    values = tuple(
+        [amulet_nbt.from_snbt(val) for val in properties[key]] for key in keys
+    )
+    for state in itertools.product(*values):
+        yield Block(namespace, base_name, dict(zip(keys, state)))
+
+
+def _state_indexer(specification: dict) -> StateIndexer:
+    properties = specification.get("properties", {})
+    indexer = []
+    stride = 1
+    for key in reversed(tuple(properties.keys())):
+        values = properties[key]
+        indexer.append((key, {val: index for index, val in enumerate(values)}, stride))
+        stride *= len(values)
+    return tuple(reversed(indexer))
+
+
+def _state_index(indexer: StateIndexer, block: "Block") -> Optional[int]:
+    """
+    Get the index of the block's state in the order given by :func:`blockstates`.
+
+    :return: The index or None if the properties do not match the specification.
+    """
+    properties = get_properties_view(block)
+    if len(properties) != len(indexer):
+        return None
+    state_index = 0
+    for name, values, stride in indexer:
+        value = properties.get(name)
+        if value is None:
+            return None
+        value_index = values.get(value.to_snbt())
+        if value_index is None:
+            return None
+        state_index += value_index * stride
+    return state_index
+
+
+class TranslationTable:
+    """Look up the precomputed translation of a block state."""
+
+    def __init__(self, data: dict):
+        self._data = data
+        self._palette = data["palette"]
+        self._unpacked: Dict[int, "TranslatedBlock"] = {}
+        self._indexers: Dict[Tuple[str, str, str, str], Optional[StateIndexer]] = {}
+
+    def get(
+        self,
+        direction: str,
+        format_key: str,
+        block: "Block",
+        specification: dict,
+    ) -> Optional["TranslatedBlock"]:
+        """
+        Get the precomputed translation of a block.
+
+        :param direction: "to_universal" or "from_universal"
+        :param format_key: "numerical" or "blockstate"
+        :param block: The block to translate.
+        :param specification: The raw specification for the input block.
+        :return: The translation if it is in the table otherwise None. The returned data is shared and must not be modified.
+        """
+        key = (direction, format_key, block.namespace, block.base_name)
+        indexer = self._indexers.get(key, False)
+        if indexer is False:
+            try:
+                self._data[direction][format_key][block.namespace][block.base_name]
+            except KeyError:
+                indexer = None
+            else:
+                indexer = _state_indexer(specification)
+            self._indexers[key] = indexer
+        if indexer is None or block.extra_blocks:
+            return None
+
+        state_index = _state_index(indexer, block)
+        if state_index is None:
+            return None
+        palette_index = self._data[direction][format_key][block.namespace][
+            block.base_name
+        ][state_index]
+        if palette_index < 0:
+            return None
+        translation = self._unpacked.get(palette_index)
+        if translation is None:
+            translation = self._unpacked[palette_index] = unpack_translation(
+                self._palette[palette_index]
+            )
+        return translation
+
+
+def load_translation_table(path: str) -> Optional[TranslationTable]:
+    """
+    Load the translation table at the given path.
+
+    :param path: The path to the json.gz file.
+    :return: The TranslationTable or None if the file does not exist.
+    """
+    if os.path.isfile(path):
+        return TranslationTable(load_json_gz(path))
+    return None
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Union, Tuple, TYPE_CHECKING
+from typing import Union, Tuple, TYPE_CHECKING, Optional, Dict
 import glob
 import warnings
 import logging
@@ -22,6 +22,44 @@ log = logging.getLogger(__name__)
 
 _version_data = {}
 
+
+def load_version_index(versions_path: str) -> Dict[str, dict]:
+    """
+    Load the __init__.json data for every version without loading the rest of the meta data.
+
+    The minified format stores this in a single index file written at build time.
+    Otherwise the version directories are scanned.
+
+    :param versions_path: The path to the versions directory.
+    :return: A dictionary mapping the version directory name to the contents of its __init__.json file.
+    """
+    index_path = os.path.join(versions_path, "index.json.gz")
+    if minified and os.path.isfile(index_path):
+        return load_json_gz(index_path)
+
+    version_index = {}
+    for version_name in os.listdir(versions_path):
+        version_path = os.path.join(versions_path, version_name)
+        try:
+            if minified:
+                meta_path = os.path.join(version_path, "meta.json.gz")
+                if os.path.isfile(meta_path):
+                    version_index[version_name] = json_atlas[
+                        load_json_gz(meta_path)["__init__"]
+                    ]
+            else:
+                init_path = os.path.join(version_path, "__init__.json")
+                if os.path.isfile(init_path):
+                    with open(init_path) as f:
+                        version_index[version_name] = json.load(f)
+        except:
+            log.error(
+                f"Failed loading the index for version {version_name}. Try deleting your Amulet directory and extrating the files agian.",
+                exc_info=True,
+            )
+    return version_index
+
+
 _translator_classes = {
     "block": BlockTranslator,
     "entity": EntityTranslator,
@@ -38,7 +76,17 @@ class Version:
            This class should not be directly initiated. You should first create a ``TranslationManager`` class and call ``TranslationManager.get_version`` to get the required Version class.
     """
 
-    def __init__(self, version_path: str, translation_manager: "TranslationManager"):
+    def __init__(
+        self,
+        version_path: str,
+        translation_manager: "TranslationManager",
+        init_file: Optional[dict] = None,
+    ):
+        """
+        :param version_path: The path to the version directory.
+        :param translation_manager: The TranslationManager this version belongs to.
+        :param init_file: The contents of the __init__.json file if already known. If given the rest of the meta data is not loaded until it is needed.
+        """
         self._version_path = version_path
         self._translation_manager = translation_manager
         self._block = None
@@ -46,6 +94,30 @@ class Version:
         self._item = None
         self._biome = None
 
+        if init_file is None:
+            init_file = self._meta["__init__"]
+
+        # unpack the __init__.json file
+        assert isinstance(
+            init_file["platform"], str
+        ), f"The platform name defined in {version_path}/__init__.json is not a string"
+        self._platform = init_file["platform"]
+        assert (
+            isinstance(init_file["version"], list) and len(init_file["version"]) == 3
+        ), f"The version number defined in {version_path}/__init__.json is incorrectly formatted"
+        self._version_number = tuple(init_file["version"])
+        self._data_version: int = init_file.get("data_version", 0)
+        assert isinstance(init_file["block_format"], str)
+        self._block_format = init_file["block_format"]
+        self._has_abstract_format = self._block_format in [
+            "numerical",
+            "pseudo-numerical",
+        ]
+
+    @property
+    def _meta(self) -> dict:
+        """The meta files for this version. These are loaded the first time they are requested."""
+        version_path = self._version_path
         if version_path not in _version_data:
             _version_data[version_path] = {}
             if minified:
@@ -68,37 +140,19 @@ class Version:
                     if os.path.isfile(os.path.join(version_path, f"{file_name}.json")):
                         with open(os.path.join(version_path, f"{file_name}.json")) as f:
                             meta[file_name] = json.load(f)
+        return _version_data[version_path]["meta"]
 
-        meta = _version_data[version_path]["meta"]
-        # unpack the __init__.json file
-        init_file = meta["__init__"]
-        assert isinstance(
-            init_file["platform"], str
-        ), f"The platform name defined in {version_path}/__init__.json is not a string"
-        self._platform = init_file["platform"]
-        assert (
-            isinstance(init_file["version"], list) and len(init_file["version"]) == 3
-        ), f"The version number defined in {version_path}/__init__.json is incorrectly formatted"
-        self._version_number = tuple(init_file["version"])
-        self._data_version: int = init_file.get("data_version", 0)
-        assert isinstance(init_file["block_format"], str)
-        self._block_format = init_file["block_format"]
-        self._has_abstract_format = self._block_format in [
-            "numerical",
-            "pseudo-numerical",
-        ]
-
-        self._block_extra_input = [{}, None, None, self._block_format]
+    @property
+    def _block_extra_input(self) -> list:
+        meta = self._meta
+        block_extra_input = [{}, None, None, self._block_format]
         if self.has_abstract_format:
-            self._block_extra_input[0] = meta["__numerical_block_map__"]
+            block_extra_input[0] = meta["__numerical_block_map__"]
 
         if self.platform == "java" and "__waterloggable__" in meta:
-            self._block_extra_input[1] = meta["__waterloggable__"]
-            self._block_extra_input[2] = meta["__always_waterlogged__"]
-
-        self._biome_callable = lambda: BiomeTranslator(
-            meta["__biome_data__"], translation_manager
-        )
+            block_extra_input[1] = meta["__waterloggable__"]
+            block_extra_input[2] = meta["__always_waterlogged__"]
+        return block_extra_input
 
     def _load_translator(self, attr, *args):
         """
@@ -138,6 +192,21 @@ class Version:
                 ),
             )
 
+    def _loaded_translators(self):
+        return tuple(
+            translator
+            for translator in (self._block, self._entity, self._item, self._biome)
+            if translator is not None
+        )
+
+    def _set_cache_size(self, max_size: Optional[int]):
+        for translator in self._loaded_translators():
+            translator.set_cache_size(max_size)
+
+    def _clear_cache(self):
+        for translator in self._loaded_translators():
+            translator.clear_cache()
+
     def __repr__(self):
         return f"PyMCTranslate.Version({self.platform}, {self.version_number})"
 
@@ -193,7 +262,8 @@ class Version:
     @property
     def block(self) -> BlockTranslator:
         """The BlockTranslator for this version"""
-        self._load_translator("block", *self._block_extra_input)
+        if self._block is None:
+            self._load_translator("block", *self._block_extra_input)
         return self._block
 
     @property
@@ -212,7 +282,9 @@ class Version:
     def biome(self) -> BiomeTranslator:
         """The BiomeTranslator for this version"""
         if self._biome is None:
-            self._biome = self._biome_callable()
+            self._biome = BiomeTranslator(
+                self._meta["__biome_data__"], self._translation_manager
+            )
         return self._biome
 
     def is_waterloggable(self, namespace_str: str, always=False):
@@ -1,7 +1,7 @@
 from typing import Optional
 import os
 
-from .util.json_gz import load_json_gz
+from .util.mapped_atlas import MappedAtlas
 
 pymct_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
@@ -17,7 +17,7 @@ if minified:
     """
     minified format
     min_json
-        atlas.json.gz
+        atlas.bin  (see util/mapped_atlas.py)
         versions
             <version>
                 meta.json.gz
@@ -25,9 +25,9 @@ if minified:
                 item.json.gz
                 entity.json.gz
     """
-    # load the mega_json file and unpack
-    json_atlas: Optional[list] = load_json_gz(
-        os.path.join(pymct_dir, "min_json", "atlas.json.gz")
+    # memory map the atlas. Records are only decoded when they are requested.
+    json_atlas: Optional[MappedAtlas] = MappedAtlas(
+        os.path.join(pymct_dir, "min_json", "atlas.bin")
     )
     json_dir = os.path.join(pymct_dir, "min_json")
 else:
@@ -47,3 +47,9 @@ else:
     """
     json_atlas = None
     json_dir = os.path.join(pymct_dir, "json")
+
+# precomputed block translations written by build_tools/translation_tables.py
+translation_tables_dir = os.path.join(pymct_dir, "translation_tables")
+
+# function name to module name for the code functions written by build_tools/code_functions_manifest.py
+code_functions_manifest = os.path.join(pymct_dir, "code_functions_manifest.json")
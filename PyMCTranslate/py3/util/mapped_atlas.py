@@ -0,0 +1,84 @@
+"""
+A read only atlas of json records backed by a memory mapped file.
+The file is written by build_tools/minify_json.py
+
+Format (all integers are little endian)
+    magic           8 bytes     b"PYMCTDB1"
+    record_count    uint64
+    offsets         uint64 * (record_count + 1)     The start of each record relative to the start of the record data. The last value is the end of the last record.
+    record data     The utf-8 json encoding of each record. Identical records are only stored once.
+
+The strings in decoded records are interned so that the names and values repeated across records share one object.
+"""
+
+import json
+import mmap
+import struct
+from sys import intern
+from functools import lru_cache
+from typing import Any
+
+Magic = b"PYMCTDB1"
+_HeaderSize = 16
+
+
+def _intern(obj: Any) -> Any:
+    """Intern the strings in a decoded json object."""
+    if isinstance(obj, str):
+        return intern(obj)
+    elif isinstance(obj, dict):
+        return {intern(key): _intern(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_intern(value) for value in obj]
+    return obj
+
+
+class MappedAtlas:
+    """
+    A sequence of json records that are only decoded when requested.
+
+    Only the header is read when this is created.
+    The operating system pages in the parts of the file that are accessed.
+    """
+
+    def __init__(self, path: str, cache_size: int = 4096):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:8] != Magic:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a valid atlas file")
+        (self._count,) = struct.unpack_from("<Q", self._mmap, 8)
+        self._data_start = _HeaderSize + 8 * (self._count + 1)
+        # Decoded records are shared between callers so they must not be modified.
+        self._decode = lru_cache(maxsize=cache_size)(self._decode_record)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Get the decoded record at the given index.
+        The returned object is shared and must not be modified.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._decode(index)
+
+    def _decode_record(self, index: int) -> Any:
+        start, end = struct.unpack_from("<QQ", self._mmap, _HeaderSize + 8 * index)
+        return _intern(
+            json.loads(
+                self._mmap[self._data_start + start : self._data_start + end].decode(
+                    "utf-8"
+                )
+            )
+        )
+
+    def clear_cache(self):
+        """Release all the cached decoded records."""
+        self._decode.cache_clear()
+
+    def close(self):
+        """Release the cached records and unmap the file. The atlas cannot be used after this."""
+        self.clear_cache()
+        self._mmap.close()
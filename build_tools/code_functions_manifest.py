@@ -0,0 +1,54 @@
+import os
+import json
+from typing import Dict, Type
+
+from setuptools import Command
+from setuptools.command.build import build as build_
+
+ProjectName = "PyMCTranslate"
+
+
+def register(cmdclass: Dict[str, Type[Command]]):
+    # register a new command class
+    cmdclass["code_functions_manifest"] = CodeFunctionsManifest
+    # get the build command class
+    build = cmdclass.get("build", build_)
+    # register our command class as a subcommand of the build command class
+    build.sub_commands.append(("code_functions_manifest", None))
+
+
+class CodeFunctionsManifest(Command):
+    def initialize_options(self):
+        self.build_lib = None
+
+    def finalize_options(self):
+        self.set_undefined_options("build_py", ("build_lib", "build_lib"))
+
+    def run(self):
+        build_code_functions_manifest(os.path.join(self.build_lib, ProjectName))
+
+
+def build_code_functions_manifest(pymct_path):
+    """
+    Write the module name of each code function so that they do not need to be searched for at runtime.
+    See PyMCTranslate/py3/api/version/code_functions.py
+
+    :param pymct_path: The path to the PyMCTranslate package to build the manifest for.
+    """
+    package_path = os.path.join(pymct_path, "code_functions")
+    manifest = {}
+    for root, _, files in os.walk(package_path):
+        rel_path = os.path.relpath(root, os.path.dirname(pymct_path))
+        package_name = ".".join(rel_path.split(os.sep))
+        for file_name in files:
+            if file_name.endswith(".py") and file_name != "__init__.py":
+                function_name = file_name[:-3]
+                manifest[function_name] = f"{package_name}.{function_name}"
+    with open(os.path.join(pymct_path, "code_functions_manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+
+
+if __name__ == "__main__":
+    build_code_functions_manifest(
+        os.path.abspath(os.path.join(__file__, "..", "..", ProjectName))
+    )
@@ -3,6 +3,7 @@ import json
 import glob
 import gzip
 import shutil
+import struct
 from typing import Dict, Type
 
 from setuptools import Command
@@ -34,16 +35,37 @@ class MinifyJson(Command):
         minify_json(os.path.join(self.build_lib, ProjectName), True)
 
 
+def write_atlas(path, records):
+    """
+    Write the records to a memory mappable atlas file.
+    See PyMCTranslate/py3/util/mapped_atlas.py for the format.
+
+    :param path: The path to write the atlas to.
+    :param records: A list of utf-8 encoded json records.
+    """
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+    with open(path, "wb") as f:
+        f.write(b"PYMCTDB1")
+        f.write(struct.pack("<Q", len(records)))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        for record in records:
+            f.write(record)
+
+
 def minify_json(pymct_path, remove_origin=False):
     atlas = []
+    atlas_lut = {}
     versions = {}
 
     def get_add_atlas(obj) -> int:
-        try:
-            return atlas.index(obj)
-        except ValueError:
-            atlas.append(obj)
-            return len(atlas) - 1
+        # the key order is ignored when finding identical records but the stored record keeps the original order
+        key = json.dumps(obj, sort_keys=True)
+        if key not in atlas_lut:
+            atlas_lut[key] = len(atlas)
+            atlas.append(json.dumps(obj, separators=(",", ":")).encode("utf-8"))
+        return atlas_lut[key]
 
     json_dir = os.path.join(pymct_path, "json")
     versions_dir = os.path.join(json_dir, "versions")
@@ -51,13 +73,19 @@ def minify_json(pymct_path, remove_origin=False):
 
     shutil.rmtree(min_json_dir, ignore_errors=True)
 
+    # the __init__.json data for each version so that the versions can be found without loading the meta files
+    version_index = {}
+
     for version in os.listdir(versions_dir):
         meta = versions.setdefault(version, {})["meta"] = {}
         for path in os.listdir(os.path.join(versions_dir, version)):
             if os.path.isfile(os.path.join(versions_dir, version, path)):
                 if path.endswith(".json"):
                     with open(os.path.join(versions_dir, version, path)) as f:
-                        meta[path[:-5]] = get_add_atlas(json.load(f))
+                        data = json.load(f)
+                    meta[path[:-5]] = get_add_atlas(data)
+                    if path == "__init__.json":
+                        version_index[version] = data
 
             elif os.path.isdir(os.path.join(versions_dir, version, path)):
                 database = versions.setdefault(version, {})[path] = {}
@@ -86,9 +114,11 @@ def minify_json(pymct_path, remove_origin=False):
 
         print(f"Built version {version}")
 
+    with gzip.open(os.path.join(min_json_dir, "versions", "index.json.gz"), "wb") as f:
+        f.write(json.dumps(version_index).encode("utf-8"))
+
     print("Writing atlas")
-    with gzip.open(os.path.join(min_json_dir, "atlas.json.gz"), "wb") as f:
-        f.write(json.dumps(atlas).encode("utf-8"))
+    write_atlas(os.path.join(min_json_dir, "atlas.bin"), atlas)
     print("Written atlas")
 
     if remove_origin:
@@ -0,0 +1,154 @@
+"""
+Build the precomputed block translation tables.
+
+This is not part of the normal build. Translating every block state of every version is slow and needs
+PyMCTranslate and its dependencies (numpy and amulet-nbt) to be importable, which they are not in an isolated build.
+When the tables do not exist PyMCTranslate translates each block when it is first used.
+
+To include the tables in a wheel install the dependencies and run the command after build so that it translates using the built package
+    python setup.py build translation_tables bdist_wheel
+or build the tables in the source tree
+    python build_tools/translation_tables.py
+
+The time taken and size of each table is printed.
+If a version fails to build its table is skipped.
+"""
+
+import os
+import sys
+import time
+import json
+import gzip
+import shutil
+import logging
+from typing import Dict, Type
+
+from setuptools import Command
+
+ProjectName = "PyMCTranslate"
+
+
+def register(cmdclass: Dict[str, Type[Command]]):
+    # register a new command class
+    # This is not a sub command of build because it is slow and needs PyMCTranslate and its dependencies to be importable.
+    cmdclass["translation_tables"] = TranslationTables
+
+
+class TranslationTables(Command):
+    def initialize_options(self):
+        self.build_lib = None
+
+    def finalize_options(self):
+        self.set_undefined_options("build_py", ("build_lib", "build_lib"))
+
+    def run(self):
+        build_translation_tables(os.path.join(self.build_lib, ProjectName))
+
+
+def build_translation_tables(pymct_path):
+    """
+    Translate every block state in the specifications and store the results that do not depend on anything other than the block state.
+    See PyMCTranslate/py3/api/version/translators/translation_table.py for the format.
+
+    :param pymct_path: The path to the PyMCTranslate package to build the tables for.
+    """
+    tables_dir = os.path.join(pymct_path, "translation_tables")
+    # remove the old tables so that they are not used to build the new ones
+    shutil.rmtree(tables_dir, ignore_errors=True)
+
+    sys.path.insert(0, os.path.dirname(pymct_path))
+    import PyMCTranslate
+
+    # translations that can't be found are expected here
+    logging.getLogger("PyMCTranslate").setLevel(logging.CRITICAL)
+
+    translation_manager = PyMCTranslate.new_translation_manager()
+    os.makedirs(tables_dir)
+
+    total_start = time.perf_counter()
+    total_size = 0
+    for platform in translation_manager.platforms():
+        if platform == "universal":
+            continue
+        for version_number in translation_manager.version_numbers(platform):
+            version = translation_manager.get_version(platform, version_number)
+            start = time.perf_counter()
+            try:
+                table = _build_table(translation_manager, version)
+            except Exception as e:
+                # the version falls back to translating at runtime
+                print(f"Could not build the translation table for {version}: {e}")
+                continue
+            path = os.path.join(
+                tables_dir,
+                f"{os.path.basename(version._version_path)}.json.gz",
+            )
+            with gzip.open(path, "wb") as f:
+                f.write(json.dumps(table, separators=(",", ":")).encode("utf-8"))
+            size = os.path.getsize(path)
+            total_size += size
+            print(
+                f"Built translation table for {version} in {time.perf_counter() - start:.1f}s ({size / 1024:.0f}KiB)"
+            )
+    print(
+        f"Built the translation tables in {time.perf_counter() - total_start:.1f}s ({total_size / 1024 / 1024:.1f}MiB)"
+    )
+
+
+def _build_table(translation_manager, version) -> dict:
+    from PyMCTranslate.py3.api.version.translators.translation_table import (
+        blockstates,
+    )
+    from PyMCTranslate.py3.api.version.translators.serialise import (
+        pack_translation,
+    )
+
+    universal_blocks = translation_manager.universal_format.block
+    blocks = version.block
+    palette = []
+    palette_lut = {}
+    table = {"palette": palette, "to_universal": {}, "from_universal": {}}
+
+    def get_add_palette(result) -> int:
+        packed = pack_translation(result)
+        key = json.dumps(packed)
+        if key not in palette_lut:
+            palette_lut[key] = len(palette)
+            palette.append(packed)
+        return palette_lut[key]
+
+    for force_blockstate in [False, True] if version.has_abstract_format else [False]:
+        format_key = blocks._format_key(force_blockstate)
+        for direction, translator, input_blocks, input_force_blockstate in (
+            ("to_universal", blocks.to_universal, blocks, force_blockstate),
+            ("from_universal", blocks.from_universal, universal_blocks, False),
+        ):
+            direction_table = table[direction].setdefault(format_key, {})
+            # a result is only cached if it does not depend on the block entity or the surrounding blocks
+            cache = blocks.get_cache(direction, force_blockstate)
+            for namespace in input_blocks.namespaces(input_force_blockstate):
+                for base_name in input_blocks.base_names(
+                    namespace, input_force_blockstate
+                ):
+                    specification = input_blocks._get_shared_specification(
+                        namespace, base_name, input_force_blockstate
+                    )
+                    states = direction_table.setdefault(namespace, {})[base_name] = []
+                    for block in blockstates(specification, namespace, base_name):
+                        result = translator(
+                            block,
+                            force_blockstate=force_blockstate,
+                            shared=True,
+                        )
+                        if block in cache:
+                            states.append(get_add_palette(result))
+                        else:
+                            states.append(-1)
+            cache.clear()
+    return table
+
+
+if __name__ == "__main__":
+    build_translation_tables(
+        os.path.abspath(os.path.join(__file__, "..", "..", ProjectName))
+    )
@@ -6,10 +6,15 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), "build_tools"))
 
 import minify_json
+import translation_tables
+import code_functions_manifest
 
 cmdclass = versioneer.get_cmdclass()
 
 minify_json.register(cmdclass)
+code_functions_manifest.register(cmdclass)
+# opt-in. See build_tools/translation_tables.py
+translation_tables.register(cmdclass)
 
 
 # from Cython.Build import cythonize
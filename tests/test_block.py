@@ -0,0 +1,48 @@
+import unittest
+import copy
+import pickle
+
+from amulet_nbt import StringTag, IntTag
+
+from PyMCTranslate.py3.api.amulet_objects import Block, BlockPool
+
+
+class BlockTest(unittest.TestCase):
+    def test_hash_eq(self):
+        water = Block("minecraft", "water", {"level": StringTag("0")})
+        stone_a = Block("minecraft", "stone", {"a": StringTag("1"), "b": IntTag(2)})
+        stone_b = Block("minecraft", "stone", {"b": IntTag(2), "a": StringTag("1")})
+        self.assertEqual(stone_a, stone_b)
+        self.assertEqual(hash(stone_a), hash(stone_b))
+        self.assertNotEqual(stone_a, Block("minecraft", "stone", {"a": StringTag("1")}))
+        self.assertEqual(stone_a + water, stone_b + water)
+        self.assertEqual(hash(stone_a + water), hash(stone_b + water))
+        self.assertNotEqual(stone_a, stone_a + water)
+        self.assertEqual(len({stone_a, stone_b, stone_a + water}), 2)
+
+    def test_intern(self):
+        pool = BlockPool()
+        stone = Block("minecraft", "stone").intern(pool)
+        self.assertIs(Block("minecraft", "stone").intern(pool), stone)
+        self.assertIs(Block.from_snbt_blockstate("minecraft:stone", pool), stone)
+        self.assertEqual(len(pool), 1)
+        pool.clear()
+        self.assertIsNot(Block("minecraft", "stone").intern(pool), stone)
+
+    def test_copy_pickle(self):
+        water = Block("minecraft", "water", {"level": StringTag("0")})
+        stone = Block("minecraft", "stone", {"a": StringTag("1")}, water)
+        hash(stone)
+        for block in (
+            copy.copy(stone),
+            copy.deepcopy(stone),
+            pickle.loads(pickle.dumps(stone)),
+        ):
+            self.assertEqual(block, stone)
+            self.assertEqual(hash(block), hash(stone))
+            self.assertEqual(dict(block.properties_view), {"a": StringTag("1")})
+            self.assertEqual(block.extra_blocks, (water,))
+
+
+if __name__ == "__main__":
+    unittest.main()
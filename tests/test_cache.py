@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import patch
+
+from amulet_nbt import NamedTag, CompoundTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block, BlockEntity
+from PyMCTranslate.py3.api.version.translators import base
+from PyMCTranslate.py3.api.version.translators.cache import TranslationCache
+
+
+class CacheTest(unittest.TestCase):
+    def test_counters(self):
+        cache = TranslationCache()
+        self.assertIsNone(cache.get("a"))
+        cache["a"] = 1
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 0))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_eviction(self):
+        cache = TranslationCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+        # b was the least recently used
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.evictions, 1)
+        cache.max_size = 1
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.evictions, 2)
+
+
+class NegativeCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_missing_mapping(self):
+        version = self._translator.get_version("java", (1, 20, 0))
+        block = Block("modded", "block")
+        self.assertEqual(version.block.to_universal(block), (block, None, False))
+        negative_cache = version.block.get_negative_cache("to_universal")
+        self.assertIn(block, negative_cache)
+        self.assertEqual(version.block.to_universal(block), (block, None, False))
+        self.assertEqual(negative_cache.hits, 1)
+        self._translator.block_registry.register("modded:block", 5000)
+        version.block.to_universal(block)
+        self.assertEqual(negative_cache.hits, 1)
+
+    def test_translate_error(self):
+        version = self._translator.get_version("java", (1, 20, 0))
+        block = Block("minecraft", "stone")
+        negative_cache = version.block.get_negative_cache("to_universal")
+        with patch.object(
+            base, "translate", side_effect=ValueError("error")
+        ) as translate:
+            for _ in range(2):
+                self.assertEqual(version.block.to_universal(block), (block, None, True))
+            # on_error stored the failure so the second call did not translate
+            self.assertEqual(translate.call_count, 1)
+            self.assertEqual(negative_cache.hits, 1)
+            # extra_needed is stored for the error
+            self.assertIs(negative_cache.get(block), True)
+
+            # the error may depend on the surrounding blocks so it is retried if a callback is given
+            version.block.to_universal(
+                block, get_block_callback=lambda location: (block, None)
+            )
+            self.assertEqual(translate.call_count, 2)
+
+            # errors with a block entity are not stored
+            other = Block("minecraft", "granite")
+            block_entity = BlockEntity(
+                "minecraft", "chest", 0, 0, 0, NamedTag(CompoundTag())
+            )
+            for _ in range(2):
+                version.block.to_universal(other, block_entity)
+            self.assertEqual(translate.call_count, 4)
+            self.assertNotIn(other, negative_cache)
+
+        # clearing the cache lets the block translate again
+        version.block.clear_cache("to_universal")
+        output, _, extra_needed = version.block.to_universal(block)
+        self.assertEqual(output.namespaced_name, "universal_minecraft:stone")
+        self.assertFalse(extra_needed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+import PyMCTranslate
+
+
+class CapabilitiesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_capabilities(self):
+        version = self._translator.get_version("bedrock", (1, 9, 0))
+        stone = version.block.get_capabilities("to_universal", "minecraft", "stone")
+        self.assertTrue(stone.pure)
+        door = version.block.get_capabilities(
+            "to_universal", "minecraft", "wooden_door"
+        )
+        self.assertFalse(door.pure)
+        self.assertIn((0, 1, 0), door.needs_neighbours)
+        self.assertFalse(door.needs_nbt)
+
+
+if __name__ == "__main__":
+    unittest.main()
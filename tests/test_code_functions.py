@@ -0,0 +1,197 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+from amulet_nbt import NamedTag, CompoundTag, StringTag, ByteTag, IntTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block, BlockEntity
+from PyMCTranslate.py3.api.version import code_functions
+from PyMCTranslate.py3.api.version import translate
+from PyMCTranslate.py3.util.raw_text import section_string_to_raw_text
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "build_tools"))
+from code_functions_manifest import build_code_functions_manifest
+
+
+class CodeFunctionsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_code_mapping(self):
+        version = self._translator.get_version("bedrock", (1, 20, 0))
+        block = Block(
+            "minecraft",
+            "command_block",
+            {"conditional_bit": ByteTag(0), "facing_direction": IntTag(1)},
+        )
+
+        def command_block(name: str) -> BlockEntity:
+            return BlockEntity(
+                "",
+                "CommandBlock",
+                0,
+                0,
+                0,
+                NamedTag(
+                    CompoundTag(
+                        {"CustomName": StringTag(name), "Command": StringTag("say hi")}
+                    )
+                ),
+            )
+
+        function_name = "bedrock_cmd_custom_name_2u"
+        self.assertTrue(code_functions.is_pure(function_name))
+        function = code_functions.code_functions[function_name]
+        calls = []
+
+        def counted_function(*args):
+            calls.append(args)
+            return function(*args)
+
+        with patch.dict(
+            code_functions.code_functions, {function_name: counted_function}
+        ):
+            for _ in range(2):
+                output, output_entity, extra_needed = version.block.to_universal(
+                    block, command_block("§aCommand")
+                )
+                self.assertFalse(extra_needed)
+                self.assertEqual(
+                    output.namespaced_name, "universal_minecraft:command_block"
+                )
+                self.assertEqual(output.properties["facing"], StringTag("up"))
+                utags = output_entity.nbt.tag["utags"]
+                self.assertEqual(
+                    utags["CustomName"],
+                    StringTag(section_string_to_raw_text("§aCommand")),
+                )
+                self.assertEqual(utags["Command"], StringTag("say hi"))
+            # the second translation reused the result of the first
+            self.assertEqual(len(calls), 1)
+
+            # different nbt is a different result
+            output_entity = version.block.to_universal(block, command_block("Other"))[1]
+            self.assertEqual(
+                output_entity.nbt.tag["utags"]["CustomName"],
+                StringTag(section_string_to_raw_text("Other")),
+            )
+            self.assertEqual(len(calls), 2)
+
+    def test_nbt_paths(self):
+        version = self._translator.get_version("bedrock", (1, 20, 0))
+        block = Block(
+            "minecraft",
+            "command_block",
+            {"conditional_bit": ByteTag(0), "facing_direction": IntTag(1)},
+        )
+
+        def command_block(name: str, command: str) -> BlockEntity:
+            return BlockEntity(
+                "",
+                "CommandBlock",
+                0,
+                0,
+                0,
+                NamedTag(
+                    CompoundTag(
+                        {"CustomName": StringTag(name), "Command": StringTag(command)}
+                    )
+                ),
+            )
+
+        function_name = "bedrock_cmd_custom_name_2u"
+        self.assertEqual(code_functions.nbt_paths(function_name), (("CustomName",),))
+        function = code_functions.code_functions[function_name]
+        calls = []
+
+        def counted_function(*args):
+            calls.append(args)
+            return function(*args)
+
+        with patch.dict(
+            code_functions.code_functions, {function_name: counted_function}
+        ), patch.object(
+            translate, "objectify_nbt", wraps=translate.objectify_nbt
+        ) as objectify_nbt:
+            for command in ("say hi", "say bye"):
+                output_entity = version.block.to_universal(
+                    block, command_block("Name", command)
+                )[1]
+                utags = output_entity.nbt.tag["utags"]
+                self.assertEqual(
+                    utags["CustomName"], StringTag(section_string_to_raw_text("Name"))
+                )
+                self.assertEqual(utags["Command"], StringTag(command))
+            # the nbt the function does not read is not part of the key so the second translation skipped the work
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(objectify_nbt.call_count, 1)
+
+            version.block.to_universal(block, command_block("Other", "say hi"))
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(objectify_nbt.call_count, 2)
+
+    def test_location_not_pure(self):
+        self.assertFalse(code_functions.is_pure("bedrock_chest_fu"))
+        self.assertFalse(code_functions.is_pure("bedrock_moving_block_pos_2u"))
+
+    def test_lazy_loading(self):
+        function_name = "bedrock_cmd_custom_name_2u"
+        module_name = f"PyMCTranslate.code_functions.{function_name}"
+        with patch.object(code_functions, "_module_names", None), patch.dict(
+            code_functions.code_functions, clear=True
+        ), patch.dict(code_functions._pure, clear=True), patch.dict(sys.modules):
+            sys.modules.pop(module_name, None)
+            self.assertEqual(
+                code_functions.run(
+                    function_name, [["compound", {"CustomName": ["string", "Name"]}]]
+                ),
+                [
+                    [
+                        "",
+                        "compound",
+                        [("utags", "compound")],
+                        "CustomName",
+                        ["string", section_string_to_raw_text("Name")],
+                    ]
+                ],
+            )
+            # only the module that was run is imported
+            self.assertIn(module_name, sys.modules)
+            self.assertEqual(list(code_functions.code_functions), [function_name])
+            self.assertEqual(code_functions._module_names[function_name], module_name)
+            with self.assertRaises(AssertionError):
+                code_functions.run("not_a_function", [])
+
+    def test_manifest(self):
+        package_path = os.path.dirname(PyMCTranslate.__file__)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pymct_path = os.path.join(temp_dir, "PyMCTranslate")
+            shutil.copytree(
+                os.path.join(package_path, "code_functions"),
+                os.path.join(pymct_path, "code_functions"),
+                ignore=shutil.ignore_patterns("__pycache__"),
+            )
+            build_code_functions_manifest(pymct_path)
+            manifest_path = os.path.join(pymct_path, "code_functions_manifest.json")
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+
+            # without the manifest the package is searched
+            with patch.object(
+                code_functions,
+                "code_functions_manifest",
+                os.path.join(temp_dir, "missing.json"),
+            ):
+                self.assertEqual(code_functions._find_modules(), manifest)
+            with patch.object(code_functions, "code_functions_manifest", manifest_path):
+                self.assertEqual(code_functions._find_modules(), manifest)
+        self.assertIn("bedrock_sign_2u", manifest)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+import numpy
+
+import PyMCTranslate
+
+
+class CodecTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_round_trip(self):
+        version = self._translator.get_version("java", (1, 20, 0))
+        codec = version.block.get_codec("minecraft", "oak_stairs")
+        self.assertLessEqual(len(codec), 2**codec.bits)
+        states = numpy.arange(len(codec))
+        blocks = codec.decode_array(states)
+        numpy.testing.assert_array_equal(codec.encode_array(blocks), states)
+        indexes = codec.decode_indexes(states)
+        self.assertEqual(tuple(indexes), codec.property_names)
+        numpy.testing.assert_array_equal(codec.encode_indexes(indexes), states)
+        for state in (0, len(codec) - 1):
+            block = codec.decode(state)
+            self.assertEqual(codec.encode(block), state)
+            for name, index in codec.decode_indexes(state).items():
+                self.assertEqual(block.properties[name], codec.values(name)[index])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import unittest
+from unittest.mock import patch
+
+import numpy
+
+from amulet_nbt import IntTag, NamedTag, CompoundTag, StringTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block, BlockEntity, Entity
+
+
+class ConverterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_convert_block(self):
+        source = self._translator.get_version("java", (1, 12, 2))
+        destination = self._translator.get_version("bedrock", (1, 20, 0))
+        converter = self._translator.get_converter(source, destination)
+        self.assertIs(converter, self._translator.get_converter(source, destination))
+        for block_data in range(7):
+            block = Block("minecraft", "stone", {"block_data": IntTag(block_data)})
+            universal_block = source.block.to_universal(block)[0]
+            expected = destination.block.from_universal(universal_block)
+            self.assertEqual(converter.convert_block(block), expected)
+            self.assertEqual(converter.convert_block(block), expected)
+        self.assertEqual(converter.block_cache.hits, 7)
+
+    def test_state_ids(self):
+        version = self._translator.get_version("java", (1, 20, 0))
+        state_ids = version.block.state_ids()
+        for state_id in range(0, len(state_ids), 97):
+            block = version.block.state_id_to_block(state_id)
+            self.assertEqual(version.block.block_to_state_id(block), state_id)
+        self.assertIsNone(
+            version.block.block_to_state_id(Block("modded", "not_a_block"))
+        )
+
+    def test_state_id_table(self):
+        source = self._translator.get_version("java", (1, 12, 2))
+        destination = self._translator.get_version("bedrock", (1, 20, 0))
+        converter = self._translator.get_converter(source, destination)
+        table = converter.state_id_table()
+        self.assertEqual(len(table), len(source.block.state_ids()))
+        block = Block("minecraft", "stone", {"block_data": IntTag(1)})
+        destination_id = table[source.block.block_to_state_id(block)]
+        self.assertEqual(
+            destination.block.state_id_to_block(destination_id),
+            converter.convert_block(block)[0],
+        )
+
+    def test_translate_chunk(self):
+        source = self._translator.get_version("java", (1, 12, 2))
+        destination = self._translator.get_version("bedrock", (1, 20, 0))
+        palette = [
+            Block("minecraft", "stone", {"block_data": IntTag(block_data)})
+            for block_data in range(3)
+        ]
+        block_array = numpy.arange(27).reshape((3, 3, 3)) % 3
+        translation = self._translator.translate_chunk(
+            source, destination, block_array, palette, origin=(16, 0, 16)
+        )
+        self.assertEqual(translation.array.shape, block_array.shape)
+        converter = self._translator.get_converter(source, destination)
+        for index in numpy.ndindex(block_array.shape):
+            self.assertEqual(
+                translation.palette[translation.array[index]],
+                converter.convert_block(palette[block_array[index]])[0],
+            )
+        self.assertEqual(translation.block_entities, {})
+        self.assertEqual(translation.entities, [])
+
+    def test_translate_chunk_entities(self):
+        source = self._translator.get_version("java", (1, 12, 2))
+        destination = self._translator.get_version("bedrock", (1, 20, 0))
+        converter = self._translator.get_converter(source, destination)
+        stone = Block("minecraft", "stone", {"block_data": IntTag(0)})
+        command_block = Block("minecraft", "command_block", {"block_data": IntTag(1)})
+        palette = [stone, command_block]
+        block_array = numpy.zeros((2, 2, 2), dtype=numpy.uint32)
+        block_array[1, 0, 1] = 1
+        block_array[0, 1, 0] = 1
+        origin = (16, 0, 32)
+        # a block entity in the array and one at the location of the entity
+        block_entities = {
+            (17, 0, 33): BlockEntity(
+                "minecraft",
+                "command_block",
+                17,
+                0,
+                33,
+                NamedTag(CompoundTag({"Command": StringTag("say hi")})),
+            )
+        }
+        # no blocks translate to an entity so pretend that the command block at (16, 1, 16) does
+        entity = Entity(
+            "minecraft", "armor_stand", 0.0, 0.0, 0.0, NamedTag(CompoundTag())
+        )
+        convert_block = converter.convert_block
+
+        def convert_block_entity(block, block_entity, location, *args, **kwargs):
+            if location == (16, 1, 32):
+                return entity, None, False
+            return convert_block(block, block_entity, location, *args, **kwargs)
+
+        with patch.object(converter, "convert_block", convert_block_entity):
+            translation = converter.translate_chunk(
+                block_array, palette, block_entities, origin
+            )
+
+        self.assertEqual(len(translation.entities), 1)
+        self.assertEqual(translation.entities[0].location, (16.0, 1.0, 32.0))
+        # the original entity is not modified
+        self.assertEqual(entity.location, (0.0, 0.0, 0.0))
+        air = destination.block.from_universal(Block("universal_minecraft", "air"))[0]
+        self.assertEqual(translation.palette[translation.array[0, 1, 0]], air)
+
+        expected, expected_block_entity, _ = converter.convert_block(
+            command_block, block_entities[(17, 0, 33)], (17, 0, 33)
+        )
+        self.assertEqual(translation.palette[translation.array[1, 0, 1]], expected)
+        self.assertEqual(list(translation.block_entities), [(17, 0, 33)])
+        block_entity = translation.block_entities[(17, 0, 33)]
+        self.assertEqual(block_entity.location, (17, 0, 33))
+        self.assertEqual(
+            block_entity.namespaced_name, expected_block_entity.namespaced_name
+        )
+        self.assertEqual(block_entity.nbt.name, expected_block_entity.nbt.name)
+        self.assertEqual(block_entity.nbt.tag, expected_block_entity.nbt.tag)
+        self.assertEqual(
+            translation.palette[translation.array[0, 0, 0]],
+            converter.convert_block(stone)[0],
+        )
+
+    def test_convert_biome(self):
+        source = self._translator.get_version("java", (1, 12, 2))
+        destination = self._translator.get_version("bedrock", (1, 20, 0))
+        converter = self._translator.get_converter(source, destination)
+        self.assertEqual(
+            converter.convert_biome("minecraft:plains"),
+            destination.biome.from_universal(
+                source.biome.to_universal("minecraft:plains")
+            ),
+        )
+
+    def test_convert_biome_ids(self):
+        source = self._translator.get_version("java", (1, 12, 2))
+        destination = self._translator.get_version("bedrock", (1, 20, 0))
+        converter = self._translator.get_converter(source, destination)
+        biomes = numpy.array([[1, 2], [2, 1], [1000, 1]])
+        self.assertEqual(
+            source.biome.pack_array(source.biome.unpack_array(biomes)[:2]).tolist(),
+            biomes[:2].tolist(),
+        )
+        converted = converter.convert_biome_ids(biomes)
+        self.assertEqual(converted.shape, biomes.shape)
+        for source_biome, destination_biome in zip(biomes.ravel(), converted.ravel()):
+            self.assertEqual(
+                converter.convert_biome_id(source_biome), destination_biome
+            )
+        self._translator.biome_registry.register("modded:biome", 1000)
+        self.assertEqual(
+            converter.biome_id_table()[1000],
+            destination.biome.pack(
+                destination.biome.from_universal(
+                    source.biome.to_universal("modded:biome")
+                )
+            ),
+        )
+        # sparse ids are not put in the table
+        self._translator.biome_registry.register("modded:sparse_biome", 2**30)
+        self.assertLess(len(converter.biome_id_table()), 2**30)
+        self.assertEqual(
+            converter.convert_biome_ids(numpy.array([2**30, 1])).tolist(),
+            [converter.convert_biome_id(2**30), converter.convert_biome_id(1)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
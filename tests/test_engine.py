@@ -0,0 +1,78 @@
+import unittest
+
+import numpy
+from amulet_nbt import IntTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block
+from PyMCTranslate.py3.api.translation_manager import TranslationEngine
+
+
+class EngineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+        self._source = self._translator.get_version("java", (1, 12, 2))
+        self._destination = self._translator.get_version("bedrock", (1, 20, 0))
+        self._converter = self._translator.get_converter(
+            self._source, self._destination
+        )
+        self._palette = [
+            Block("minecraft", "stone", {"block_data": IntTag(block_data)})
+            for block_data in range(4)
+        ]
+
+    def _check_chunk(self, palette, array, output_palette, output_array):
+        self.assertEqual(output_array.shape, array.shape)
+        for index in numpy.ndindex(array.shape):
+            self.assertEqual(
+                output_palette[output_array[index]][0],
+                self._converter.convert_block(palette[array[index]])[0],
+            )
+
+    def test_convert_palettes(self):
+        palettes = [self._palette, self._palette[::-1]]
+        with TranslationEngine(self._translator, 1) as engine:
+            results = list(
+                engine.convert_palettes(self._source, self._destination, palettes)
+            )
+        self.assertEqual(len(results), len(palettes))
+        for palette, (output_palette, remap) in zip(palettes, results):
+            self._check_chunk(
+                palette, numpy.arange(len(palette)), output_palette, remap
+            )
+
+    def test_convert_chunks(self):
+        array = numpy.arange(64).reshape((4, 4, 4)) % len(self._palette)
+        chunks = [(self._palette, array), (self._palette[:2], array % 2)]
+        with TranslationEngine(self._translator, 1) as engine:
+            self.assertEqual(
+                list(engine.convert_chunks(self._source, self._destination, [])), []
+            )
+            results = list(
+                engine.convert_chunks(self._source, self._destination, chunks)
+            )
+            self.assertEqual(len(results), len(chunks))
+            for (palette, array_), (output_palette, output_array) in zip(
+                chunks, results
+            ):
+                self._check_chunk(palette, array_, output_palette, output_array)
+
+    def test_registry_restart(self):
+        chunks = [(self._palette, numpy.arange(4).reshape((1, 1, 4)))]
+        with TranslationEngine(self._translator, 1) as engine:
+            list(engine.convert_chunks(self._source, self._destination, chunks))
+            executor = engine._get_executor()
+            # the workers are reused while the registries are unchanged
+            list(engine.convert_chunks(self._source, self._destination, chunks))
+            self.assertIs(engine._get_executor(), executor)
+
+            self._translator.block_registry.register("modded:block", 5000)
+            ((output_palette, output_array),) = engine.convert_chunks(
+                self._source, self._destination, chunks
+            )
+            self.assertIsNot(engine._get_executor(), executor)
+            self._check_chunk(*chunks[0], output_palette, output_array)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+
+from PyMCTranslate.py3.util.mapped_atlas import MappedAtlas
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "build_tools"))
+from minify_json import write_atlas
+
+
+class MappedAtlasTest(unittest.TestCase):
+    def test_round_trip(self):
+        records = [
+            {"function": "new_block", "options": "minecraft:stone"},
+            [1, 2.5, None, True, "text"],
+            {"function": "new_properties", "options": {"ünïcode": '"value"'}},
+            {},
+            {"function": "new_block", "options": "minecraft:dirt"},
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "atlas.bin")
+            write_atlas(
+                path,
+                [
+                    json.dumps(record, separators=(",", ":")).encode("utf-8")
+                    for record in records
+                ],
+            )
+            atlas = MappedAtlas(path)
+            try:
+                self.assertEqual(len(atlas), len(records))
+                for index, record in enumerate(records):
+                    self.assertEqual(atlas[index], record)
+                # strings are shared between records
+                keys = [next(iter(atlas[index])) for index in (0, 2, 4)]
+                self.assertEqual(keys, ["function"] * 3)
+                self.assertIs(keys[0], keys[1])
+                self.assertIs(keys[0], keys[2])
+                self.assertIs(atlas[0]["function"], atlas[4]["function"])
+                with self.assertRaises(IndexError):
+                    atlas[len(records)]
+                atlas.clear_cache()
+                self.assertEqual(atlas[1], records[1])
+            finally:
+                atlas.close()
+
+    def test_invalid(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "atlas.bin")
+            with open(path, "wb") as f:
+                f.write(b"not an atlas file")
+            with self.assertRaises(ValueError):
+                MappedAtlas(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
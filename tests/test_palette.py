@@ -0,0 +1,129 @@
+import unittest
+
+import numpy
+from amulet_nbt import StringTag, IntTag, NamedTag, CompoundTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block, BlockEntity
+from PyMCTranslate.py3.api.version.translators import BlockNeighbourhood
+
+
+class PaletteTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_to_universal_palette(self):
+        version = self._translator.get_version("java", (1, 12, 2))
+        blocks = [
+            Block("minecraft", "stone", {"block_data": IntTag(0)}),
+            Block("minecraft", "stone", {"block_data": IntTag(1)}),
+            Block("minecraft", "stone", {"block_data": IntTag(0)}),
+        ]
+        palette, remap = version.block.to_universal_palette(blocks)
+        self.assertEqual(remap.dtype, numpy.int32)
+        self.assertEqual(len(remap), len(blocks))
+        self.assertEqual(remap[0], remap[2])
+        self.assertNotEqual(remap[0], remap[1])
+        for block, index in zip(blocks, remap):
+            self.assertEqual(version.block.to_universal(block), palette[index])
+
+    def test_from_universal_palette(self):
+        version = self._translator.get_version("java", (1, 20, 0))
+        blocks = [
+            Block("universal_minecraft", "stone"),
+            Block("universal_minecraft", "granite", {"polished": StringTag("false")}),
+            Block("universal_minecraft", "stone"),
+        ]
+        palette, remap = version.block.from_universal_palette(
+            blocks, force_blockstate=True
+        )
+        self.assertEqual(len(palette), 2)
+        for block, index in zip(blocks, remap):
+            self.assertEqual(
+                version.block.from_universal(block, force_blockstate=True),
+                palette[index],
+            )
+
+    def test_ints_to_palette(self):
+        version = self._translator.get_version("java", (1, 12, 2))
+        block_ids = numpy.array([[1, 1], [2, 1]])
+        block_data = numpy.array([[0, 3], [0, 0]])
+        palette, indexes = version.block.ints_to_palette(block_ids, block_data)
+        self.assertEqual(len(palette), 3)
+        self.assertEqual(indexes.shape, block_ids.shape)
+        for block_id, data, index in zip(
+            block_ids.ravel(), block_data.ravel(), indexes.ravel()
+        ):
+            self.assertEqual(
+                version.block.ints_to_block(block_id, data), palette[index]
+            )
+        palette_ids, palette_data = version.block.palette_to_ints(palette)
+        numpy.testing.assert_array_equal(palette_ids[indexes], block_ids)
+        numpy.testing.assert_array_equal(palette_data[indexes], block_data)
+
+    def test_neighbourhood(self):
+        version = self._translator.get_version("java", (1, 12, 2))
+        palette = [
+            Block("minecraft", "stone", {"block_data": IntTag(0)}),
+            Block("minecraft", "stone", {"block_data": IntTag(1)}),
+        ]
+        array = numpy.zeros((3, 3, 3), dtype=numpy.uint32)
+        array[1, 1, 1] = 1
+        neighbourhood = BlockNeighbourhood(palette, array, origin=(9, 9, 9), padding=1)
+        self.assertEqual(list(neighbourhood.locations()), [(10, 10, 10)])
+        translated = version.block.to_universal_neighbourhood(neighbourhood)
+        self.assertEqual(
+            translated, {(10, 10, 10): version.block.to_universal(palette[1])}
+        )
+
+    def test_shared(self):
+        version = self._translator.get_version("java", (1, 12, 2))
+        block = Block(
+            "universal_minecraft", "ender_chest", {"facing": StringTag("north")}
+        )
+        # seed the cache with a result that has a block entity
+        cached_block_entity = BlockEntity(
+            "minecraft",
+            "ender_chest",
+            0,
+            0,
+            0,
+            NamedTag(CompoundTag({"CustomName": StringTag("Name")})),
+        )
+        cached_block = Block("minecraft", "ender_chest", {"block_data": IntTag(2)})
+        version.block.get_cache("from_universal")[block] = (
+            cached_block,
+            cached_block_entity,
+            False,
+        )
+
+        # shared results are the cached instance
+        output, shared_block_entity, _ = version.block.from_universal(
+            block, shared=True
+        )
+        self.assertEqual(output, cached_block)
+        self.assertIs(shared_block_entity, cached_block_entity)
+        palette, _ = version.block.from_universal_palette([block], shared=True)
+        self.assertIs(palette[0][1], cached_block_entity)
+
+        # results that are not shared are copies
+        for copied_block_entity in (
+            version.block.from_universal(block)[1],
+            version.block.from_universal_palette([block])[0][0][1],
+            cached_block_entity.copy(),
+        ):
+            self.assertIsNot(copied_block_entity, cached_block_entity)
+            self.assertIsNot(copied_block_entity.nbt, cached_block_entity.nbt)
+            self.assertEqual(copied_block_entity.nbt.tag, cached_block_entity.nbt.tag)
+            # modifying the copy does not modify the cache
+            copied_block_entity.nbt.tag["CustomName"] = StringTag("Modified")
+            self.assertEqual(
+                version.block.from_universal(block, shared=True)[1].nbt.tag[
+                    "CustomName"
+                ],
+                StringTag("Name"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
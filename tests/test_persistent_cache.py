@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch
+import os
+import sqlite3
+import tempfile
+
+from amulet_nbt import IntTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block
+from PyMCTranslate.py3.meta import build_number
+
+
+class PersistentCacheTest(unittest.TestCase):
+    def test_shared_between_managers(self):
+        block = Block("minecraft", "stone", {"block_data": IntTag(1)})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "cache.sqlite")
+            translator = PyMCTranslate.new_translation_manager()
+            translator.enable_persistent_cache(path)
+            version = translator.get_version("java", (1, 12, 2))
+            expected = version.block.to_universal(block)
+            translator.disable_persistent_cache()
+
+            translator = PyMCTranslate.new_translation_manager()
+            translator.enable_persistent_cache(path)
+            version = translator.get_version("java", (1, 12, 2))
+            self.assertEqual(
+                translator.persistent_cache.get(
+                    "java_1_12_2", "to_universal", False, block
+                ),
+                expected,
+            )
+            self.assertEqual(version.block.to_universal(block), expected)
+            translator.disable_persistent_cache()
+
+    def test_other_builds_kept(self):
+        block = Block("minecraft", "stone", {"block_data": IntTag(1)})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "cache.sqlite")
+            translator = PyMCTranslate.new_translation_manager()
+            translator.enable_persistent_cache(path)
+            translator.persistent_cache.flush()
+            # a row written by an install of a different build
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    "INSERT INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        build_number + 1,
+                        "java_1_12_2",
+                        "to_universal",
+                        0,
+                        block.full_blockstate,
+                        "[]",
+                    ),
+                )
+            connection.close()
+            translator.disable_persistent_cache()
+
+            translator.enable_persistent_cache(path)
+            # rows from other builds are not read
+            self.assertIsNone(
+                translator.persistent_cache.get(
+                    "java_1_12_2", "to_universal", False, block
+                )
+            )
+            translator.disable_persistent_cache()
+            # or removed when the database is opened
+            connection = sqlite3.connect(path)
+            self.assertEqual(
+                connection.execute(
+                    "SELECT COUNT(*) FROM translations WHERE build_number = ?",
+                    (build_number + 1,),
+                ).fetchone()[0],
+                1,
+            )
+            connection.close()
+
+    def test_uncacheable_not_read(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            translator = PyMCTranslate.new_translation_manager()
+            translator.enable_persistent_cache(os.path.join(temp_dir, "cache.sqlite"))
+            version = translator.get_version("bedrock", (1, 20, 0))
+            chest = Block("universal_minecraft", "chest")
+            self.assertFalse(
+                version.block.get_capabilities(
+                    "from_universal", chest.namespace, chest.base_name
+                ).pure
+            )
+            with patch.object(
+                translator.persistent_cache,
+                "get",
+                wraps=translator.persistent_cache.get,
+            ) as get:
+                # the result of the chest depends on the block entity so it is never stored
+                version.block.from_universal(chest)
+                # blocks without a mapping are never stored
+                for _ in range(2):
+                    version.block.from_universal(Block("modded", "block"))
+                self.assertEqual(get.call_count, 0)
+
+                # cacheable blocks are read from the database once
+                stone = Block("universal_minecraft", "stone")
+                for _ in range(2):
+                    version.block.from_universal(stone)
+                self.assertEqual(get.call_count, 1)
+            translator.disable_persistent_cache()
+
+
+if __name__ == "__main__":
+    unittest.main()
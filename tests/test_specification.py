@@ -0,0 +1,56 @@
+import unittest
+
+from amulet_nbt import ByteTag, IntTag, StringTag, CompoundTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block
+
+
+class SpecificationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_parsed_defaults(self):
+        version = self._translator.get_version("bedrock", (1, 20, 0))
+        spec = version.block._get_parsed_specification("minecraft", "command_block")
+        # the parsed specification is reused
+        self.assertIs(
+            version.block._get_parsed_specification("minecraft", "command_block"),
+            spec,
+        )
+        self.assertEqual(
+            spec.default_properties,
+            {"conditional_bit": ByteTag(0), "facing_direction": IntTag(0)},
+        )
+        self.assertEqual(spec.valid_properties["facing_direction"][5], IntTag(5))
+        self.assertEqual(list(spec.nbt_identifier), ["", "CommandBlock"])
+        self.assertIsInstance(spec.default_nbt, CompoundTag)
+        self.assertEqual(spec.default_nbt["Command"], StringTag(""))
+        # the raw data is still available
+        self.assertEqual(spec["defaults"]["facing_direction"], "0")
+
+        stone = version.block._get_parsed_specification("minecraft", "stone")
+        self.assertIsNone(stone.default_nbt)
+        self.assertIsNone(stone.nbt_identifier)
+
+    def test_defaults_not_modified(self):
+        version = self._translator.get_version("bedrock", (1, 20, 0))
+        spec = version.block._get_parsed_specification("minecraft", "command_block")
+        default_properties = dict(spec.default_properties)
+        default_nbt = spec.default_nbt.to_snbt()
+
+        for _ in range(2):
+            output, block_entity, _ = version.block.from_universal(
+                Block("universal_minecraft", "command_block")
+            )
+            self.assertEqual(output.namespaced_name, "minecraft:command_block")
+            self.assertEqual(block_entity.nbt.tag["Command"], StringTag(""))
+            # the outputs are populated from the defaults but do not share them
+            block_entity.nbt.tag["Command"] = StringTag("say hi")
+
+        self.assertEqual(spec.default_properties, default_properties)
+        self.assertEqual(spec.default_nbt.to_snbt(), default_nbt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,306 @@
+import unittest
+import copy
+
+from amulet_nbt import NamedTag, CompoundTag, StringTag, ByteTag, IntTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block, BlockEntity, ChunkLoadError
+from PyMCTranslate.py3.api.version.translate import translate, compile_mapping
+from PyMCTranslate.py3.util.raw_text import section_string_to_raw_text
+
+
+def _comparable(result):
+    # block entities do not implement equality
+    output, extra_output, extra_needed, cacheable = result
+    if extra_output is not None:
+        extra_output = (
+            extra_output.namespaced_name,
+            extra_output.nbt.name,
+            extra_output.nbt.tag,
+        )
+    return output, extra_output, extra_needed, cacheable
+
+
+class TranslateTest(unittest.TestCase):
+    """Check that compiled mappings give the same result as the raw mapping they were compiled from."""
+
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+        self._universal = self._translator.get_version("universal", (1, 0, 0))
+
+    def _translate(self, mappings, block, **kwargs):
+        raw_mappings = copy.deepcopy(mappings)
+        compiled_mappings = compile_mapping(mappings)
+        results = []
+        for _ in range(2):
+            for mapping in (mappings, compiled_mappings):
+                results.append(
+                    translate(block, {}, mapping, self._universal, True, **kwargs)
+                )
+        for result in results[1:]:
+            self.assertEqual(_comparable(result), _comparable(results[0]))
+        # the raw mapping must not be modified
+        self.assertEqual(mappings, raw_mappings)
+        return results[0]
+
+    def test_multiblock(self):
+        mappings = [
+            {"function": "new_block", "options": "universal_minecraft:stone"},
+            {
+                "function": "multiblock",
+                "options": [
+                    {
+                        "coords": [0, 1, 0],
+                        "functions": [
+                            {
+                                "function": "map_block_name",
+                                "options": {
+                                    "minecraft:air": [
+                                        {
+                                            "function": "new_properties",
+                                            "options": {"above": '"air"'},
+                                        }
+                                    ]
+                                },
+                            }
+                        ],
+                    },
+                    {"coords": [0, -1, 0], "functions": []},
+                ],
+            },
+        ]
+        block = Block("minecraft", "stone")
+        locations = []
+
+        def get_block_callback(location):
+            locations.append(location)
+            if location == (0, -1, 0):
+                raise ChunkLoadError
+            return Block("minecraft", "air"), None
+
+        output, extra_output, extra_needed, cacheable = self._translate(
+            mappings, block, get_block_callback=get_block_callback
+        )
+        self.assertEqual(output.properties["above"], StringTag("air"))
+        self.assertIsNone(extra_output)
+        self.assertFalse(extra_needed)
+        self.assertFalse(cacheable)
+        self.assertEqual(set(locations), {(0, 1, 0), (0, -1, 0)})
+
+        # the callback is given relative coordinates when the location is known
+        locations.clear()
+        output = self._translate(
+            mappings,
+            block,
+            get_block_callback=get_block_callback,
+            block_location=(16, 64, 16),
+        )[0]
+        self.assertEqual(output.properties["above"], StringTag("air"))
+        self.assertEqual(set(locations), {(0, 1, 0), (0, -1, 0)})
+
+        output, _, extra_needed, cacheable = self._translate(mappings, block)
+        self.assertNotIn("above", output.properties)
+        self.assertTrue(extra_needed)
+        self.assertFalse(cacheable)
+
+    def test_properties(self):
+        # the SNBT keys are matched by value and type rather than by their text
+        mappings = [
+            {"function": "new_block", "options": "universal_minecraft:stone"},
+            {
+                "function": "map_properties",
+                "options": {
+                    "facing": {
+                        '"north"': [
+                            {
+                                "function": "new_properties",
+                                "options": {"direction": "2"},
+                            }
+                        ]
+                    },
+                    "bit": {
+                        "1B": [
+                            {"function": "new_properties", "options": {"mapped": "1b"}}
+                        ]
+                    },
+                },
+            },
+            {"function": "carry_properties", "options": {"level": ["0", "1s", "2"]}},
+        ]
+        output = self._translate(
+            mappings,
+            Block(
+                "minecraft",
+                "stone",
+                {"facing": StringTag("north"), "bit": ByteTag(1), "level": IntTag(2)},
+            ),
+        )[0]
+        self.assertEqual(
+            output.properties,
+            {"direction": IntTag(2), "mapped": ByteTag(1), "level": IntTag(2)},
+        )
+
+        # values of a different type do not match
+        output = self._translate(
+            mappings,
+            Block(
+                "minecraft",
+                "stone",
+                {"facing": StringTag("south"), "bit": IntTag(1), "level": IntTag(1)},
+            ),
+        )[0]
+        self.assertEqual(output.properties, {})
+
+    def test_nbt(self):
+        # walk_input_nbt, carry_nbt, map_nbt, new_nbt and code
+        utags = [["utags", "compound"]]
+        mappings = [
+            {"function": "new_block", "options": "universal_minecraft:command_block"},
+            {
+                "function": "walk_input_nbt",
+                "options": {
+                    "type": "compound",
+                    "keys": {
+                        "Command": {
+                            "type": "string",
+                            "functions": [
+                                {"function": "carry_nbt", "options": {"path": utags}}
+                            ],
+                        },
+                        "auto": {
+                            "type": "byte",
+                            "functions": [
+                                {
+                                    "function": "map_nbt",
+                                    "options": {
+                                        "cases": {
+                                            "1b": [
+                                                {
+                                                    "function": "new_properties",
+                                                    "options": {"mode": '"repeating"'},
+                                                },
+                                                {
+                                                    "function": "new_nbt",
+                                                    "options": {
+                                                        "path": utags,
+                                                        "key": "auto",
+                                                        "value": "1b",
+                                                    },
+                                                },
+                                            ]
+                                        },
+                                        "default": [
+                                            {
+                                                "function": "new_nbt",
+                                                "options": {
+                                                    "path": utags,
+                                                    "key": "auto",
+                                                    "value": "0b",
+                                                },
+                                            }
+                                        ],
+                                    },
+                                }
+                            ],
+                        },
+                    },
+                    "nested_default": [],
+                },
+            },
+            {
+                "function": "code",
+                "options": {
+                    "input": ["nbt"],
+                    "output": ["new_nbt"],
+                    "function": "bedrock_cmd_custom_name_2u",
+                },
+            },
+        ]
+        block = Block("minecraft", "command_block")
+
+        def command_block(auto: int) -> BlockEntity:
+            return BlockEntity(
+                "",
+                "CommandBlock",
+                0,
+                0,
+                0,
+                NamedTag(
+                    CompoundTag(
+                        {
+                            "Command": StringTag("say hi"),
+                            "CustomName": StringTag("§aName"),
+                            "auto": ByteTag(auto),
+                            "Other": StringTag("dropped"),
+                        }
+                    )
+                ),
+            )
+
+        for auto, mode in ((1, "repeating"), (0, "impulse")):
+            output, extra_output, extra_needed, cacheable = self._translate(
+                mappings,
+                block,
+                extra_input=command_block(auto),
+                pre_populate_defaults=False,
+            )
+            self.assertEqual(
+                output.namespaced_name, "universal_minecraft:command_block"
+            )
+            self.assertEqual(output.properties["mode"], StringTag(mode))
+            self.assertFalse(extra_needed)
+            self.assertFalse(cacheable)
+            self.assertEqual(
+                extra_output.nbt.tag,
+                CompoundTag(
+                    {
+                        "utags": CompoundTag(
+                            {
+                                "Command": StringTag("say hi"),
+                                "auto": ByteTag(auto),
+                                "CustomName": StringTag(
+                                    section_string_to_raw_text("§aName")
+                                ),
+                            }
+                        )
+                    }
+                ),
+            )
+
+        # without the block entity the nbt functions need more data
+        _, _, extra_needed, cacheable = self._translate(mappings, block)
+        self.assertTrue(extra_needed)
+        self.assertFalse(cacheable)
+
+    def test_version_mapping(self):
+        # the compiled mappings stored on the translator give the same result as the raw mapping
+        version = self._translator.get_version("bedrock", (1, 20, 0))
+        block = Block("minecraft", "command_block")
+        block_entity = BlockEntity(
+            "",
+            "CommandBlock",
+            0,
+            0,
+            0,
+            NamedTag(CompoundTag({"CustomName": StringTag("Name")})),
+        )
+        mappings = version.block.get_mapping_to_universal("minecraft", "command_block")
+        expected = translate(
+            block,
+            version.block.get_specification("minecraft", "command_block"),
+            mappings,
+            self._universal,
+            False,
+            extra_input=block_entity,
+        )
+        output, extra_output, extra_needed = version.block.to_universal(
+            block, block_entity
+        )
+        self.assertEqual(
+            _comparable((output, extra_output, extra_needed, False)),
+            _comparable(expected[:3] + (False,)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
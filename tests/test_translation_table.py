@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+import os
+import tempfile
+
+from amulet_nbt import StringTag
+
+import PyMCTranslate
+from PyMCTranslate.py3.api import Block
+from PyMCTranslate.py3.api.version.translators.translation_table import (
+    TranslationTable,
+    blockstates,
+)
+from PyMCTranslate.py3.api.version.translators.serialise import pack_translation
+from PyMCTranslate.py3.api.version.translators import block as block_module
+
+
+class TranslationTableTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._translator = PyMCTranslate.new_translation_manager()
+
+    def test_get(self):
+        # build a table the same way build_tools/translation_tables.py does
+        version = self._translator.get_version("java", (1, 20, 0))
+        format_key = version.block._format_key(False)
+        specification = version.block._get_shared_specification(
+            "minecraft", "oak_stairs"
+        )
+        states = list(blockstates(specification, "minecraft", "oak_stairs"))
+        self.assertGreater(len(states), 1)
+        palette = [
+            pack_translation(version.block.to_universal(block)) for block in states
+        ]
+        indexes = list(range(len(states)))
+        # a state that could not be cached
+        indexes[1] = -1
+        table = TranslationTable(
+            {
+                "palette": palette,
+                "to_universal": {format_key: {"minecraft": {"oak_stairs": indexes}}},
+                "from_universal": {},
+            }
+        )
+
+        for index in range(0, len(states), 7):
+            block = states[index]
+            # the property order does not matter
+            block = Block(
+                block.namespace,
+                block.base_name,
+                dict(reversed(list(block.properties.items()))),
+            )
+            self.assertEqual(
+                table.get("to_universal", format_key, block, specification),
+                version.block.to_universal(block),
+            )
+        self.assertIsNone(
+            table.get("to_universal", format_key, states[1], specification)
+        )
+
+        invalid = dict(states[0].properties)
+        invalid["facing"] = StringTag("invalid")
+        self.assertIsNone(
+            table.get(
+                "to_universal",
+                format_key,
+                Block("minecraft", "oak_stairs", invalid),
+                specification,
+            )
+        )
+        self.assertIsNone(
+            table.get(
+                "to_universal",
+                format_key,
+                Block("minecraft", "stone"),
+                version.block._get_shared_specification("minecraft", "stone"),
+            )
+        )
+        self.assertIsNone(
+            table.get("from_universal", format_key, states[0], specification)
+        )
+
+    def test_missing_tables(self):
+        # the tables are only built on request so translation must work without them
+        with tempfile.TemporaryDirectory() as temp_dir, patch.object(
+            block_module,
+            "translation_tables_dir",
+            os.path.join(temp_dir, "translation_tables"),
+        ):
+            version = self._translator.get_version("java", (1, 20, 0))
+            block = Block("minecraft", "oak_stairs", {"facing": StringTag("north")})
+            output = version.block.to_universal(block)[0]
+            self.assertIsNone(version.block._translation_table)
+            self.assertEqual(output.namespaced_name, "universal_minecraft:stairs")
+            self.assertIs(version.block.to_universal(block, shared=True)[0], output)
+
+
+if __name__ == "__main__":
+    unittest.main()
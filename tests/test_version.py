@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+import os
+
+import PyMCTranslate
+from PyMCTranslate.py3.api.version import version as version_module
+
+
+class VersionTest(unittest.TestCase):
+    def test_lazy_meta(self):
+        # start without any meta data loaded
+        with patch.dict(version_module._version_data, clear=True):
+            translator = PyMCTranslate.new_translation_manager()
+            # creating the translation manager only reads the __init__ data
+            self.assertEqual(version_module._version_data, {})
+            self.assertIsNone(translator._rotation_manger)
+
+            version = translator.get_version("java", (1, 12, 2))
+            self.assertEqual(version.platform, "java")
+            self.assertEqual(version.version_number, (1, 12, 2))
+            self.assertEqual(version.block_format, "numerical")
+            self.assertTrue(version.has_abstract_format)
+            self.assertEqual(version_module._version_data, {})
+
+            # the meta data is loaded when a translator is used
+            version.biome.to_universal("minecraft:plains")
+            self.assertEqual(
+                list(version_module._version_data), [version._version_path]
+            )
+
+            # the version index contains the same data as the meta data
+            index = version_module.load_version_index(
+                os.path.dirname(version._version_path)
+            )
+            self.assertEqual(
+                index[os.path.basename(version._version_path)],
+                version._meta["__init__"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()